@@ -1,5 +1,7 @@
 from crewai import Agent
 
+from app.utils.llm_registry import get_llm
+
 
 def create_analyst(user_id: str) -> Agent:
    
@@ -24,7 +26,7 @@ def create_analyst(user_id: str) -> Agent:
             "- 모든 평가에는 이력서 또는 JD에서의 구체적 근거를 반드시 포함합니다.\n"
             "- 매칭 점수는 사전 정의된 가중치 기준에 따라 일관성 있게 산출합니다."
         ),
-        llm="gpt-4o-mini",
+        llm=get_llm("analyst"),
         tools=[],
         verbose=True,
     )
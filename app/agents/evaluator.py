@@ -1,14 +1,30 @@
 from crewai import Agent
 
 from app.tools.rag_search import RAGSearchTool
+from app.utils.llm_registry import get_llm
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # Agent: 답변 평가자
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def create_evaluator(user_id: str) -> Agent:
-    rag_tool = RAGSearchTool(user_id=user_id)
+def create_evaluator(user_id: str = "", use_rag_tool: bool = True) -> Agent:
+    """use_rag_tool=False면 도구 없이, Task에 주입된 사전 검색 결과로 평가한다.
+
+    user_id를 비우면 검색 사용자는 요청 컨텍스트(current_search_user)에서 정해진다 (템플릿 Crew용).
+    """
+    if use_rag_tool:
+        tools = [RAGSearchTool(user_id=user_id)]
+        rag_principle = (
+            "- 반드시 RAGSearchTool을 호출하여 실제 노트 데이터를 기반으로 평가합니다. "
+            "임의로 노트 내용을 생성하지 않습니다."
+        )
+    else:
+        tools = []
+        rag_principle = (
+            "- Task에 제공된 학습 노트 검색 결과만을 근거로 평가합니다. "
+            "임의로 노트 내용을 생성하지 않습니다."
+        )
     return Agent(
         role="기술 면접 답변 평가 전문가 (Technical Interview Evaluator)",
         goal=(
@@ -22,17 +38,17 @@ def create_evaluator(user_id: str) -> Agent:
             "당신의 전문 역량:\n"
             "- 답변의 기술적 정확성을 검증하고, 잘못된 개념이나 부정확한 설명을 식별합니다.\n"
             "- 답변의 깊이를 평가하여 표면적 이해와 실무적 이해를 구분합니다.\n"
-            "- RAGSearchTool을 사용하여 사용자의 학습 노트를 검색하고, "
+            "- 사용자의 학습 노트 검색 결과를 바탕으로 "
             "답변과 학습 내용 간의 갭을 분석합니다.\n"
             "- 1-10점 스케일의 일관된 채점 기준으로 공정하게 점수를 부여합니다.\n\n"
             "당신의 평가 원칙:\n"
             "- 답변에 언급되지 않은 내용을 '틀렸다'고 판단하지 않습니다. '누락'과 '오답'을 구분합니다.\n"
             "- RAG 검색 결과가 없는 경우, 해당 주제는 '미학습'으로 분류합니다.\n"
             "- 피드백은 비판이 아닌 성장 방향을 제시하는 형태로 작성합니다.\n"
-            "- 반드시 RAGSearchTool을 호출하여 실제 노트 데이터를 기반으로 평가합니다. "
-            "임의로 노트 내용을 생성하지 않습니다."
+            + rag_principle
         ),
-        llm="gpt-4o-mini",
-        tools=[rag_tool],
+        llm=get_llm("evaluator"),
+        tools=tools,
+        cache=False,  # 템플릿 Crew는 사용자 간에 공유되므로 도구 결과를 캐시하지 않는다
         verbose=True,
     )
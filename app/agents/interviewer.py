@@ -1,7 +1,9 @@
 from crewai import Agent
 
+from app.utils.llm_registry import get_llm
 
-def create_interviewer() -> Agent:
+
+def create_interviewer(stream: bool = False) -> Agent:
     return Agent(
         role="기술 면접 진행자 (Interview Flow Controller)",
         goal=(
@@ -47,7 +49,7 @@ def create_interviewer() -> Agent:
             "반드시 다음 JSON 구조로만 응답합니다. JSON 외의 텍스트를 포함하지 않습니다:\n"
             '{"decision": "...", "message": "...", "nextQuestion": {...} | null}'
         ),
-        llm="gpt-4o",
+        llm=get_llm("interviewer", stream=stream),
         tools=[],
         verbose=True,
     )
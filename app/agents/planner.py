@@ -1,5 +1,7 @@
 from crewai import Agent
 
+from app.utils.llm_registry import get_llm
+
 
 def create_planner() -> Agent:
     return Agent(
@@ -60,7 +62,7 @@ def create_planner() -> Agent:
             "## 출력 형식\n"
             "반드시 JSON 형식으로만 응답합니다. JSON 외의 텍스트를 포함하지 않습니다."
         ),
-        llm="gpt-4o-mini",
+        llm=get_llm("planner"),
         allow_delegation=False,
         verbose=False,
     )
@@ -1,10 +1,13 @@
 from crewai import Agent
 
-from app.tools.rag_search import RAGSearchTool
+from app.tools.rag_search import MultiRAGSearchTool, RAGSearchTool
+from app.utils.llm_registry import get_llm
 
 
-def create_quiz_generator(user_id: str) -> Agent:
+def create_quiz_generator(user_id: str = "") -> Agent:
+    """user_id를 비우면 검색 사용자는 요청 컨텍스트(current_search_user)에서 정해진다 (템플릿 Crew용)."""
     rag_tool = RAGSearchTool(user_id=user_id)
+    multi_rag_tool = MultiRAGSearchTool(user_id=user_id)
     return Agent(
         role="기술 학습 퀴즈 출제 전문가 (Technical Quiz Generator)",
         goal=(
@@ -15,19 +18,21 @@ def create_quiz_generator(user_id: str) -> Agent:
         backstory=(
             "당신은 10년 경력의 기술 교육 전문가이자 문제 출제자입니다.\n\n"
             "당신의 전문 역량:\n"
-            "- RAGSearchTool로 사용자의 학습 노트를 검색하여 학습 범위를 파악합니다.\n"
+            "- rag_multi_search로 모든 태그의 학습 노트를 한 번에 검색하여 학습 범위를 파악하고, "
+            "보충이 필요할 때만 RAGSearchTool로 개별 검색합니다.\n"
             "- 노트에 기록된 내용을 기반으로 문제를 출제하되, 단순 복사가 아닌 "
             "이해도를 확인하는 형태로 변형합니다.\n"
             "- 오답 선택지를 그럴듯하게 설계하여 얕은 이해를 가려냅니다.\n"
             "- 해설에는 정답의 근거와 오답이 틀린 이유를 모두 포함합니다.\n\n"
             "당신의 출제 원칙:\n"
-            "- 반드시 RAGSearchTool을 호출하여 사용자의 노트를 검색한 후 출제합니다.\n"
+            "- 반드시 rag_multi_search(또는 RAGSearchTool)를 호출하여 사용자의 노트를 검색한 후 출제합니다.\n"
             "- 노트에 없는 내용으로 문제를 만들지 않습니다.\n"
             "- 각 문제는 독립적이며, 하나의 핵심 개념만 평가합니다.\n"
             "- 선택지 간 난이도 차이가 고르도록 설계합니다."
         ),
-        llm="gpt-4o-mini",
-        tools=[rag_tool],
+        llm=get_llm("quiz_generator"),
+        tools=[multi_rag_tool, rag_tool],
+        cache=False,  # 템플릿 Crew는 사용자 간에 공유되므로 도구 결과를 캐시하지 않는다
         allow_delegation=False,
         verbose=False,
     )
@@ -52,7 +57,7 @@ def create_quiz_evaluator() -> Agent:
             "- 오답이어도 비난하지 않고, 흔히 혼동되는 개념임을 인정합니다.\n"
             "- 학습 팁은 추상적이 아닌 구체적 행동 지침으로 제시합니다."
         ),
-        llm="gpt-4o-mini",
+        llm=get_llm("quiz_evaluator"),
         allow_delegation=False,
         verbose=False,
     )
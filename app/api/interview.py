@@ -1,8 +1,6 @@
 import json
-import re
-from fastapi import APIRouter, HTTPException
-from pydantic import ValidationError
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Header, HTTPException, Response
+from fastapi.responses import JSONResponse, StreamingResponse
 from app.schemas.interview import (
     PrepareRequest,
     EvaluateRequest,
@@ -12,152 +10,560 @@ from app.schemas.interview import (
     InterviewReportSchema,
     EvaluationResultSchema,
 )
-from app.crews.preparation_crew import create_preparation_crew
-from app.crews.interview_turn_crew import create_interview_turn_crew
-from app.crews.report_crew import create_report_crew
-from app.utils.crew_utils import (
-    parse_crew_output,
-    parse_crew_output_from_task,
-    format_conversation_log,
-    format_transcript,
-    extract_keywords,
+from app.schemas.session import SessionEvaluateRequest, SessionReportRequest
+from app.crews.preparation_crew import (
+    JD_TEMPLATE,
+    RESUME_TEMPLATE,
+    create_jd_analysis_crew,
+    create_profile_crew,
+    create_rag_crew,
+    create_resume_analysis_crew,
+    create_scenario_crew,
+)
+from app.crews.interview_turn_crew import (
+    DECISION_CREWS,
+    EVALUATION_CREWS,
+    TURN_CREWS,
+    decision_inputs,
+    evaluation_inputs,
+)
+from app.crews.report_crew import REPORT_CREWS
+from app.utils.crew_utils import extract_keywords
+from app.config import settings
+from app.tools.rag_search import current_search_user, prefetch_notes
+from app.utils.conversation_memory import build_conversation_log, schedule_summary_update
+from app.utils.answer_stream import format_sse, stream_answer_tokens
+from app.utils.analysis_cache import analysis_cache, analysis_cache_key
+from app.utils.decision_engine import INTERVIEW_DECISIONS, decide_turn
+from app.utils.executor import crew_executor
+from app.utils.keyword_extractor import extract_keyword_list
+from app.utils.llm_hedging import bind_hedge_session, timed_turn
+from app.utils.output_decoder import OutputDecodeError, OutputValidationError, decode_output
+from app.utils.crew_instrumentation import crew_run, kickoff_crew
+from app.utils.rate_limiter import admit_request
+from app.utils.report_aggregator import aggregate_turns, build_digest, compact_transcript, minify
+from app.utils.single_flight import request_key, single_flight
+from app.utils.scenario_cache import scenario_cache, scenario_cache_key
+from app.utils.task_dag import DagNode, run_dag
+from app.utils.session_store import (
+    InterviewSession,
+    SessionConflictError,
+    SessionNotFoundError,
+    session_store,
 )
 
 router = APIRouter(prefix="/ai/interview", tags=["interview"])
 
 
+def _analysis_stage(kind: str, template, create_crew, user_id: str, stage_inputs: dict):
+    """이력서/JD 분석 단계: 내용이 같으면 이전 결과를 재사용하고 Crew를 실행하지 않는다."""
+    text = next(iter(stage_inputs.values()))
+
+    def run(_deps: dict) -> str:
+        key = None
+        if settings.PREP_ANALYSIS_CACHE_ENABLED:
+            key = analysis_cache_key(kind, template.prefix, text)
+            cached = analysis_cache.get(key)
+            if cached is not None:
+                return cached
+        result = kickoff_crew(f"interview.prepare.{kind}", create_crew(user_id), inputs=stage_inputs)
+        if key is not None:
+            analysis_cache.set(key, result.raw)
+        return result.raw
+
+    return run
+
+
+def _run_prepare(request: PrepareRequest, use_cache: bool = True) -> InterviewScenarioSchema:
+    cache_key = None
+    if use_cache and settings.SCENARIO_CACHE_ENABLED:
+        cache_key = scenario_cache_key(
+            user_id=request.user_id,
+            resume_text=request.resume_text,
+            jd_text=request.jd_text,
+            question_count=request.question_count,
+            difficulty=request.difficulty.value,
+        )
+    if cache_key is not None:
+        cached = scenario_cache.get(cache_key, InterviewScenarioSchema)
+        if cached is not None:
+            return cached
+
+    jd_keywords = extract_keywords(request.jd_text)
+
+    # 사전 검색: 검색을 먼저 시작해두고 A/B 분석과 병렬로 진행
+    prefetch = (
+        prefetch_notes(request.user_id, extract_keyword_list(request.jd_text))
+        if settings.RAG_PREFETCH
+        else None
+    )
+
+    def run_rag(_deps: dict) -> str:
+        stage_inputs = {"jd_keywords": jd_keywords}
+        if prefetch is not None:
+            stage_inputs["prefetched_notes"] = prefetch.result()
+        crew = create_rag_crew(request.user_id, use_prefetched_notes=prefetch is not None)
+        return kickoff_crew("interview.prepare.rag", crew, inputs=stage_inputs).raw
+
+    def run_profile(deps: dict) -> str:
+        crew = create_profile_crew(request.user_id)
+        return kickoff_crew("interview.prepare.profile", crew, inputs={
+            "resume_analysis": deps["resume"],
+            "jd_analysis": deps["jd"],
+            "rag_notes": deps["rag"],
+        }).raw
+
+    def run_scenario(deps: dict) -> InterviewScenarioSchema:
+        result = kickoff_crew("interview.prepare.scenario", create_scenario_crew(), inputs={
+            "candidate_profile": deps["profile"],
+            "question_count": request.question_count,
+            "difficulty": request.difficulty.value,
+        })
+        return decode_output(result, InterviewScenarioSchema)
+
+    timeouts = settings.PREP_TASK_TIMEOUTS
+    retries = settings.PREP_TASK_RETRIES
+    # A/B/C 동시 실행 → D → E. RAG(C)가 실패해도 노트 없이 시나리오를 만든다.
+    nodes = [
+        DagNode("resume", _analysis_stage(
+            "resume", RESUME_TEMPLATE, create_resume_analysis_crew, request.user_id,
+            {"resume_text": request.resume_text},
+        ), timeout=timeouts.get("resume"), retries=retries),
+        DagNode("jd", _analysis_stage(
+            "jd", JD_TEMPLATE, create_jd_analysis_crew, request.user_id,
+            {"jd_text": request.jd_text},
+        ), timeout=timeouts.get("jd"), retries=retries),
+        DagNode(
+            "rag", run_rag, timeout=timeouts.get("rag"), retries=retries,
+            critical=False, fallback="검색 결과 없음 (노트 검색 실패)",
+        ),
+        DagNode(
+            "profile", run_profile, deps=("resume", "jd", "rag"),
+            timeout=timeouts.get("profile"), retries=retries,
+        ),
+        DagNode(
+            "scenario", run_scenario, deps=("profile",),
+            timeout=timeouts.get("scenario"), retries=retries,
+        ),
+    ]
+    scenario = run_dag(
+        "interview.prepare", nodes, max_concurrency=settings.PREP_DAG_CONCURRENCY
+    ).results["scenario"]
+    if cache_key is not None:
+        scenario_cache.set(cache_key, scenario)
+    return scenario
+
+
 @router.post("/prepare", response_model=InterviewScenarioSchema, response_class=JSONResponse)
-async def prepare_interview(request: PrepareRequest) -> InterviewScenarioSchema:
-    """Phase 1: 이력서 + JD + RAG → 질문 시나리오 생성."""
+async def prepare_interview(
+    request: PrepareRequest,
+    response: Response,
+    x_cache_bypass: bool = Header(default=False),
+) -> InterviewScenarioSchema:
+    """Phase 1: 이력서 + JD + RAG → 질문 시나리오 생성.
+
+    생성된 시나리오는 세션 저장소에 보관하고 서버에서 생성한 세션 ID를 X-Session-Id 헤더로 반환한다.
+    같은 입력의 시나리오는 캐시에서 바로 반환하며, X-Cache-Bypass: true이면 새로 생성한다.
+    """
     try:
-        crew, task_e = create_preparation_crew(user_id=request.user_id)
-        crew.kickoff(
-            inputs={
-                "resume_text": request.resume_text,
-                "jd_text": request.jd_text,
-                "jd_keywords": extract_keywords(request.jd_text),
-                "question_count": request.question_count,
-                "difficulty": request.difficulty.value,
-            }
+        admit_request("interview.prepare", request.user_id)
+        # 같은 입력의 준비 요청이 진행 중이면 그 결과를 함께 기다린다
+        scenario = await single_flight.run(
+            "interview.prepare",
+            request_key(request, x_cache_bypass),
+            lambda: crew_executor.run(
+                "interview.prepare", _run_prepare, request, not x_cache_bypass
+            ),
         )
-        
-        # task_e는 crew.kickoff() 실행 후 output이 채워짐
-        scenario_schema = parse_scenario_output(task_e)
-
-        return scenario_schema
-    
-    except json.JSONDecodeError as e:
-        raise HTTPException(status_code=500, detail=f"LLM 응답 JSON 파싱 실패: {str(e)}")
-    except ValidationError as e:
+        session = session_store.create(
+            user_id=request.user_id,
+            scenario=scenario.model_dump(by_alias=True),
+        )
+        response.headers["X-Session-Id"] = session.session_id
+        return scenario
+    except HTTPException:
+        raise
+    except OutputValidationError as e:
         raise HTTPException(status_code=500, detail=f"스키마 검증 실패: {str(e)}")
+    except OutputDecodeError as e:
+        raise HTTPException(status_code=500, detail=f"LLM 응답 JSON 파싱 실패: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"면접 준비 실패: {str(e)}")
 
-def parse_scenario_output(task_e) -> InterviewScenarioSchema:
-    # 1순위
-    if task_e.output.pydantic:
-        return task_e.output.pydantic
+def _resolve_turn(request: EvaluateRequest) -> dict:
+    """요청과 시나리오에서 이번 턴의 평가 대상 질문/기준/남은 질문 수를 추출."""
+    # ★ 변경: 시나리오에서 현재 질문의 전체 정보를 추출
+    questions = request.question_scenario.get("questions", [])
+    matched_question = next(
+        (q for q in questions if q.get("id") == request.question_id),
+        None,
+    )
+
+    # current_question에 eval_task가 참조하는 모든 필드 포함
+    current_question = {
+        "id": request.question_id,
+        "text": request.question_text,
+        "skillTarget": (
+            matched_question.get("skillTarget", matched_question.get("skill_target", ""))
+            if matched_question else request.skill_target
+        ),
+        "difficulty": (
+            matched_question.get("difficulty", "")
+            if matched_question else request.difficulty
+        ),
+    }
+
+    # evaluation_criteria도 시나리오에서 추출
+    evaluation_criteria = (
+        matched_question.get("evaluationCriteria",
+            matched_question.get("evaluation_criteria", []))
+        if matched_question else []
+    )
+
+    # 남은 질문 수 계산
+    total = request.question_scenario.get(
+        "totalQuestions",
+        request.question_scenario.get("total_questions", 0),
+    )
+    answered_count = len(request.turn_history)
+    remaining_count = max(0, total - answered_count)
+
+    # 클라이언트가 보낸 session_id는 확인되지 않으므로 누적 요약을 저장/사용하지 않는다
+    conversation_log = build_conversation_log(None, request.turn_history)
+
+    return {
+        "user_id": request.session_id,
+        "question_id": request.question_id,
+        "answer": request.answer,
+        "follow_up_count": request.follow_up_count,
+        "scenario": request.question_scenario,
+        "current_question": current_question,
+        "evaluation_criteria": evaluation_criteria,
+        "remaining_count": remaining_count,
+        "conversation_log": conversation_log,
+    }
+
+
+def _session_turn(session: InterviewSession, answer: str) -> dict:
+    """세션에 저장된 시나리오/턴 기록으로 이번 턴의 컨텍스트를 구성 (선형 탐색 없음)."""
+    question = session.current_question or {}
+    main_question = session.main_question(session.current_question_id) or {}
+    return {
+        "user_id": session.user_id,
+        "question_id": session.current_question_id,
+        "answer": answer,
+        "follow_up_count": session.follow_up_count,
+        "scenario": session.scenario_for_prompt(),
+        "current_question": {
+            "id": session.current_question_id,
+            "text": question.get("text", ""),
+            "skillTarget": question.get("skillTarget") or main_question.get("skillTarget", ""),
+            "difficulty": question.get("difficulty") or main_question.get("difficulty", ""),
+        },
+        "evaluation_criteria": (
+            question.get("evaluationCriteria") or main_question.get("evaluationCriteria", [])
+        ),
+        "remaining_count": session.remaining_main_questions(),
+        "conversation_log": build_conversation_log(session.session_id, session.turns),
+    }
+
+
+def _start_prefetch(turn: dict):
+    # 사전 검색: 평가 대상 기술은 이미 알고 있으므로 크루 구성과 병렬로 검색 시작
+    skill_target = turn["current_question"].get("skillTarget")
+    if settings.RAG_PREFETCH and skill_target:
+        return prefetch_notes(turn["user_id"], [skill_target])
+    return None
+
+
+def _decision_payload(decision: InterviewDecisionSchema) -> dict:
+    """면접관 LLM의 결정을 규칙 엔진과 같은 dict 형식으로 변환."""
+    INTERVIEW_DECISIONS.inc(source="llm", decision=decision.decision.value)
+    next_q = None
+    if decision.next_question:
+        next_q = decision.next_question.model_dump(by_alias=True)
+    return {
+        "decision": decision.decision.value,
+        "message": decision.message,
+        "nextQuestion": next_q,
+    }
+
+
+def _evaluation_inputs(turn: dict, prefetch) -> dict:
+    return evaluation_inputs(
+        current_question=turn["current_question"],
+        user_answer=turn["answer"],
+        conversation_log=turn["conversation_log"],
+        evaluation_criteria=turn["evaluation_criteria"],
+        prefetched_notes=prefetch.result() if prefetch is not None else None,
+    )
+
+
+def _decision_inputs(turn: dict, evaluation_result: str | None = None) -> dict:
+    return decision_inputs(
+        current_question=turn["current_question"],
+        follow_up_count=turn["follow_up_count"],
+        remaining_count=turn["remaining_count"],
+        scenario=turn["scenario"],
+        evaluation_result=evaluation_result,
+    )
+
+
+def _run_evaluation_stage(turn: dict, prefetch):
+    """평가 Task만 실행하고 (평가 Task 원문 출력, 평가 결과)를 반환."""
+    with EVALUATION_CREWS[prefetch is not None].checkout() as crew:
+        result = kickoff_crew(
+            "interview.evaluate", crew, inputs=_evaluation_inputs(turn, prefetch)
+        )
+    eval_output = result.tasks_output[0]
+    return eval_output.raw, decode_output(eval_output, EvaluationResultSchema)
+
+
+def _decide_by_rule(turn: dict, score: int) -> dict | None:
+    if not settings.INTERVIEW_FAST_PATH:
+        return None
+    return decide_turn(
+        score=score,
+        question_id=turn["question_id"],
+        follow_up_count=turn["follow_up_count"],
+        remaining_count=turn["remaining_count"],
+        scenario=turn["scenario"],
+    )
+
+
+def _run_turn(turn: dict) -> dict:
+    """답변 평가 + 다음 액션 결정. {"evaluation": {...}, "decision": {...}}를 반환."""
+    with timed_turn():
+        return _run_turn_stages(turn)
+
+
+def _run_turn_stages(turn: dict) -> dict:
+    current_search_user.set(turn["user_id"])
+    prefetch = _start_prefetch(turn)
+
+    if not settings.INTERVIEW_FAST_PATH:
+        # 평가 + 결정을 하나의 Crew로 실행
+        with TURN_CREWS[prefetch is not None].checkout() as crew:
+            result = kickoff_crew("interview.turn", crew, inputs={
+                **_evaluation_inputs(turn, prefetch),
+                **_decision_inputs(turn),
+            })
+        eval_result = decode_output(
+            result.tasks_output[0], EvaluationResultSchema
+        )
+        decision = _decision_payload(decode_output(result, InterviewDecisionSchema))
+    else:
+        # 평가 후 규칙으로 결정 가능한 턴은 면접관 LLM을 호출하지 않는다
+        eval_output, eval_result = _run_evaluation_stage(turn, prefetch)
+        decision = _decide_by_rule(turn, eval_result.score)
+        if decision is None:
+            with DECISION_CREWS[False].checkout() as crew:
+                result = kickoff_crew(
+                    "interview.decision", crew, inputs=_decision_inputs(turn, eval_output)
+                )
+            decision = _decision_payload(decode_output(result, InterviewDecisionSchema))
+
+    return {
+        "evaluation": eval_result.model_dump(),
+        "decision": decision,
+    }
 
-    # 2순위
-    if task_e.output.json_dict:
-        return InterviewScenarioSchema(**task_e.output.json_dict)
 
-    # 3순위: raw 문자열 파싱
-    raw = task_e.output.raw
-    raw = re.sub(r"```json\s*", "", raw)
-    raw = re.sub(r"```\s*", "", raw)
-    raw = raw.strip()
+def _evaluate_response(outcome: dict) -> dict:
+    return {
+        "score": outcome["evaluation"]["score"],
+        "feedback": outcome["evaluation"]["feedback"],
+        "decision": outcome["decision"]["decision"],
+        "nextQuestion": outcome["decision"]["nextQuestion"],
+    }
+
+
+def _run_evaluate(request: EvaluateRequest) -> dict:
+    return _evaluate_response(_run_turn(_resolve_turn(request)))
 
-    data = json.loads(raw)
-    return InterviewScenarioSchema(**data)
 
 @router.post("/evaluate")
 async def evaluate_answer(request: EvaluateRequest):
     """Phase 2: 답변 평가 + 다음 질문 결정."""
     try:
-        conversation_log_str = format_conversation_log(request.turn_history)
+        admit_request("interview.evaluate", request.session_id)
+        bind_hedge_session(request.session_id)
+        return await crew_executor.run("interview.evaluate", _run_evaluate, request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"답변 평가 실패: {str(e)}")
 
-        # ★ 변경: 시나리오에서 현재 질문의 전체 정보를 추출
-        questions = request.question_scenario.get("questions", [])
-        matched_question = next(
-            (q for q in questions if q.get("id") == request.question_id),
-            None,
-        )
 
-        # current_question에 eval_task가 참조하는 모든 필드 포함
-        current_question = {
-            "id": request.question_id,
-            "text": request.question_text,
-            "skillTarget": (
-                matched_question.get("skillTarget", matched_question.get("skill_target", ""))
-                if matched_question else request.skill_target
-            ),
-            "difficulty": (
-                matched_question.get("difficulty", "")
-                if matched_question else request.difficulty
-            ),
-        }
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 스트리밍 평가 (SSE)
+#   event: evaluation → 평가 완료 즉시 점수/피드백
+#   event: token      → 면접관 응답 토큰
+#   event: decision   → 파싱된 최종 결정 + 다음 질문
+#   event: done / error
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-        # evaluation_criteria도 시나리오에서 추출
-        evaluation_criteria = (
-            matched_question.get("evaluationCriteria",
-                matched_question.get("evaluation_criteria", []))
-            if matched_question else []
-        )
+def _run_evaluate_stream(emit, request: EvaluateRequest) -> None:
+    with timed_turn():
+        _stream_turn(emit, _resolve_turn(request))
 
-        # 남은 질문 수 계산
-        total = request.question_scenario.get(
-            "totalQuestions",
-            request.question_scenario.get("total_questions", 0),
-        )
-        answered_count = len(request.turn_history)
-        remaining_count = max(0, total - answered_count)
-
-        crew = create_interview_turn_crew(
-            user_id=request.session_id,
-            current_question=current_question,
-            user_answer=request.answer,
-            follow_up_count=request.follow_up_count,
-            remaining_count=remaining_count,
-            conversation_log=conversation_log_str,
-            evaluation_criteria=evaluation_criteria,
-            scenario=request.question_scenario,
-        )
-        result = crew.kickoff()
 
-        eval_result = parse_crew_output_from_task(
-            result.tasks_output[0], EvaluationResultSchema
-        )
-        decision = parse_crew_output(result, InterviewDecisionSchema)
-
-        next_q = None
-        if decision.next_question:
-            next_q = decision.next_question.model_dump(by_alias=True)
-
-        return {
-            "score": eval_result.score,
-            "feedback": eval_result.feedback,
-            "decision": decision.decision.value,
-            "nextQuestion": next_q,
-        }
+def _stream_turn(emit, turn: dict) -> None:
+    current_search_user.set(turn["user_id"])
+    prefetch = _start_prefetch(turn)
+
+    # 1단계: 평가만 먼저 실행하고 결과를 바로 내보낸다
+    eval_output, eval_result = _run_evaluation_stage(turn, prefetch)
+    emit("evaluation", {"score": eval_result.score, "feedback": eval_result.feedback})
+
+    decision = _decide_by_rule(turn, eval_result.score)
+    if decision is not None:
+        emit("decision", decision)
+        return
+
+    # 2단계: 평가 결과를 입력으로 면접관 응답을 토큰 단위로 스트리밍
+    with crew_run("interview.decision"), DECISION_CREWS[True].checkout() as crew:
+        streaming = crew.kickoff(inputs=_decision_inputs(turn, eval_output))
+        result = stream_answer_tokens(emit, streaming)
+
+    emit("decision", _decision_payload(decode_output(result, InterviewDecisionSchema)))
+
+
+@router.post("/evaluate/stream")
+async def evaluate_answer_stream(request: EvaluateRequest):
+    """Phase 2 (SSE): 평가 결과를 먼저 보내고 면접관 응답을 토큰 단위로 스트리밍."""
+    admit_request("interview.evaluate", request.session_id)
+    bind_hedge_session(request.session_id)
+    events = crew_executor.stream("interview.evaluate", _run_evaluate_stream, request)
+
+    # 토큰 한도(429) / 대기열 초과(503)는 스트림을 열기 전에 일반 HTTP 오류로 응답
+    try:
+        first = await anext(events)
+    except StopAsyncIteration:
+        first = None
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"답변 평가 실패: {str(e)}")
 
+    async def event_source():
+        try:
+            if first is not None:
+                yield format_sse(*first)
+            async for event, data in events:
+                yield format_sse(event, data)
+            yield format_sse("done", {})
+        except Exception as e:
+            yield format_sse("error", {"detail": f"답변 평가 실패: {str(e)}"})
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _run_report_crew(
+    turns: list[dict], scenario: dict, aggregate: dict | None = None
+) -> InterviewReportSchema:
+    # 전체 로그 대신 사전 집계 digest + 축약 transcript를 최소화 JSON으로 전달
+    if aggregate is None:
+        aggregate = aggregate_turns(turns)
+    with REPORT_CREWS.checkout() as crew:
+        result = kickoff_crew(
+            "interview.report",
+            crew,
+            inputs={
+                "transcript": compact_transcript(turns),
+                "digest": minify(build_digest(aggregate)),
+                "jd_text": minify(scenario),
+            },
+        )
+
+    return decode_output(result, InterviewReportSchema)
+
+
+def _run_report(request: ReportRequest) -> InterviewReportSchema:
+    return _run_report_crew(request.turns, request.question_scenario)
+
 
 @router.post("/report", response_model=InterviewReportSchema, response_class=JSONResponse)
 async def generate_report(request: ReportRequest) -> InterviewReportSchema:
     """Phase 3: 전체 면접 로그 → 종합 리포트."""
     try:
-        crew = create_report_crew()
-        result = crew.kickoff(
-            inputs={
-                "transcript": format_transcript(request.turns),
-                "all_evaluations": json.dumps(request.turns, ensure_ascii=False, indent=2),
-                "jd_text": json.dumps(request.question_scenario, ensure_ascii=False),
-            }
+        admit_request("interview.report")
+        return await single_flight.run(
+            "interview.report",
+            request_key(request),
+            lambda: crew_executor.run("interview.report", _run_report, request),
         )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"리포트 생성 실패: {str(e)}")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 세션 기반 API: /prepare가 저장한 시나리오와 턴 기록을 서버에서 사용하므로
+# 클라이언트는 session_id와 새 답변만 보낸다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _get_session(session_id: str, user_id: str) -> InterviewSession:
+    """세션을 조회한다. 다른 사용자의 세션은 존재 여부를 드러내지 않도록 404로 응답한다."""
+    try:
+        return session_store.get(session_id, user_id=user_id)
+    except SessionNotFoundError:
+        raise HTTPException(status_code=404, detail=f"면접 세션을 찾을 수 없습니다: {session_id}")
+
+
+@router.post("/session/evaluate")
+async def evaluate_session_answer(request: SessionEvaluateRequest):
+    """Phase 2 (세션): 현재 질문에 대한 답변 평가 + 다음 질문 결정."""
+    session = _get_session(request.session_id, request.user_id)
+    if session.finished:
+        raise HTTPException(status_code=409, detail="이미 종료된 면접 세션입니다.")
 
-        report = parse_crew_output(result, InterviewReportSchema)
-        return report
+    turn_count = len(session.turns)
+    try:
+        admit_request("interview.evaluate", session.user_id)
+        bind_hedge_session(session.session_id)
+        outcome = await crew_executor.run(
+            "interview.evaluate", _run_turn, _session_turn(session, request.answer)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"답변 평가 실패: {str(e)}")
+
+    try:
+        session_store.record_turn(
+            session, turn_count, request.answer, outcome["evaluation"], outcome["decision"]
+        )
+    except SessionConflictError:
+        raise HTTPException(status_code=409, detail="같은 세션의 다른 답변이 먼저 처리되었습니다.")
+    schedule_summary_update(session.session_id, session.user_id, session.turns)
+    return _evaluate_response(outcome)
+
+
+@router.post("/session/report", response_model=InterviewReportSchema, response_class=JSONResponse)
+async def generate_session_report(request: SessionReportRequest) -> InterviewReportSchema:
+    """Phase 3 (세션): 저장된 턴 기록 → 종합 리포트."""
+    session = _get_session(request.session_id, request.user_id)
+    try:
+        admit_request("interview.report", session.user_id)
+        # 턴 수가 같으면 같은 기록이므로 하나의 리포트 생성에 합류
+        return await single_flight.run(
+            "interview.report",
+            request_key("session", session.session_id, len(session.turns)),
+            lambda: crew_executor.run(
+                "interview.report",
+                _run_report_crew,
+                session.turns,
+                session.scenario_for_prompt(),
+                session.aggregate,
+            ),
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"리포트 생성 실패: {str(e)}")
@@ -2,6 +2,9 @@ from fastapi import APIRouter, HTTPException
 
 from app.schemas.knowledge import EmbedRequest
 from app.services.embedding_service import embed_and_store
+from app.tools.rag_cache import bump_notes_version
+from app.utils.executor import crew_executor
+from app.utils.rate_limiter import admit_request
 
 router = APIRouter(prefix="/ai/knowledge", tags=["knowledge"])
 
@@ -10,7 +13,12 @@ router = APIRouter(prefix="/ai/knowledge", tags=["knowledge"])
 async def embed_knowledge(request: EmbedRequest):
     """MD 파일 텍스트 → 임베딩 저장."""
     try:
-        result = embed_and_store(request)
+        admit_request("knowledge.embed", request.user_id)
+        result = await crew_executor.run("knowledge.embed", embed_and_store, request)
+        # 새 노트가 반영되었으므로 해당 사용자의 RAG 결과 캐시 무효화
+        bump_notes_version(request.user_id)
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"임베딩 저장 실패: {str(e)}")
@@ -7,41 +7,72 @@ from app.schemas.quiz import (
     QuizGenerateSchema,
     QuizEvaluateSchema,
 )
-from app.crews.quiz_crew import create_quiz_generate_crew, create_quiz_evaluate_crew
-from app.utils.crew_utils import parse_crew_output
+from app.crews.quiz_crew import (
+    EVALUATE_CREWS,
+    GENERATE_CREWS,
+    quiz_evaluate_inputs,
+    quiz_generate_inputs,
+)
+from app.tools.rag_search import current_search_user
+from app.utils.output_decoder import decode_output
+from app.utils.executor import crew_executor
+from app.utils.single_flight import request_key, single_flight
+from app.utils.crew_instrumentation import kickoff_crew
+from app.utils.rate_limiter import admit_request
 
 router = APIRouter(prefix="/ai/quiz", tags=["quiz"])
 
 
+def _run_generate(request: QuizGenerateRequest) -> QuizGenerateSchema:
+    current_search_user.set(request.user_id)
+    inputs = quiz_generate_inputs(
+        user_id=request.user_id,
+        tags=request.tags,
+        difficulty=request.difficulty.value,
+        count=request.count,
+    )
+    with GENERATE_CREWS.checkout() as crew:
+        result = kickoff_crew("quiz.generate", crew, inputs=inputs)
+
+    return decode_output(result, QuizGenerateSchema)
+
+
 @router.post("/generate", response_model=QuizGenerateSchema, response_class=JSONResponse)
 async def generate_quiz(request: QuizGenerateRequest) -> QuizGenerateSchema:
     """태그/난이도 기반 퀴즈 문제 생성."""
     try:
-        crew = create_quiz_generate_crew(
-            user_id=request.user_id,
-            tags=request.tags,
-            difficulty=request.difficulty.value,
-            count=request.count,
+        admit_request("quiz.generate", request.user_id)
+        return await single_flight.run(
+            "quiz.generate",
+            request_key(request),
+            lambda: crew_executor.run("quiz.generate", _run_generate, request),
         )
-        result = crew.kickoff()
-
-        return parse_crew_output(result, QuizGenerateSchema)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"퀴즈 생성 실패: {str(e)}")
 
 
+def _run_evaluate(request: QuizEvaluateRequest) -> QuizEvaluateSchema:
+    inputs = quiz_evaluate_inputs(
+        question_text=request.question_text,
+        answer=request.answer,
+        quiz_attempt_id=request.quiz_attempt_id,
+        knowledge_note_id=request.knowledge_note_id,
+    )
+    with EVALUATE_CREWS.checkout() as crew:
+        result = kickoff_crew("quiz.evaluate", crew, inputs=inputs)
+
+    return decode_output(result, QuizEvaluateSchema)
+
+
 @router.post("/evaluate", response_model=QuizEvaluateSchema, response_class=JSONResponse)
 async def evaluate_quiz(request: QuizEvaluateRequest) -> QuizEvaluateSchema:
     """퀴즈 답변 채점 + 피드백."""
     try:
-        crew = create_quiz_evaluate_crew(
-            question_text=request.question_text,
-            answer=request.answer,
-            quiz_attempt_id=request.quiz_attempt_id,
-            knowledge_note_id=request.knowledge_note_id,
-        )
-        result = crew.kickoff()
-
-        return parse_crew_output(result, QuizEvaluateSchema)
+        admit_request("quiz.evaluate")
+        return await crew_executor.run("quiz.evaluate", _run_evaluate, request)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"퀴즈 채점 실패: {str(e)}")
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 
 from app.schemas.resume import ResumeParseRequest, ResumeParseResponse
 from app.services.resume_service import parse_resume
+from app.utils.executor import crew_executor
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,8 +13,10 @@ router = APIRouter(prefix="/ai/resume", tags=["resume"])
 async def parse_resume_endpoint(request: ResumeParseRequest):
     """PDF 파일에서 텍스트를 추출하고 LLM으로 정제한다."""
     try:
-        parsed_text = parse_resume(request.filePath)
+        parsed_text = await crew_executor.run("resume.parse", parse_resume, request.filePath)
         return ResumeParseResponse(parsedText=parsed_text)
+    except HTTPException:
+        raise
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except ValueError as e:
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic import computed_field
 from crewai import LLM
@@ -13,6 +15,32 @@ class Settings(BaseSettings):
     # LLM
     LLM_MODEL: str = "openai/gpt-4o-mini"
     LLM_TEMPERATURE: float = 0.3
+    LLM_TIMEOUT: float = 60.0
+    LLM_MAX_RETRIES: int = 2
+    # 에이전트 역할별 라우팅 (model/temperature/timeout/max_tokens, 생략 시 위 기본값)
+    LLM_ROUTES: dict[str, dict[str, str | float | int]] = {
+        "analyst": {"max_tokens": 2_000},
+        "planner": {"max_tokens": 4_000},
+        "evaluator": {"max_tokens": 1_500},
+        "interviewer": {"model": "openai/gpt-4o", "timeout": 30.0, "max_tokens": 800},
+        "coach": {"max_tokens": 4_000},
+        "quiz_generator": {"max_tokens": 4_000},
+        "quiz_evaluator": {"max_tokens": 1_200},
+        "summarizer": {"temperature": 0.2, "max_tokens": 600},
+    }
+    # 공용 keep-alive 연결 풀
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    # 호출 deadline + hedging (응답이 지연 백분위보다 늦으면 같은 요청을 한 번 더 보냄)
+    LLM_HEDGE_ENABLED: bool = True
+    LLM_HEDGE_ROLES: dict[str, float] = {"interviewer": 0.95, "evaluator": 0.95}  # 역할 → 백분위
+    LLM_HEDGE_DEFAULT_DELAY: float = 5.0  # 지연 표본이 모이기 전 대기(초)
+    LLM_HEDGE_MIN_DELAY: float = 1.0
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_WINDOW: int = 200  # 역할별 최근 지연 표본 수
+    LLM_HEDGE_SESSION_BUDGET: int = 5  # 세션당 추가 요청 수
+    LLM_HEDGE_WORKERS: int = 32
     OPENAI_API_KEY: str
     FIRECRAWL_API_KEY: str
 
@@ -20,13 +48,141 @@ class Settings(BaseSettings):
     DATABASE_URL: str
 
     PGVECTOR_CONNECTION_URL: str
+    PGVECTOR_POOL_MIN_SIZE: int = 2
+    PGVECTOR_POOL_MAX_SIZE: int = 10
+    PGVECTOR_POOL_TIMEOUT: float = 10.0
+    PGVECTOR_POOL_RECYCLE: int = 1800
 
     # Embedding
     EMBEDDING_MODEL: str = "text-embedding-3-small"
     EMBEDDING_CHUNK_SIZE: int = 500
+    EMBEDDING_CACHE_SIZE: int = 2048
+    EMBEDDING_CACHE_TTL: int = 7 * 24 * 3600
+    EMBEDDING_CACHE_PATH: str | None = None  # 설정 시 SQLite 디스크 캐시 사용
+    EMBEDDING_CACHE_DISK_SIZE: int = 50_000
+
+    # RAG 검색 결과 캐시 (사용자별, 노트 임베딩 시 무효화)
+    RAG_RESULT_CACHE_SIZE: int = 4096
+    RAG_RESULT_CACHE_TTL: int = 1800
+
+    # RAG 사전 검색 (크루 실행 전 검색 결과를 Task에 주입하고 도구 호출 생략)
+    RAG_PREFETCH: bool = False
+    RAG_PREFETCH_TOP_K: int = 3
+    RAG_PREFETCH_WORKERS: int = 8
 
     # CrewAI
     CREW_VERBOSE: bool = False
+    LLM_STRUCTURED_OUTPUT: bool = True  # 도구 없는 Task에 네이티브 JSON-schema 출력 요청
+    # 템플릿 Crew 풀 (평가/면접 진행/퀴즈/리포트 Crew를 재사용하고 kickoff inputs로 요청 값 보간)
+    CREW_POOL_MAX_IDLE: int = 16  # 템플릿별로 보관할 유휴 Crew 수
+    CREW_POOL_WARM: int = 1  # 서버 시작 시 템플릿별로 미리 만들 Crew 수
+
+    # /prepare 시나리오 캐시 (이력서/JD/옵션/노트 버전 해시 → 시나리오)
+    SCENARIO_CACHE_ENABLED: bool = True
+    SCENARIO_CACHE_SIZE: int = 1024
+    SCENARIO_CACHE_TTL: int = 24 * 3600
+    SCENARIO_CACHE_PATH: str | None = None  # 설정 시 SQLite 디스크 캐시 사용
+    SCENARIO_CACHE_DISK_SIZE: int = 10_000
+
+    # 준비 크루 이력서/JD 분석 결과 캐시 (내용 해시 → Task A/B 출력)
+    PREP_ANALYSIS_CACHE_ENABLED: bool = True
+    PREP_ANALYSIS_CACHE_SIZE: int = 4096
+    PREP_ANALYSIS_CACHE_TTL: int = 7 * 24 * 3600
+    PREP_ANALYSIS_CACHE_PATH: str | None = None  # 설정 시 SQLite 디스크 캐시 사용
+    PREP_ANALYSIS_CACHE_DISK_SIZE: int = 50_000
+
+    # 준비 파이프라인 DAG 실행 (Task A/B/C 동시 실행 → D → E)
+    DAG_MAX_WORKERS: int = 32  # deadline 초과로 버려진 시도까지 고려해 넉넉하게
+    DAG_RETRY_BACKOFF: float = 1.0  # 재시도 대기(초), 시도마다 2배
+    PREP_DAG_CONCURRENCY: int = 3
+    PREP_TASK_RETRIES: int = 1
+    PREP_TASK_TIMEOUTS: dict[str, float] = {
+        "resume": 60.0,
+        "jd": 60.0,
+        "rag": 45.0,
+        "profile": 90.0,
+        "scenario": 120.0,
+    }
+
+    # 면접 세션 저장소 (시나리오/턴 기록을 서버에 보관)
+    SESSION_STORE_SIZE: int = 10_000
+    SESSION_TTL: int = 24 * 3600
+    SESSION_STORE_PATH: str | None = None  # 설정 시 SQLite에 write-through
+    SESSION_STORE_DISK_SIZE: int = 100_000
+
+    # 대화 메모리 (오래된 턴 요약 + 최근 원문 턴, 토큰 예산 이내)
+    CONVERSATION_TOKEN_BUDGET: int = 800
+    CONVERSATION_RECENT_TURNS: int = 3
+    CONVERSATION_SUMMARY_BATCH: int = 2  # 요약되지 않은 턴이 이만큼 쌓이면 갱신
+    CONVERSATION_SUMMARY_WORKERS: int = 4
+
+    # 리포트 사전 집계 digest
+    REPORT_DIGEST_TOP_ITEMS: int = 5
+    REPORT_ANSWER_MAX_CHARS: int = 300
+
+    # 면접 진행 결정 fast path (규칙으로 결정 가능한 턴은 면접관 LLM 생략)
+    INTERVIEW_FAST_PATH: bool = True
+    INTERVIEW_MAX_FOLLOW_UPS: int = 1
+    INTERVIEW_FAST_PATH_MIN_SCORE: int = 7
+
+    # LLM/임베딩 토큰 한도 (전역 + 사용자별 토큰 버킷, 분당 토큰)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_LLM_TPM: int = 200_000
+    RATE_LIMIT_LLM_USER_TPM: int = 40_000
+    RATE_LIMIT_EMBEDDING_TPM: int = 1_000_000
+    RATE_LIMIT_EMBEDDING_USER_TPM: int = 200_000
+    RATE_LIMIT_USER_BUCKETS: int = 10_000
+    RATE_LIMIT_COMPLETION_TOKENS: int = 800  # LLM 호출당 completion 예약량 (완료 후 실제값으로 보정)
+    # 대기 우선순위 (낮을수록 먼저)
+    RATE_LIMIT_PRIORITIES: dict[str, int] = {
+        "interview.evaluate": 0,
+        "interview.prepare": 1,
+        "interview.report": 1,
+        "quiz.generate": 2,
+        "quiz.evaluate": 2,
+    }
+    RATE_LIMIT_DEFAULT_PRIORITY: int = 3  # 엔드포인트 밖의 호출 (대화 요약 등)
+    # 요청 하나가 쓰는 예상 토큰 (시작 시 예상 대기 계산용)
+    RATE_LIMIT_REQUEST_TOKENS: dict[str, int] = {
+        "interview.evaluate": 4_000,
+        "interview.prepare": 20_000,
+        "interview.report": 6_000,
+        "quiz.generate": 6_000,
+        "quiz.evaluate": 2_000,
+    }
+    RATE_LIMIT_MAX_WAIT: float = 20.0  # 예상 대기가 이보다 길면 429
+
+    # 실행 트레이스 (Chrome trace-event JSON 파일, Perfetto에서 열람)
+    TRACE_DIR: str | None = None  # 미설정 시 트레이스 비활성화
+    TRACE_SAMPLE_RATE: float = 0.0
+    TRACE_HEADER: str = "X-Trace"  # 1이면 강제 샘플링, 0이면 제외
+
+    # 요청 deadline / 취소 (클라이언트 연결 끊김·시간 초과 시 다음 LLM 호출 전에 crew 중단)
+    REQUEST_TIMEOUT_HEADER: str = "X-Request-Timeout"  # 초 단위, 엔드포인트 기본값보다 우선
+    REQUEST_DEADLINES: dict[str, float] = {
+        "interview.prepare": 300.0,
+        "interview.evaluate": 90.0,
+        "interview.report": 180.0,
+        "quiz.generate": 180.0,
+        "quiz.evaluate": 90.0,
+    }
+    CANCEL_POLL_INTERVAL: float = 0.5  # 대기 중 취소 여부 확인 주기(초)
+
+    # Crew 실행 풀 (이벤트 루프 밖에서 crew.kickoff() 실행)
+    CREW_EXECUTOR_MODE: Literal["thread", "process"] = "thread"
+    CREW_EXECUTOR_MAX_WORKERS: int = 16
+    CREW_EXECUTOR_DEFAULT_LIMIT: int = 4
+    CREW_EXECUTOR_LIMITS: dict[str, int] = {
+        "interview.prepare": 4,
+        "interview.evaluate": 8,
+        "interview.report": 4,
+        "quiz.generate": 2,
+        "quiz.evaluate": 4,
+        "knowledge.embed": 4,
+        "resume.parse": 2,
+    }
+    CREW_EXECUTOR_QUEUE_SIZE: int = 32
+    CREW_EXECUTOR_RETRY_AFTER: int = 5
 
 
 settings = Settings()
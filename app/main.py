@@ -1,12 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.api import interview, knowledge, quiz, resume
+from app.utils.cancellation import CancellationMiddleware
+from app.utils.crew_pool import warm_crew_pools
+from app.utils.executor import crew_executor
+from app.utils.metrics import REGISTRY
+from app.utils.tracing import TraceMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_crew_pools()
+    yield
+    crew_executor.shutdown()
+
 
 app = FastAPI(
     title="AI Interview Coach - AI Service",
     description="CrewAI 기반 모의면접 AI 오케스트레이션 서비스",
     version="0.1.0",
+    lifespan=lifespan,
 )
+app.add_middleware(TraceMiddleware)
+app.add_middleware(CancellationMiddleware)
 
 app.include_router(interview.router)
 app.include_router(knowledge.router)
@@ -17,3 +36,8 @@ app.include_router(resume.router)
 @app.get("/health")
 async def health_check():
     return {"status": "ok", "service": "ai-service"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
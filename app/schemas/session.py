@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+
+class SessionEvaluateRequest(BaseModel):
+    """세션 기반 답변 평가 요청: 시나리오/턴 기록은 서버 세션에서 조회한다."""
+
+    session_id: str = Field(..., description="/prepare 응답의 X-Session-Id")
+    user_id: str = Field(..., description="세션을 만든 /prepare 요청의 user_id")
+    answer: str = Field(..., description="현재 질문에 대한 후보자 답변")
+
+
+class SessionReportRequest(BaseModel):
+    """세션 기반 리포트 요청."""
+
+    session_id: str = Field(..., description="/prepare 응답의 X-Session-Id")
+    user_id: str = Field(..., description="세션을 만든 /prepare 요청의 user_id")
@@ -0,0 +1,130 @@
+import array
+import hashlib
+import logging
+import re
+import unicodedata
+
+from langchain_core.embeddings import Embeddings
+
+from app.config import settings
+from app.utils.cache import LRUTTLCache, SQLiteCache
+from app.utils.metrics import Counter
+from app.utils.rate_limiter import acquire_embedding
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 쿼리 임베딩 캐시: (EMBEDDING_MODEL, 정규화 쿼리) → 벡터
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+EMBEDDING_CACHE_HITS = Counter(
+    "embedding_cache_hits_total",
+    "쿼리 임베딩 캐시 적중 수",
+    labels=("tier",),
+)
+EMBEDDING_CACHE_MISSES = Counter(
+    "embedding_cache_misses_total",
+    "쿼리 임베딩 캐시 미스 수 (임베딩 API 호출)",
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 쿼리 정규화: NFKC + 공백 압축 + 대소문자 무시."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
+
+def _pack(vector: list[float]) -> bytes:
+    return array.array("d", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    values = array.array("d")
+    values.frombytes(blob)
+    return values.tolist()
+
+
+class CachedEmbeddings(Embeddings):
+    """embed_query 결과를 메모리(LRU+TTL) → 디스크(SQLite, 선택) 순으로 캐시한다.
+
+    문서 임베딩(embed_documents)은 저장 경로에서만 쓰이므로 캐시하지 않는다.
+    """
+
+    def __init__(self, inner: Embeddings, model: str):
+        self.inner = inner
+        self.model = model
+        self.memory = LRUTTLCache(
+            max_size=settings.EMBEDDING_CACHE_SIZE,
+            ttl=settings.EMBEDDING_CACHE_TTL,
+        )
+        self.disk = (
+            SQLiteCache(
+                settings.EMBEDDING_CACHE_PATH,
+                table="query_embeddings",
+                max_entries=settings.EMBEDDING_CACHE_DISK_SIZE,
+                ttl=settings.EMBEDDING_CACHE_TTL,
+            )
+            if settings.EMBEDDING_CACHE_PATH
+            else None
+        )
+
+    def _key(self, text: str) -> str:
+        digest = hashlib.sha256(normalize_query(text).encode("utf-8")).hexdigest()
+        return f"{self.model}:{digest}"
+
+    def _lookup(self, key: str) -> list[float] | None:
+        vector = self.memory.get(key)
+        if vector is not None:
+            EMBEDDING_CACHE_HITS.inc(tier="memory")
+            return vector
+        if self.disk is not None:
+            try:
+                blob = self.disk.get(key)
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 조회 실패: {e}")
+                blob = None
+            if blob is not None:
+                vector = _unpack(blob)
+                self.memory.set(key, vector)
+                EMBEDDING_CACHE_HITS.inc(tier="disk")
+                return vector
+        return None
+
+    def _store(self, key: str, vector: list[float]) -> None:
+        self.memory.set(key, vector)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, _pack(vector))
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 저장 실패: {e}")
+
+    def embed_queries(self, texts: list[str]) -> list[list[float]]:
+        """여러 쿼리를 임베딩한다. 캐시 미스만 모아 한 번의 배치 요청으로 보낸다."""
+        keys = [self._key(text) for text in texts]
+        vectors: list[list[float] | None] = [self._lookup(key) for key in keys]
+
+        missing: dict[str, list[int]] = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(keys[i], []).append(i)
+
+        if missing:
+            EMBEDDING_CACHE_MISSES.inc(len(missing))
+            first_indexes = [indexes[0] for indexes in missing.values()]
+            batch = [texts[i] for i in first_indexes]
+            acquire_embedding(batch)
+            embedded = self.inner.embed_documents(batch)
+            for (key, indexes), vector in zip(missing.items(), embedded):
+                self._store(key, vector)
+                for i in indexes:
+                    vectors[i] = vector
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_queries([text])[0]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        acquire_embedding(texts)
+        return self.inner.embed_documents(texts)
@@ -0,0 +1,54 @@
+import threading
+
+from app.config import settings
+from app.tools.embedding_cache import normalize_query
+from app.utils.cache import LRUTTLCache
+from app.utils.metrics import Counter
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 사용자별 RAG 검색 결과 캐시
+#   키: (user_id, notes_version, 정규화 쿼리, top_k)
+#   노트 임베딩 저장 시 notes_version을 올려 해당 사용자 캐시를 무효화한다.
+#   캐시와 버전 카운터는 프로세스 단위이며, 다른 워커의 오래된 항목은 TTL로 만료된다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+RAG_CACHE_HITS = Counter("rag_result_cache_hits_total", "RAG 검색 결과 캐시 적중 수")
+RAG_CACHE_MISSES = Counter("rag_result_cache_misses_total", "RAG 검색 결과 캐시 미스 수")
+
+rag_result_cache = LRUTTLCache(
+    max_size=settings.RAG_RESULT_CACHE_SIZE,
+    ttl=settings.RAG_RESULT_CACHE_TTL,
+)
+
+_versions: dict[str, int] = {}
+_versions_lock = threading.Lock()
+
+
+def get_notes_version(user_id: str) -> int:
+    return _versions.get(user_id, 0)
+
+
+def bump_notes_version(user_id: str) -> int:
+    """사용자 노트가 변경되었음을 기록하고 해당 사용자의 검색 결과 캐시를 비운다."""
+    with _versions_lock:
+        version = _versions.get(user_id, 0) + 1
+        _versions[user_id] = version
+    rag_result_cache.discard_where(lambda key: key[0] == user_id)
+    return version
+
+
+def result_cache_key(user_id: str, query: str, top_k: int) -> tuple:
+    return (user_id, get_notes_version(user_id), normalize_query(query), top_k)
+
+
+def get_cached_result(key: tuple) -> str | None:
+    result = rag_result_cache.get(key)
+    if result is None:
+        RAG_CACHE_MISSES.inc()
+    else:
+        RAG_CACHE_HITS.inc()
+    return result
+
+
+def set_cached_result(key: tuple, result: str) -> None:
+    rag_result_cache.set(key, result)
@@ -1,14 +1,53 @@
+import contextvars
+import json
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from langchain_postgres import PGVector
-from langchain_openai import OpenAIEmbeddings
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
 
 from app.config import settings
+from app.tools.embedding_cache import normalize_query
+from app.tools.rag_cache import get_cached_result, result_cache_key, set_cached_result
+from app.tools.vector_store import (
+    COLLECTION_NAME,
+    get_embeddings,
+    get_engine,
+    get_vector_store,
+    reset_vector_store,
+)
 
 logger = logging.getLogger(__name__)
 
+NO_RESULT_MESSAGE = "관련 스터디 노트를 찾지 못했습니다."
+MAX_MULTI_QUERIES = 20
+
+# 템플릿 Crew(crew_pool)의 도구는 user_id 없이 공유되므로 요청 사용자를 컨텍스트로 받는다.
+# 도구의 user_id 필드가 지정되어 있으면 그 값이 우선한다.
+current_search_user: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "rag_search_user", default=""
+)
+
+
+def _search_user(tool_user_id: str) -> str:
+    """검색 대상 사용자. 없으면 빈 문자열 (다른 사용자 노트가 섞이지 않도록 검색하지 않는다)."""
+    user_id = tool_user_id or current_search_user.get()
+    if not user_id:
+        logger.warning("RAG 검색 사용자가 지정되지 않아 검색을 건너뜀")
+    return user_id
+
+
+def _format_results(hits: list[tuple[str, dict]]) -> str:
+    if not hits:
+        return NO_RESULT_MESSAGE
+    return "\n---\n".join(
+        f"[출처: {(metadata or {}).get('note_id', 'unknown')}]\n{content}"
+        for content, metadata in hits
+    )
+
 
 class RAGSearchInput(BaseModel):
     query: str = Field(description="검색할 기술 키워드 또는 질문")
@@ -26,31 +65,168 @@ class RAGSearchTool(BaseTool):
     user_id: str = ""
 
     def _run(self, query: str, top_k: int = 5) -> str:
+        user_id = _search_user(self.user_id)
+        if not user_id:
+            return NO_RESULT_MESSAGE
+        cache_key = result_cache_key(user_id, query, top_k)
+        cached = get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            embeddings = OpenAIEmbeddings(model=settings.EMBEDDING_MODEL)
-            vectorstore = PGVector(
-                embeddings=embeddings,
-                connection=settings.PGVECTOR_CONNECTION_URL,
-                collection_name="knowledge_embeddings",
-                use_jsonb=True,
-            )
+            vectorstore = get_vector_store()
 
-            search_filter = {"user_id": self.user_id} if self.user_id else None
             docs = vectorstore.similarity_search(
                 query=query,
                 k=top_k,
-                filter=search_filter,
+                filter={"user_id": user_id},
             )
 
-            if not docs:
-                return "관련 스터디 노트를 찾지 못했습니다."
-
-            results = []
-            for doc in docs:
-                results.append(
-                    f"[출처: {doc.metadata.get('note_id', 'unknown')}]\n{doc.page_content}"
-                )
-            return "\n---\n".join(results)
+            result = _format_results([(doc.page_content, doc.metadata) for doc in docs])
+            set_cached_result(cache_key, result)
+            return result
+        except DBAPIError as e:
+            if e.connection_invalidated:
+                reset_vector_store()
+            logger.error(f"RAG 검색 중 DB 오류 발생: {e}")
+            return f"RAG 검색 중 오류가 발생했습니다: {str(e)}"
         except Exception as e:
             logger.error(f"RAG 검색 중 오류 발생: {e}")
             return f"RAG 검색 중 오류가 발생했습니다: {str(e)}"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 배치 검색: 여러 쿼리 → 임베딩 1회 + SQL 1회
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# 쿼리 벡터 목록을 unnest한 뒤 LATERAL 서브쿼리로 쿼리별 top_k를 한 번에 조회
+# (바깥 ORDER BY는 LATERAL 안의 순서를 보장하지 않으므로 쿼리 안에서 거리순으로 다시 정렬)
+_MULTI_SEARCH_SQL = """
+WITH q AS (
+    SELECT t.ord, CAST(t.vec AS vector) AS v
+    FROM unnest(CAST(:vectors AS text[])) WITH ORDINALITY AS t(vec, ord)
+)
+SELECT q.ord, hit.document, hit.cmetadata
+FROM q
+CROSS JOIN LATERAL (
+    SELECT e.document, e.cmetadata, e.embedding <=> q.v AS distance
+    FROM langchain_pg_embedding e
+    WHERE e.collection_id = (
+        SELECT c.uuid FROM langchain_pg_collection c WHERE c.name = :collection
+    )
+      AND e.cmetadata @> CAST(:user_filter AS jsonb)
+    ORDER BY distance
+    LIMIT :top_k
+) AS hit
+ORDER BY q.ord, hit.distance
+"""
+
+
+class MultiRAGSearchInput(BaseModel):
+    queries: list[str] = Field(description="한 번에 검색할 기술 키워드 또는 질문 목록")
+    top_k: int = Field(default=3, description="키워드별 반환할 최대 결과 수")
+
+
+class MultiRAGSearchTool(BaseTool):
+    name: str = "rag_multi_search"
+    description: str = (
+        "여러 기술 키워드로 사용자의 MD 스터디 노트를 한 번에 검색한다. "
+        "키워드 목록 전체를 한 번의 호출로 전달하면 키워드별로 묶인 결과를 반환한다. "
+        "키워드마다 rag_search를 반복 호출하는 대신 이 도구를 사용한다."
+    )
+    args_schema: type[BaseModel] = MultiRAGSearchInput
+    user_id: str = ""
+
+    def _run(self, queries: list[str], top_k: int = 3) -> str:
+        # 정규화 기준으로 중복 제거 (입력 순서 유지)
+        unique: dict[str, str] = {}
+        for query in queries:
+            if query and query.strip():
+                unique.setdefault(normalize_query(query), query.strip())
+        targets = list(unique.values())[:MAX_MULTI_QUERIES]
+        if not targets:
+            return NO_RESULT_MESSAGE
+
+        user_id = _search_user(self.user_id)
+        if not user_id:
+            return NO_RESULT_MESSAGE
+        results: dict[str, str] = {}
+        pending: list[tuple[str, tuple]] = []
+        for query in targets:
+            cache_key = result_cache_key(user_id, query, top_k)
+            cached = get_cached_result(cache_key)
+            if cached is None:
+                pending.append((query, cache_key))
+            else:
+                results[query] = cached
+
+        if pending:
+            try:
+                grouped = self._search([query for query, _ in pending], top_k, user_id)
+            except DBAPIError as e:
+                if e.connection_invalidated:
+                    reset_vector_store()
+                logger.error(f"RAG 배치 검색 중 DB 오류 발생: {e}")
+                return f"RAG 검색 중 오류가 발생했습니다: {str(e)}"
+            except Exception as e:
+                logger.error(f"RAG 배치 검색 중 오류 발생: {e}")
+                return f"RAG 검색 중 오류가 발생했습니다: {str(e)}"
+
+            for i, (query, cache_key) in enumerate(pending):
+                result = _format_results(grouped.get(i, []))
+                set_cached_result(cache_key, result)
+                results[query] = result
+
+        return "\n\n===\n\n".join(
+            f"### 키워드: {query}\n{results[query]}" for query in targets
+        )
+
+    def _search(
+        self, queries: list[str], top_k: int, user_id: str
+    ) -> dict[int, list[tuple[str, dict]]]:
+        # 스토어 초기화(확장/테이블/컬렉션 생성)를 보장한 뒤 공유 엔진으로 직접 조회
+        get_vector_store()
+        vectors = get_embeddings().embed_queries(queries)
+
+        params = {
+            "vectors": ["[" + ",".join(map(str, vector)) + "]" for vector in vectors],
+            "collection": COLLECTION_NAME,
+            "top_k": top_k,
+            "user_filter": json.dumps({"user_id": user_id}),
+        }
+
+        grouped: dict[int, list[tuple[str, dict]]] = {}
+        with get_engine().connect() as conn:
+            rows = conn.execute(text(_MULTI_SEARCH_SQL), params)
+            for ord_, document, metadata in rows:
+                grouped.setdefault(ord_ - 1, []).append((document, metadata))
+        return grouped
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 사전 검색(prefetch): 인자가 이미 정해진 검색을 크루 실행 전에 시작
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_prefetch_pool: ThreadPoolExecutor | None = None
+_prefetch_lock = threading.Lock()
+
+
+def _get_prefetch_pool() -> ThreadPoolExecutor:
+    global _prefetch_pool
+    with _prefetch_lock:
+        if _prefetch_pool is None:
+            _prefetch_pool = ThreadPoolExecutor(
+                max_workers=settings.RAG_PREFETCH_WORKERS, thread_name_prefix="rag-prefetch"
+            )
+        return _prefetch_pool
+
+
+def prefetch_notes(user_id: str, queries: list[str], top_k: int | None = None) -> Future:
+    """queries의 배치 검색을 백그라운드로 시작하고, 포맷된 결과 문자열의 Future를 반환한다.
+
+    호출자는 요청 파싱/크루 구성을 진행한 뒤 future.result()로 결과를 받아 Task에 주입한다.
+    """
+    tool = MultiRAGSearchTool(user_id=user_id)
+    return _get_prefetch_pool().submit(
+        tool._run, queries, top_k or settings.RAG_PREFETCH_TOP_K
+    )
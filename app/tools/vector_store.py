@@ -0,0 +1,148 @@
+import json
+import logging
+import threading
+import time
+
+from langchain_openai import OpenAIEmbeddings
+from langchain_postgres import PGVector
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from app.config import settings
+from app.tools.embedding_cache import CachedEmbeddings
+from app.utils.metrics import Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "knowledge_embeddings"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 프로세스 단위 PGVector 스토어 / 임베딩 클라이언트 싱글턴
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+POOL_CHECKED_OUT = Gauge(
+    "pgvector_pool_checked_out",
+    "현재 체크아웃된 Postgres 커넥션 수",
+)
+POOL_ACQUIRE_SECONDS = Histogram(
+    "pgvector_pool_acquire_seconds",
+    "커넥션 풀에서 커넥션을 얻기까지 걸린 시간(초)",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 10.0),
+)
+
+
+class _InstrumentedQueuePool(QueuePool):
+    """커넥션 획득 지연(pre-ping 포함)을 기록하는 QueuePool."""
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            POOL_ACQUIRE_SECONDS.observe(time.perf_counter() - started_at)
+
+
+_lock = threading.Lock()
+_engine: Engine | None = None
+_embeddings: CachedEmbeddings | None = None
+_vector_store: PGVector | None = None
+
+
+def _create_engine() -> Engine:
+    engine = create_engine(
+        settings.PGVECTOR_CONNECTION_URL,
+        poolclass=_InstrumentedQueuePool,
+        pool_size=settings.PGVECTOR_POOL_MIN_SIZE,
+        max_overflow=max(0, settings.PGVECTOR_POOL_MAX_SIZE - settings.PGVECTOR_POOL_MIN_SIZE),
+        pool_timeout=settings.PGVECTOR_POOL_TIMEOUT,
+        # 체크아웃 시 SELECT 1로 헬스 체크, 끊긴 커넥션은 자동 재연결
+        pool_pre_ping=True,
+        pool_recycle=settings.PGVECTOR_POOL_RECYCLE,
+    )
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        POOL_CHECKED_OUT.set(engine.pool.checkedout())
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        POOL_CHECKED_OUT.set(engine.pool.checkedout())
+
+    return engine
+
+
+def get_engine() -> Engine:
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = _create_engine()
+    return _engine
+
+
+def get_embeddings() -> CachedEmbeddings:
+    global _embeddings
+    if _embeddings is None:
+        with _lock:
+            if _embeddings is None:
+                _embeddings = CachedEmbeddings(
+                    OpenAIEmbeddings(model=settings.EMBEDDING_MODEL),
+                    model=settings.EMBEDDING_MODEL,
+                )
+    return _embeddings
+
+
+def get_vector_store() -> PGVector:
+    """모든 RAGSearchTool 인스턴스가 공유하는 PGVector 스토어."""
+    global _vector_store
+    if _vector_store is None:
+        embeddings = get_embeddings()
+        engine = get_engine()
+        with _lock:
+            if _vector_store is None:
+                _vector_store = PGVector(
+                    embeddings=embeddings,
+                    connection=engine,
+                    collection_name=COLLECTION_NAME,
+                    use_jsonb=True,
+                )
+    return _vector_store
+
+
+# 사용자 노트 청크의 가벼운 서명: 청크 수 + 가장 큰 청크 id (본문은 읽지 않는다)
+_NOTES_SIGNATURE_SQL = """
+SELECT count(*), coalesce(max(e.id), '')
+FROM langchain_pg_embedding e
+WHERE e.collection_id = (
+    SELECT c.uuid FROM langchain_pg_collection c WHERE c.name = :collection
+)
+  AND e.cmetadata @> CAST(:user_filter AS jsonb)
+"""
+
+
+def notes_signature(user_id: str) -> str:
+    """사용자 노트 임베딩의 서명 ("<청크 수>:<최대 id>").
+
+    DB에서 계산하므로 재시작·다른 워커에서도 같은 노트면 같은 값이다.
+    노트를 추가·삭제하거나 새 id로 다시 임베딩하면 대부분 값이 바뀌지만,
+    청크 수와 최대 id가 모두 그대로인 교체는 감지하지 못한다 (캐시 TTL까지 유지).
+    """
+    get_vector_store()
+    with get_engine().connect() as conn:
+        count, max_id = conn.execute(
+            text(_NOTES_SIGNATURE_SQL),
+            {"collection": COLLECTION_NAME, "user_filter": json.dumps({"user_id": user_id})},
+        ).one()
+    return f"{count}:{max_id}"
+
+
+def reset_vector_store() -> None:
+    """DB 장애 후 재연결을 위해 엔진과 스토어를 폐기한다. 다음 호출 시 재생성된다."""
+    global _engine, _vector_store
+    with _lock:
+        engine, _engine, _vector_store = _engine, None, None
+    if engine is not None:
+        engine.dispose()
+        POOL_CHECKED_OUT.set(0)
@@ -0,0 +1,106 @@
+import hashlib
+import logging
+
+from app.config import settings
+from app.utils.cache import LRUTTLCache, SQLiteCache
+from app.utils.llm_registry import llm_route
+from app.utils.metrics import Counter
+from app.utils.output_decoder import OutputDecodeError, extract_json
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 준비 크루 분석 결과 캐시 (Task A 이력서 분석 / Task B JD 분석)
+#   두 Task는 각각 이력서/JD 내용에만 의존하므로 사용자와 무관하게
+#   sha256(종류, 분석 모델, Task 지시문, 입력 원문)으로 재사용한다.
+#   모델과 지시문이 포함되므로 모델/프롬프트를 바꾸면 자연히 새 키가 된다.
+#   잘렸거나 JSON이 아닌 출력은 이후 요청마다 재사용되지 않도록 저장하지 않는다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+ANALYSIS_CACHE_HITS = Counter(
+    "prep_analysis_cache_hits_total",
+    "준비 크루 분석 결과 캐시 적중 수",
+    labels=("kind", "tier"),
+)
+ANALYSIS_CACHE_MISSES = Counter(
+    "prep_analysis_cache_misses_total",
+    "준비 크루 분석 결과 캐시 미스 수 (Task 실행)",
+    labels=("kind",),
+)
+ANALYSIS_CACHE_REJECTED = Counter(
+    "prep_analysis_cache_rejected_total",
+    "JSON으로 디코딩되지 않거나 잘려서 저장하지 않은 분석 결과 수",
+    labels=("kind",),
+)
+
+
+def analysis_cache_key(kind: str, instructions: str, text: str) -> str:
+    digest = hashlib.sha256()
+    for part in (kind, llm_route("analyst")["model"], instructions, text.strip()):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return f"{kind}:{digest.hexdigest()}"
+
+
+class AnalysisCache:
+    """분석 결과(JSON 문자열)를 메모리 → 디스크(SQLite, 선택) 순으로 조회/저장한다."""
+
+    def __init__(self, max_size: int, ttl: float, backend: SQLiteCache | None = None):
+        self.memory = LRUTTLCache(max_size=max_size, ttl=ttl)
+        self.backend = backend
+
+    def get(self, key: str) -> str | None:
+        kind = key.split(":", 1)[0]
+        result = self.memory.get(key)
+        if result is not None:
+            ANALYSIS_CACHE_HITS.inc(kind=kind, tier="memory")
+            return result
+        if self.backend is not None:
+            try:
+                blob = self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"분석 결과 디스크 캐시 조회 실패: {e}")
+                blob = None
+            if blob is not None:
+                result = blob.decode("utf-8")
+                self.memory.set(key, result)
+                ANALYSIS_CACHE_HITS.inc(kind=kind, tier="disk")
+                return result
+        ANALYSIS_CACHE_MISSES.inc(kind=kind)
+        return None
+
+    def set(self, key: str, result: str) -> None:
+        if not result or not result.strip():
+            return
+        try:
+            _, path = extract_json(result)
+        except OutputDecodeError:
+            path = "failed"
+        if path in ("failed", "repaired"):
+            kind = key.split(":", 1)[0]
+            ANALYSIS_CACHE_REJECTED.inc(kind=kind)
+            logger.warning(f"분석 결과가 JSON이 아니거나 잘려 캐시하지 않음 ({kind}, {path})")
+            return
+        self.memory.set(key, result)
+        if self.backend is not None:
+            try:
+                self.backend.set(key, result.encode("utf-8"))
+            except Exception as e:
+                logger.warning(f"분석 결과 디스크 캐시 저장 실패: {e}")
+
+
+analysis_cache = AnalysisCache(
+    max_size=settings.PREP_ANALYSIS_CACHE_SIZE,
+    ttl=settings.PREP_ANALYSIS_CACHE_TTL,
+    backend=(
+        SQLiteCache(
+            settings.PREP_ANALYSIS_CACHE_PATH,
+            table="prep_analyses",
+            max_entries=settings.PREP_ANALYSIS_CACHE_DISK_SIZE,
+            ttl=settings.PREP_ANALYSIS_CACHE_TTL,
+        )
+        if settings.PREP_ANALYSIS_CACHE_PATH
+        else None
+    ),
+)
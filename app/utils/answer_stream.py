@@ -0,0 +1,53 @@
+import json
+
+from crewai.types.streaming import StreamChunkType
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 면접관 응답 토큰 스트리밍 (SSE)
+#   CrewStreamingOutput의 텍스트 청크 중 'Final Answer:' 이후만 token 이벤트로 내보낸다.
+#   도구 호출 청크는 사용자에게 보여줄 내용이 아니므로 건너뛴다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+FINAL_ANSWER_MARKER = "Final Answer:"
+
+
+class FinalAnswerFilter:
+    """ReAct 형식 출력에서 'Final Answer:' 이후의 토큰만 통과시킨다.
+
+    모델이 마커 없이 바로 JSON을 쓰기 시작하면 그대로 통과시킨다.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._passing = False
+
+    def feed(self, chunk: str) -> str:
+        if self._passing:
+            return chunk
+        self._buffer += chunk
+        idx = self._buffer.find(FINAL_ANSWER_MARKER)
+        if idx >= 0:
+            self._passing = True
+            return self._buffer[idx + len(FINAL_ANSWER_MARKER):].lstrip()
+        if self._buffer.lstrip().startswith(("{", "```")):
+            self._passing = True
+            return self._buffer
+        return ""
+
+
+def format_sse(event: str, data) -> str:
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def stream_answer_tokens(emit, streaming):
+    """streaming(CrewStreamingOutput)의 최종 답변 토큰을 emit("token", ...)으로 내보내고
+    스트림이 끝나면 최종 결과(streaming.result)를 반환한다."""
+    answer_filter = FinalAnswerFilter()
+    for chunk in streaming:
+        if chunk.chunk_type != StreamChunkType.TEXT:
+            continue
+        text = answer_filter.feed(chunk.content)
+        if text:
+            emit("token", {"text": text})
+    return streaming.result
@@ -0,0 +1,137 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 공용 캐시: 메모리 LRU + TTL, SQLite 디스크 캐시
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_MISSING = object()
+
+
+class LRUTTLCache:
+    """크기 제한(LRU 축출) + TTL을 갖는 스레드 안전 메모리 캐시."""
+
+    def __init__(self, max_size: int, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at and expires_at <= now:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def discard_where(self, predicate) -> int:
+        """predicate(key)가 참인 항목을 모두 제거하고 제거 개수를 반환."""
+        with self._lock:
+            keys = [k for k in self._data if predicate(k)]
+            for k in keys:
+                del self._data[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """재시작 후에도 유지되는 SQLite 기반 key-value 캐시 (bytes 값, TTL, 크기 제한)."""
+
+    _PRUNE_EVERY = 128
+
+    def __init__(self, path: str, table: str, max_entries: int, ttl: float | None = None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.table = table
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_accessed_at ON {table} (accessed_at)"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at and expires_at <= now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float | None = None) -> None:
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl else 0.0
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO {self.table} (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "value = excluded.value, expires_at = excluded.expires_at, "
+                "accessed_at = excluded.accessed_at",
+                (key, value, expires_at, now),
+            )
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._prune(now)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def _prune(self, now: float) -> None:
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE expires_at > 0 AND expires_at <= ?", (now,)
+        )
+        self._conn.execute(
+            f"DELETE FROM {self.table} WHERE key IN ("
+            f"SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
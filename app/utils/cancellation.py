@@ -0,0 +1,191 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+from crewai.hooks import (
+    HookAborted,
+    register_before_llm_call_hook,
+    register_before_tool_call_hook,
+)
+from fastapi import HTTPException
+
+from app.config import settings
+from app.utils.metrics import Counter
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 요청 취소 전파 (클라이언트 연결 끊김 / deadline 초과)
+#   요청마다 CancelToken을 만들어 contextvars로 워커 스레드·crew 내부까지 전달하고,
+#   crew는 다음 LLM 호출/도구 호출 직전(CrewAI 전역 훅), DAG는 다음 노드 시작 전,
+#   실행 풀은 슬롯 대기 중에 토큰을 확인해 멈춘다.
+#   실행 중인 LLM 호출 자체는 중단할 수 없으므로 응답이 온 뒤 다음 단계에서 멈춘다.
+#   DAG 노드 시도처럼 요청의 일부만 따로 멈춰야 하는 작업은 child() 토큰을 쓴다
+#   (부모가 취소되면 함께 취소되고, 토큰 사용량은 부모에도 합산된다).
+#   deadline: 요청 헤더(REQUEST_TIMEOUT_HEADER, 초) 또는 엔드포인트 기본값(REQUEST_DEADLINES).
+#   process 모드 워커에는 컨텍스트가 전달되지 않으므로 슬롯 대기 단계까지만 취소된다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+CANCELLED_WORK = Counter(
+    "cancelled_work_total",
+    "클라이언트 연결 끊김/deadline 초과로 중단된 작업 수",
+    labels=("endpoint", "reason"),
+)
+CANCELLED_TOKENS_SAVED = Counter(
+    "cancelled_tokens_saved_total",
+    "중단으로 아낀 추정 LLM 토큰 수 (요청 예상 토큰 - 중단 시점까지 사용량)",
+    labels=("endpoint",),
+)
+
+_register_lock = threading.Lock()
+_registered = False
+
+
+class RequestCancelledError(RuntimeError):
+    def __init__(self, reason: str):
+        super().__init__(f"요청이 취소되었습니다 ({reason})")
+        self.reason = reason
+
+
+class CancelToken:
+    """요청 하나의 취소 상태. 이벤트 루프와 워커 스레드에서 함께 읽는다."""
+
+    def __init__(self, timeout: float | None = None, parent: "CancelToken | None" = None):
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.parent = parent
+        if parent is not None and parent.deadline is not None:
+            self.deadline = min(self.deadline or parent.deadline, parent.deadline)
+        self.reason: str | None = None
+        self.tokens_used = 0  # 지금까지 완료된 LLM 호출의 토큰 수
+
+    def child(self, timeout: float | None = None) -> "CancelToken":
+        """이 토큰이 취소되면 함께 취소되지만 따로 취소할 수도 있는 하위 토큰."""
+        return CancelToken(timeout, parent=self)
+
+    def cancel(self, reason: str) -> None:
+        if self.reason is None:
+            self.reason = reason
+
+    def add_tokens_used(self, tokens: int) -> None:
+        token = self
+        while token is not None:
+            token.tokens_used += tokens
+            token = token.parent
+
+    def set_default_timeout(self, timeout: float | None) -> None:
+        """헤더로 deadline이 지정되지 않은 경우에만 엔드포인트 기본값을 적용한다."""
+        if self.deadline is None and timeout:
+            self.deadline = time.monotonic() + timeout
+
+    @property
+    def cancelled(self) -> bool:
+        if self.reason is None and self.parent is not None and self.parent.cancelled:
+            self.reason = self.parent.reason
+        if self.reason is None and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = "deadline"
+        return self.reason is not None
+
+    def raise_if_cancelled(self) -> None:
+        if self.cancelled:
+            raise RequestCancelledError(self.reason)
+
+
+current_cancel: contextvars.ContextVar[CancelToken | None] = contextvars.ContextVar(
+    "current_cancel", default=None
+)
+
+
+def check_cancelled() -> None:
+    """현재 요청이 취소되었으면 RequestCancelledError를 발생시킨다."""
+    token = current_cancel.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def cancelled_http_error(token: CancelToken) -> HTTPException:
+    if token.reason == "deadline":
+        return HTTPException(status_code=504, detail="요청 처리 시간이 초과되어 작업을 중단했습니다.")
+    # 클라이언트가 이미 떠났으므로 응답은 전달되지 않는다 (nginx 관례의 499)
+    return HTTPException(status_code=499, detail="클라이언트 연결이 끊겨 작업을 중단했습니다.")
+
+
+def record_cancelled(endpoint: str, token: CancelToken) -> None:
+    CANCELLED_WORK.inc(endpoint=endpoint, reason=token.reason or "unknown")
+    expected = settings.RATE_LIMIT_REQUEST_TOKENS.get(endpoint, 0)
+    saved = max(0, expected - token.tokens_used)
+    if saved:
+        CANCELLED_TOKENS_SAVED.inc(saved, endpoint=endpoint)
+
+
+# ── CrewAI 훅: 다음 LLM/도구 호출 전에 중단 ──
+
+
+def _abort_if_cancelled(context) -> None:
+    token = current_cancel.get()
+    if token is not None and token.cancelled:
+        # HookAborted만 CrewAI가 삼키지 않고 호출자까지 전파한다
+        raise HookAborted(f"요청이 취소되었습니다 ({token.reason})")
+
+
+def register_hooks() -> None:
+    """CrewAI 전역 LLM/도구 호출 훅을 한 번만 등록한다."""
+    global _registered
+    with _register_lock:
+        if _registered:
+            return
+        _registered = True
+    register_before_llm_call_hook(_abort_if_cancelled)
+    register_before_tool_call_hook(_abort_if_cancelled)
+
+
+class CancellationMiddleware:
+    """요청마다 CancelToken을 설정하고 클라이언트 연결 끊김(http.disconnect)을 감지하는 ASGI 미들웨어.
+
+    receive 채널은 이 미들웨어가 단독으로 읽어 앱에 그대로 전달하므로
+    StreamingResponse의 연결 끊김 감지와도 충돌하지 않는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.header = settings.REQUEST_TIMEOUT_HEADER.lower().encode("latin-1")
+        register_hooks()
+
+    def _timeout(self, scope) -> float | None:
+        for key, value in scope.get("headers", []):
+            if key == self.header:
+                try:
+                    return max(0.0, float(value.decode("latin-1")))
+                except ValueError:
+                    return None
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = CancelToken(self._timeout(scope))
+        reset = current_cancel.set(token)
+        messages: asyncio.Queue = asyncio.Queue()
+        state = {"responded": False}
+
+        async def pump():
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    # 응답을 다 보낸 뒤의 disconnect는 정상 종료
+                    if not state["responded"]:
+                        token.cancel("disconnect")
+                    return
+
+        async def send_and_track(message):
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                state["responded"] = True
+
+        pump_task = asyncio.create_task(pump())
+        try:
+            await self.app(scope, messages.get, send_and_track)
+        finally:
+            pump_task.cancel()
+            current_cancel.reset(reset)
@@ -0,0 +1,184 @@
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import settings
+from app.utils.cache import LRUTTLCache
+from app.utils.crew_utils import estimate_tokens, format_conversation_log
+from app.utils.llm_registry import get_llm
+from app.utils.metrics import Counter, Histogram
+from app.utils.rate_limiter import reserve_llm_call
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 세션별 대화 메모리: 오래된 턴의 누적 요약 + 최근 원문 턴
+#   Task description에 넣는 대화 기록을 토큰 예산 안으로 유지해
+#   면접이 길어져도 턴당 입력 토큰이 일정하게 유지되도록 한다.
+#   요약 갱신은 응답 경로 밖(백그라운드 스레드)에서 수행하며,
+#   아직 요약되지 않은 오래된 턴은 한 줄 요약으로 대신한다.
+#   요약은 소유자가 확인된 서버 세션(session_store)에만 저장하며, 요약한 턴들의 해시를
+#   함께 저장해 턴 기록이 달라지면(세션 재시작 등) 버린다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SUMMARY_UPDATES = Counter(
+    "conversation_summary_updates_total",
+    "대화 요약 갱신 수",
+    labels=("result",),
+)
+CONVERSATION_LOG_TOKENS = Histogram(
+    "conversation_log_tokens",
+    "Task에 주입된 대화 기록의 추정 토큰 수",
+    buckets=(50, 100, 200, 400, 800, 1600, 3200),
+)
+
+_SUMMARY_PROMPT = (
+    "당신은 기술 면접 기록을 요약하는 서기입니다.\n"
+    "기존 요약에 새 면접 턴들을 반영하여 갱신된 요약을 작성하세요.\n"
+    "- 질문별로 평가 대상 기술, 후보자가 언급한 핵심 개념/경험, 점수, 부족했던 점을 남깁니다.\n"
+    "- 한 질문당 한 줄, 불릿('- ') 형식, 한국어로 작성합니다.\n"
+    "- 전체 {max_tokens} 토큰 이내로 작성하고 요약 외의 말은 쓰지 않습니다.\n\n"
+    "[기존 요약]\n{summary}\n\n[새 면접 턴]\n{turns}"
+)
+
+# session_id → {"summary": str, "count": 요약에 반영된 턴 수, "digest": 반영된 턴들의 해시}
+_summaries = LRUTTLCache(max_size=settings.SESSION_STORE_SIZE, ttl=settings.SESSION_TTL)
+_inflight: set[str] = set()
+_inflight_lock = threading.Lock()
+_summary_pool: ThreadPoolExecutor | None = None
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """뒤쪽(최근) 줄을 우선 보존하며 토큰 예산에 맞게 자른다."""
+    lines = text.splitlines()
+    kept: list[str] = []
+    used = 0
+    for line in reversed(lines):
+        cost = estimate_tokens(line)
+        if used + cost > max_tokens:
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(reversed(kept))
+
+
+def _brief_line(turn: dict) -> str:
+    """LLM 요약이 준비되기 전 오래된 턴을 대신하는 한 줄 요약."""
+    question = (turn.get("question") or "")[:60]
+    feedback = (turn.get("feedback") or "").split(".")[0][:80]
+    line = f"- Q: {question} [Score: {turn.get('score', 'N/A')}]"
+    return f"{line} {feedback}" if feedback else line
+
+
+def _turns_digest(turns: list[dict]) -> str:
+    payload = json.dumps(turns, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _get_state(session_id: str | None, older: list[dict]) -> tuple[str, int]:
+    if not session_id:
+        return "", 0
+    state = _summaries.get(session_id)
+    if state is None:
+        return "", 0
+    # 요약한 턴들이 지금 기록의 앞부분과 다르면 (재시작·다른 기록) 저장된 요약을 쓰지 않는다
+    count = state["count"]
+    if count > len(older) or state["digest"] != _turns_digest(older[:count]):
+        return "", 0
+    return state["summary"], count
+
+
+def build_conversation_log(session_id: str | None, turns: list[dict]) -> str:
+    """요약 + 최근 원문 턴으로 구성된 대화 기록 (CONVERSATION_TOKEN_BUDGET 이내).
+
+    session_id가 없으면(클라이언트가 턴 기록을 보내는 경로) 저장된 요약 없이 한 줄 요약만 쓴다.
+    """
+    budget = settings.CONVERSATION_TOKEN_BUDGET
+    recent_n = settings.CONVERSATION_RECENT_TURNS
+    recent = turns[-recent_n:] if recent_n else []
+    older = turns[: len(turns) - len(recent)]
+
+    summary, count = _get_state(session_id, older)
+    pending = [_brief_line(t) for t in older[count:]]
+
+    # 최근 턴이 예산을 넘으면 오래된 것부터 한 줄 요약으로 내린다 (최소 1턴은 원문 유지)
+    recent_log = format_conversation_log(recent)
+    while len(recent) > 1 and estimate_tokens(recent_log) > budget // 2:
+        pending.append(_brief_line(recent[0]))
+        recent = recent[1:]
+        recent_log = format_conversation_log(recent)
+
+    summary_text = "\n".join(line for line in (summary, *pending) if line)
+    if summary_text:
+        summary_budget = max(0, budget - estimate_tokens(recent_log))
+        summary_text = _truncate_to_tokens(summary_text, summary_budget)
+
+    log = recent_log
+    if summary_text:
+        log = f"[이전 대화 요약]\n{summary_text}\n---\n{recent_log}"
+    CONVERSATION_LOG_TOKENS.observe(estimate_tokens(log))
+    return log
+
+
+def _get_summary_pool() -> ThreadPoolExecutor:
+    global _summary_pool
+    with _inflight_lock:
+        if _summary_pool is None:
+            _summary_pool = ThreadPoolExecutor(
+                max_workers=settings.CONVERSATION_SUMMARY_WORKERS,
+                thread_name_prefix="summary",
+            )
+        return _summary_pool
+
+
+def _update_summary(session_id: str, user_id: str, turns: list[dict]) -> None:
+    try:
+        recent_n = settings.CONVERSATION_RECENT_TURNS
+        older = turns[: max(0, len(turns) - recent_n)]
+        summary, count = _get_state(session_id, older)
+        new_turns = older[count:]
+        if not new_turns:
+            return
+        max_tokens = settings.CONVERSATION_TOKEN_BUDGET // 2
+        prompt = _SUMMARY_PROMPT.format(
+            max_tokens=max_tokens,
+            summary=summary or "(없음)",
+            turns=format_conversation_log(new_turns),
+        )
+        messages = [{"role": "user", "content": prompt}]
+        # crew 밖의 직접 호출이라 LLM 훅이 없으므로 토큰 한도를 직접 확보한다 (백그라운드 우선순위)
+        with reserve_llm_call(messages, user_id):
+            updated = get_llm("summarizer").call(messages)
+        _summaries.set(session_id, {
+            "summary": _truncate_to_tokens(str(updated).strip(), max_tokens),
+            "count": len(older),
+            "digest": _turns_digest(older),
+        })
+        SUMMARY_UPDATES.inc(result="ok")
+    except Exception as e:
+        SUMMARY_UPDATES.inc(result="error")
+        logger.warning(f"대화 요약 갱신 실패 ({session_id}): {e}")
+    finally:
+        with _inflight_lock:
+            _inflight.discard(session_id)
+
+
+def schedule_summary_update(session_id: str, user_id: str, turns: list[dict]) -> None:
+    """요약에 반영되지 않은 오래된 턴이 쌓였으면 백그라운드에서 요약을 갱신한다.
+
+    소유자가 확인된 서버 세션의 턴 기록에만 호출한다.
+    """
+    older = turns[: max(0, len(turns) - settings.CONVERSATION_RECENT_TURNS)]
+    _, count = _get_state(session_id, older)
+    if len(older) - count < settings.CONVERSATION_SUMMARY_BATCH:
+        return
+
+    pool = _get_summary_pool()
+    with _inflight_lock:
+        if session_id in _inflight:
+            return
+        _inflight.add(session_id)
+    pool.submit(_update_summary, session_id, user_id, list(turns))
@@ -0,0 +1,289 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.llm_events import (
+    LLMCallCompletedEvent,
+    LLMCallFailedEvent,
+    LLMCallStartedEvent,
+)
+from crewai.events.types.task_events import (
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+)
+from crewai.events.types.tool_usage_events import (
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+)
+from crewai.types.usage_metrics import UsageMetrics
+
+from app.utils.cache import LRUTTLCache
+from app.utils.cancellation import check_cancelled, current_cancel
+from app.utils.executor import current_endpoint
+from app.utils.llm_hedging import is_losing_attempt
+from app.utils.metrics import Counter, Histogram
+from app.utils.prompt_template import record_token_usage
+from app.utils.tracing import record_span, span
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Crew 실행 계측: crew kickoff / Task / LLM 호출 / 도구 호출별 시간·토큰·재시도
+#   CrewAI 이벤트 버스 핸들러는 별도 스레드 풀에서 실행되지만
+#   emit 시점의 contextvars가 복사되므로 endpoint/crew 라벨은 컨텍스트로 전달한다.
+#   핸들러 실행 순서는 보장되지 않으므로 소요 시간은 이벤트 timestamp로 계산한다.
+#   hedging에서 결과를 버린 LLM 시도는 집계하지 않는다 (토큰 한도 보정은 rate_limiter가 따로 한다).
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+
+CREW_SECONDS = Histogram(
+    "crew_kickoff_seconds",
+    "crew.kickoff() 실행 시간(초)",
+    labels=("endpoint", "crew"),
+)
+CREW_FAILURES = Counter(
+    "crew_kickoff_failures_total",
+    "예외로 끝난 crew 실행 수",
+    labels=("endpoint", "crew"),
+)
+TASK_SECONDS = Histogram(
+    "crew_task_seconds",
+    "Task 실행 시간(초)",
+    labels=("endpoint", "crew", "task", "status"),
+)
+LLM_CALL_SECONDS = Histogram(
+    "llm_call_seconds",
+    "LLM 호출 한 번의 응답 시간(초)",
+    labels=("endpoint", "crew", "task", "model", "status"),
+)
+LLM_CALL_PROMPT_TOKENS = Histogram(
+    "llm_call_prompt_tokens",
+    "LLM 호출 한 번의 프롬프트 토큰 수",
+    labels=("endpoint", "crew", "task", "model"),
+    buckets=_TOKEN_BUCKETS,
+)
+LLM_CALL_COMPLETION_TOKENS = Histogram(
+    "llm_call_completion_tokens",
+    "LLM 호출 한 번의 completion 토큰 수",
+    labels=("endpoint", "crew", "task", "model"),
+    buckets=_TOKEN_BUCKETS,
+)
+TOOL_CALL_SECONDS = Histogram(
+    "tool_call_seconds",
+    "도구 호출 실행 시간(초)",
+    labels=("endpoint", "crew", "task", "tool", "cached"),
+)
+TOOL_CALL_RETRIES = Counter(
+    "tool_call_retries_total",
+    "도구 호출 재시도 횟수",
+    labels=("endpoint", "crew", "task", "tool"),
+)
+TOOL_CALL_ERRORS = Counter(
+    "tool_call_errors_total",
+    "오류로 끝난 도구 호출 시도 수",
+    labels=("endpoint", "crew", "task", "tool"),
+)
+
+_current_crew: contextvars.ContextVar[str] = contextvars.ContextVar("crew_name", default="")
+
+# 시작/종료 이벤트 짝 맞추기: key → 먼저 도착한 (timestamp, 종료 상태 또는 None)
+_pending = LRUTTLCache(max_size=10_000, ttl=3600)
+_pending_lock = threading.Lock()
+_registered = False
+
+
+def _task_label(task_name: str | None) -> str:
+    # name이 없는 Task는 description이 들어오므로 첫 줄만 짧게 쓴다
+    if not task_name:
+        return ""
+    return task_name.strip().splitlines()[0][:40]
+
+
+def _labels(event) -> dict:
+    return {
+        "endpoint": current_endpoint.get(),
+        "crew": _current_crew.get(),
+        "task": _task_label(getattr(event, "task_name", None)),
+    }
+
+
+def _pair(key: tuple, event, status: str | None = None) -> tuple | None:
+    """시작(status=None)/종료 이벤트를 짝지어 (시작 시각, 종료 시각, 종료 상태)를 반환.
+
+    짝이 아직 도착하지 않았으면 None.
+    """
+    with _pending_lock:
+        other = _pending.pop(key)
+        if other is None:
+            _pending.set(key, (event.timestamp, status))
+            return None
+    other_ts, other_status = other
+    if status is None:
+        start, end, status = event.timestamp, other_ts, other_status
+    else:
+        start, end = other_ts, event.timestamp
+    return start, end, status
+
+
+def _seconds(start, end) -> float:
+    return max(0.0, (end - start).total_seconds())
+
+
+# ── Task ──
+
+
+def _observe_task(event, start, end, status: str) -> None:
+    labels = _labels(event)
+    TASK_SECONDS.observe(_seconds(start, end), status=status, **labels)
+    # Task마다 별도 트랙: async_execution Task가 겹치는지 트레이스에서 보인다
+    record_span(
+        labels["task"] or "task", "task", start, end,
+        lane_key=event.task_id, lane_label=labels["task"], crew=labels["crew"], status=status,
+    )
+
+
+def _on_task_started(source, event: TaskStartedEvent) -> None:
+    paired = _pair(("task", event.task_id), event)
+    if paired is not None:
+        _observe_task(event, *paired)
+
+
+def _on_task_ended(event, status: str) -> None:
+    paired = _pair(("task", event.task_id), event, status)
+    if paired is not None:
+        _observe_task(event, *paired)
+
+
+def _on_task_completed(source, event: TaskCompletedEvent) -> None:
+    _on_task_ended(event, "ok")
+
+
+def _on_task_failed(source, event: TaskFailedEvent) -> None:
+    _on_task_ended(event, "error")
+
+
+# ── LLM 호출 ──
+
+
+def _observe_llm(event, start, end, status: str) -> None:
+    labels = _labels(event)
+    model = event.model or ""
+    LLM_CALL_SECONDS.observe(_seconds(start, end), model=model, status=status, **labels)
+    record_span(
+        f"llm {model}", "llm", start, end,
+        lane_key=event.task_id, lane_label=labels["task"], task=labels["task"], status=status,
+    )
+
+
+def _skip_losing_attempt(event) -> bool:
+    if not is_losing_attempt():
+        return False
+    with _pending_lock:
+        _pending.pop(("llm", event.call_id))
+    return True
+
+
+def _on_llm_started(source, event: LLMCallStartedEvent) -> None:
+    if _skip_losing_attempt(event):
+        return
+    paired = _pair(("llm", event.call_id), event)
+    if paired is not None:
+        _observe_llm(event, *paired)
+
+
+def _on_llm_ended(event, status: str) -> None:
+    paired = _pair(("llm", event.call_id), event, status)
+    if paired is not None:
+        _observe_llm(event, *paired)
+
+
+def _on_llm_completed(source, event: LLMCallCompletedEvent) -> None:
+    if _skip_losing_attempt(event):
+        return
+    _on_llm_ended(event, "ok")
+    if event.usage:
+        usage = UsageMetrics.from_provider_dict(event.usage)
+        labels = {"model": event.model or "", **_labels(event)}
+        LLM_CALL_PROMPT_TOKENS.observe(usage.prompt_tokens, **labels)
+        LLM_CALL_COMPLETION_TOKENS.observe(usage.completion_tokens, **labels)
+        record_token_usage(labels["crew"], usage)
+        cancel = current_cancel.get()
+        if cancel is not None:
+            cancel.add_tokens_used(usage.total_tokens)
+
+
+def _on_llm_failed(source, event: LLMCallFailedEvent) -> None:
+    if _skip_losing_attempt(event):
+        return
+    _on_llm_ended(event, "error")
+
+
+# ── 도구 호출 (RAGSearchTool, web_search_tool 등) ──
+
+
+def _on_tool_finished(source, event: ToolUsageFinishedEvent) -> None:
+    labels = {"tool": event.tool_name, **_labels(event)}
+    cached = str(event.from_cache).lower()
+    TOOL_CALL_SECONDS.observe(_seconds(event.started_at, event.finished_at), cached=cached, **labels)
+    record_span(
+        f"tool {event.tool_name}", "tool", event.started_at, event.finished_at,
+        lane_key=event.task_id, lane_label=labels["task"],
+        task=labels["task"], cached=cached, attempts=event.run_attempts,
+    )
+    if event.run_attempts > 1:
+        TOOL_CALL_RETRIES.inc(event.run_attempts - 1, **labels)
+
+
+def _on_tool_error(source, event: ToolUsageErrorEvent) -> None:
+    TOOL_CALL_ERRORS.inc(tool=event.tool_name, **_labels(event))
+
+
+def register_listeners() -> None:
+    """CrewAI 이벤트 버스에 계측 핸들러를 한 번만 등록한다."""
+    global _registered
+    with _pending_lock:
+        if _registered:
+            return
+        _registered = True
+    handlers = {
+        TaskStartedEvent: _on_task_started,
+        TaskCompletedEvent: _on_task_completed,
+        TaskFailedEvent: _on_task_failed,
+        LLMCallStartedEvent: _on_llm_started,
+        LLMCallCompletedEvent: _on_llm_completed,
+        LLMCallFailedEvent: _on_llm_failed,
+        ToolUsageFinishedEvent: _on_tool_finished,
+        ToolUsageErrorEvent: _on_tool_error,
+    }
+    for event_type, handler in handlers.items():
+        crewai_event_bus.on(event_type)(handler)
+
+
+@contextmanager
+def crew_run(crew_name: str):
+    """블록 안에서 발생한 Task/LLM/도구 이벤트에 crew 라벨을 붙이고 전체 시간을 기록한다.
+
+    스트리밍 kickoff처럼 결과를 순회하는 동안 crew가 실행되는 경우에 직접 사용한다.
+    """
+    register_listeners()
+    token = _current_crew.set(crew_name)
+    endpoint = current_endpoint.get()
+    started_at = time.perf_counter()
+    try:
+        with span(crew_name, "crew", endpoint=endpoint):
+            yield
+    except Exception:
+        CREW_FAILURES.inc(endpoint=endpoint, crew=crew_name)
+        raise
+    finally:
+        CREW_SECONDS.observe(time.perf_counter() - started_at, endpoint=endpoint, crew=crew_name)
+        _current_crew.reset(token)
+
+
+def kickoff_crew(crew_name: str, crew, inputs: dict | None = None):
+    """crew.kickoff()를 계측하며 실행한다."""
+    check_cancelled()
+    with crew_run(crew_name):
+        return crew.kickoff(inputs=inputs)
@@ -0,0 +1,75 @@
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from crewai import Crew
+
+from app.config import settings
+from app.utils.metrics import Counter, Gauge
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 템플릿 Crew 풀
+#   Agent/도구/Task(긴 description의 pydantic 검증 포함)를 요청마다 새로 만들지 않고,
+#   요청별 값은 '{placeholder}'로 남긴 템플릿 Crew를 만들어 두고 재사용한다.
+#   요청별 값은 kickoff(inputs=...)로 보간되며 CrewAI는 매번 원본 description에서
+#   다시 보간하므로 이전 요청의 값이 남지 않는다.
+#   kickoff는 Task 출력 등 Crew 상태를 바꾸므로 한 Crew는 한 요청만 빌려 쓰고(checkout),
+#   비어 있으면 새로 만든다. 예외로 끝난 Crew는 상태를 믿을 수 없으므로 버린다.
+#   사용자별 검색 범위는 도구 필드가 아닌 컨텍스트(rag_search.current_search_user)로 전달하고,
+#   도구 결과 캐시는 사용자 간에 섞이지 않도록 템플릿에서 끈다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+CREW_POOL_BUILDS = Counter(
+    "crew_pool_builds_total",
+    "풀이 비어 새로 만든 템플릿 Crew 수",
+    labels=("template",),
+)
+CREW_POOL_IDLE = Gauge(
+    "crew_pool_idle",
+    "재사용을 기다리는 템플릿 Crew 수",
+    labels=("template",),
+)
+
+_pools: list["CrewPool"] = []
+
+
+class CrewPool:
+    """build()로 만든 템플릿 Crew를 요청 간에 재사용한다."""
+
+    def __init__(self, name: str, build: Callable[[], Crew]):
+        self.name = name
+        self.build = build
+        self._idle: list[Crew] = []
+        self._lock = threading.Lock()
+        _pools.append(self)
+
+    def _new(self) -> Crew:
+        CREW_POOL_BUILDS.inc(template=self.name)
+        return self.build()
+
+    def _release(self, crew: Crew) -> None:
+        with self._lock:
+            if len(self._idle) < settings.CREW_POOL_MAX_IDLE:
+                self._idle.append(crew)
+            CREW_POOL_IDLE.set(len(self._idle), template=self.name)
+
+    def warm(self, count: int) -> None:
+        for _ in range(count - len(self._idle)):
+            self._release(self._new())
+
+    @contextmanager
+    def checkout(self) -> Iterator[Crew]:
+        """Crew 하나를 빌려준다. 블록이 예외 없이 끝나면 풀로 돌려놓는다."""
+        with self._lock:
+            crew = self._idle.pop() if self._idle else None
+            CREW_POOL_IDLE.set(len(self._idle), template=self.name)
+        if crew is None:
+            crew = self._new()
+        yield crew
+        self._release(crew)
+
+
+def warm_crew_pools() -> None:
+    """서버 시작 시 호출: 모든 템플릿을 CREW_POOL_WARM개씩 미리 만들어 둔다."""
+    for pool in _pools:
+        pool.warm(settings.CREW_POOL_WARM)
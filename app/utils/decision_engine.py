@@ -0,0 +1,77 @@
+from app.config import settings
+from app.utils.metrics import Counter
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 면접 진행 결정 엔진 (규칙 기반 fast path)
+#   END / NEXT_QUESTION처럼 진행 상황과 점수만으로 결정되는 턴은
+#   면접관 LLM을 호출하지 않고 시나리오에서 다음 질문을 바로 꺼낸다.
+#   꼬리질문(FOLLOW_UP)이 필요한 경우에만 None을 반환해 LLM에 위임한다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+INTERVIEW_DECISIONS = Counter(
+    "interview_decisions_total",
+    "면접 진행 결정 수 (source=rule|llm)",
+    labels=("source", "decision"),
+)
+
+_END_MESSAGE = (
+    "준비한 질문은 여기까지입니다. 긴 시간 성실하게 답변해주셔서 감사합니다. "
+    "오늘 면접은 이것으로 마치겠습니다."
+)
+_NEXT_MESSAGE = "말씀 잘 들었습니다. 이어서 다른 주제로 넘어가 보겠습니다."
+_NEXT_MESSAGE_LOW_SCORE = "괜찮습니다. 충분히 어려운 주제인데요, 다른 영역으로 넘어가 보겠습니다."
+_LOW_SCORE = 3
+
+
+def _main_question_id(question_id: str) -> str:
+    # 꼬리질문 ID는 'q1-f1' 형식 → 메인 질문 'q1'
+    return question_id.split("-f", 1)[0]
+
+
+def _next_main_question(scenario: dict, question_id: str) -> dict | None:
+    """시나리오 questions에서 현재 메인 질문 다음 순서의 질문을 nextQuestion 형식으로 반환."""
+    questions = scenario.get("questions", [])
+    main_id = _main_question_id(question_id)
+    idx = next((i for i, q in enumerate(questions) if q.get("id") == main_id), None)
+    if idx is None or idx + 1 >= len(questions):
+        return None
+
+    q = questions[idx + 1]
+    return {
+        "id": q.get("id", ""),
+        "text": q.get("text", ""),
+        "skillTarget": q.get("skillTarget", q.get("skill_target", "")),
+        "difficulty": q.get("difficulty", ""),
+        "evaluationCriteria": q.get("evaluationCriteria", q.get("evaluation_criteria", [])),
+        "followUpGuide": None,
+    }
+
+
+def decide_turn(
+    score: int,
+    question_id: str,
+    follow_up_count: int,
+    remaining_count: int,
+    scenario: dict,
+) -> dict | None:
+    """규칙으로 결정 가능한 턴이면 {decision, message, nextQuestion}을, 아니면 None을 반환."""
+    if remaining_count <= 0:
+        INTERVIEW_DECISIONS.inc(source="rule", decision="END")
+        return {"decision": "END", "message": _END_MESSAGE, "nextQuestion": None}
+
+    follow_up_exhausted = follow_up_count >= settings.INTERVIEW_MAX_FOLLOW_UPS
+    answer_sufficient = score >= settings.INTERVIEW_FAST_PATH_MIN_SCORE
+    if not (follow_up_exhausted or answer_sufficient):
+        return None
+
+    next_question = _next_main_question(scenario, question_id)
+    if next_question is None:
+        # 시나리오에서 다음 질문을 찾지 못하면 LLM 면접관에게 맡긴다
+        return None
+
+    INTERVIEW_DECISIONS.inc(source="rule", decision="NEXT_QUESTION")
+    return {
+        "decision": "NEXT_QUESTION",
+        "message": _NEXT_MESSAGE_LOW_SCORE if score <= _LOW_SCORE else _NEXT_MESSAGE,
+        "nextQuestion": next_question,
+    }
@@ -0,0 +1,271 @@
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.utils.cancellation import (
+    CancelToken,
+    RequestCancelledError,
+    cancelled_http_error,
+    current_cancel,
+    record_cancelled,
+)
+from app.utils.metrics import Counter, Gauge, Histogram
+from app.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Crew 실행 풀: 블로킹 호출(crew.kickoff, 임베딩, PDF 파싱)을
+# 이벤트 루프 밖에서 실행하고 엔드포인트별로 동시성/대기열을 제한한다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+QUEUE_DEPTH = Gauge(
+    "crew_executor_queue_depth",
+    "실행 슬롯을 기다리는 요청 수",
+    labels=("endpoint",),
+)
+IN_FLIGHT = Gauge(
+    "crew_executor_in_flight",
+    "실행 풀에서 실행 중인 작업 수",
+    labels=("endpoint",),
+)
+WAIT_SECONDS = Histogram(
+    "crew_executor_wait_seconds",
+    "실행 슬롯 획득까지 대기한 시간(초)",
+    labels=("endpoint",),
+)
+RUN_SECONDS = Histogram(
+    "crew_executor_run_seconds",
+    "실행 풀에서 작업이 실행된 시간(초)",
+    labels=("endpoint",),
+)
+REJECTED = Counter(
+    "crew_executor_rejected_total",
+    "대기열 초과로 503 거절된 요청 수",
+    labels=("endpoint",),
+)
+
+
+_DONE = object()
+
+# 현재 작업을 실행 중인 엔드포인트 (crew 계측 메트릭의 endpoint 라벨)
+current_endpoint: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "crew_executor_endpoint", default=""
+)
+
+
+def _call_in_endpoint(endpoint: str, fn, *args, **kwargs):
+    """워커(스레드/프로세스) 안에서 endpoint 컨텍스트를 설정하고 fn을 실행한다."""
+    current_endpoint.set(endpoint)
+    return fn(*args, **kwargs)
+
+
+class _EndpointGate:
+    """엔드포인트 하나의 동시 실행 한도 + 대기열 상태."""
+
+    def __init__(self, limit: int, queue_size: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.queue_size = queue_size
+        self.waiting = 0
+
+
+class _Slot:
+    """획득한 실행 슬롯. hold_until(future)로 작업이 끝날 때까지 반환을 미룬다."""
+
+    def __init__(self):
+        self.future: asyncio.Future | None = None
+
+    def hold_until(self, future: asyncio.Future) -> None:
+        self.future = future
+
+
+def _cancelled_error(endpoint: str, token: CancelToken) -> HTTPException:
+    record_cancelled(endpoint, token)
+    return cancelled_http_error(token)
+
+
+class CrewExecutor:
+    def __init__(
+        self,
+        mode: str,
+        max_workers: int,
+        limits: dict[str, int],
+        default_limit: int,
+        queue_size: int,
+        retry_after: int,
+    ):
+        self.mode = mode
+        self.max_workers = max_workers
+        self.limits = limits
+        self.default_limit = default_limit
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self._pool: Executor | None = None
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._gates: dict[str, _EndpointGate] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "CrewExecutor":
+        return cls(
+            mode=settings.CREW_EXECUTOR_MODE,
+            max_workers=settings.CREW_EXECUTOR_MAX_WORKERS,
+            limits=settings.CREW_EXECUTOR_LIMITS,
+            default_limit=settings.CREW_EXECUTOR_DEFAULT_LIMIT,
+            queue_size=settings.CREW_EXECUTOR_QUEUE_SIZE,
+            retry_after=settings.CREW_EXECUTOR_RETRY_AFTER,
+        )
+
+    def _get_pool(self, thread_only: bool = False) -> Executor:
+        with self._lock:
+            if self.mode == "process" and not thread_only:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                return self._pool
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="crew"
+                )
+            return self._thread_pool
+
+    def _gate(self, endpoint: str) -> _EndpointGate:
+        gate = self._gates.get(endpoint)
+        if gate is None:
+            limit = self.limits.get(endpoint, self.default_limit)
+            gate = self._gates.setdefault(endpoint, _EndpointGate(limit, self.queue_size))
+        return gate
+
+    async def _acquire(self, gate: _EndpointGate, token: CancelToken | None) -> None:
+        if token is None:
+            await gate.semaphore.acquire()
+            return
+        # 슬롯을 기다리는 동안에도 연결 끊김/deadline을 확인한다
+        while True:
+            token.raise_if_cancelled()
+            try:
+                await asyncio.wait_for(
+                    gate.semaphore.acquire(), timeout=settings.CANCEL_POLL_INTERVAL
+                )
+                return
+            except TimeoutError:
+                continue
+
+    @asynccontextmanager
+    async def _admit(self, endpoint: str):
+        """엔드포인트 실행 슬롯을 얻는다. 대기열이 가득 차면 503으로 거절.
+
+        요청이 취소되면(연결 끊김 499 / deadline 504) 대기를 멈추고, 실행 중인 작업은
+        다음 LLM 호출 전에 중단될 때까지 기다린 뒤 슬롯을 반환한다.
+        블록이 먼저 끝나도 slot.hold_until(future)로 지정한 작업이 끝날 때까지 슬롯을 유지한다.
+        """
+        token = current_cancel.get()
+        if token is not None:
+            token.set_default_timeout(settings.REQUEST_DEADLINES.get(endpoint))
+        gate = self._gate(endpoint)
+        if gate.semaphore.locked() and gate.waiting >= gate.queue_size:
+            REJECTED.inc(endpoint=endpoint)
+            raise HTTPException(
+                status_code=503,
+                detail="요청이 많아 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+        gate.waiting += 1
+        QUEUE_DEPTH.set(gate.waiting, endpoint=endpoint)
+        queued_at = time.perf_counter()
+        try:
+            with span("queue_wait", "executor", endpoint=endpoint):
+                await self._acquire(gate, token)
+        except RequestCancelledError:
+            raise _cancelled_error(endpoint, token)
+        finally:
+            gate.waiting -= 1
+            QUEUE_DEPTH.set(gate.waiting, endpoint=endpoint)
+        WAIT_SECONDS.observe(time.perf_counter() - queued_at, endpoint=endpoint)
+
+        IN_FLIGHT.inc(endpoint=endpoint)
+        started_at = time.perf_counter()
+        slot = _Slot()
+
+        def release(future: asyncio.Future | None = None) -> None:
+            if future is not None and not future.cancelled():
+                future.exception()  # 스트림이 먼저 닫혀 아무도 받지 않는 예외는 여기서 소비
+            RUN_SECONDS.observe(time.perf_counter() - started_at, endpoint=endpoint)
+            IN_FLIGHT.dec(endpoint=endpoint)
+            gate.semaphore.release()
+
+        try:
+            yield slot
+        except Exception as e:
+            if token is not None and token.cancelled and not isinstance(e, HTTPException):
+                raise _cancelled_error(endpoint, token) from e
+            raise
+        finally:
+            if slot.future is not None and not slot.future.done():
+                slot.future.add_done_callback(release)
+            else:
+                release()
+
+    async def run(self, endpoint: str, fn, *args, **kwargs):
+        """fn(*args, **kwargs)를 실행 풀에서 실행한다.
+
+        process 모드에서는 fn과 인자가 pickle 가능해야 하므로
+        모듈 최상위 함수와 pydantic 요청 객체만 넘긴다.
+        """
+        async with self._admit(endpoint):
+            if self.mode == "process":
+                call = partial(_call_in_endpoint, endpoint, fn, *args, **kwargs)
+            else:
+                # 스레드 모드에서는 요청 컨텍스트(contextvars)를 워커 스레드로 전달
+                call = partial(
+                    contextvars.copy_context().run, _call_in_endpoint, endpoint, fn, *args, **kwargs
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_pool(), call)
+
+    async def stream(self, endpoint: str, fn, *args, **kwargs):
+        """fn(emit, *args, **kwargs)를 스레드에서 실행하며 emit(event, data) 호출을 순서대로 내보낸다.
+
+        emit 콜백은 프로세스 경계를 넘을 수 없으므로 process 모드에서도 스레드 풀을 사용한다.
+        """
+        async with self._admit(endpoint) as slot:
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue()
+
+            def emit(event: str, data) -> None:
+                loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+
+            call = partial(
+                contextvars.copy_context().run, _call_in_endpoint, endpoint, fn, emit, *args, **kwargs
+            )
+            future = loop.run_in_executor(self._get_pool(thread_only=True), call)
+            future.add_done_callback(lambda _: queue.put_nowait(_DONE))
+            # 클라이언트가 떠나 제너레이터가 yield에서 닫혀도 워커가 끝날 때까지 슬롯을 유지
+            slot.hold_until(future)
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                yield item
+            # 작업 중 발생한 예외를 호출자에게 전달
+            await future
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for pool in (self._pool, self._thread_pool):
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            self._thread_pool = None
+
+
+crew_executor = CrewExecutor.from_settings()
@@ -0,0 +1,281 @@
+import hashlib
+import re
+from collections import deque
+
+from app.utils.cache import LRUTTLCache
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# JD 기술 키워드 추출기
+#   기술 용어 사전(별칭 → 공식 명칭)을 Aho-Corasick 오토마톤으로 컴파일해
+#   JD를 한 번 훑으며 매칭하고, 섹션 가중치 × 빈도로 순위를 매긴다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# 공식 명칭: 별칭 목록 (공식 명칭 자체도 별칭으로 매칭된다)
+TECH_TERMS: dict[str, list[str]] = {
+    # 언어
+    "Java": ["자바"],
+    "Kotlin": ["코틀린"],
+    "Python": ["파이썬"],
+    "JavaScript": ["JS", "자바스크립트"],
+    "TypeScript": ["TS", "타입스크립트"],
+    "Go": ["golang", "고랭"],
+    "Rust": [],
+    "C++": ["cpp"],
+    "C#": ["csharp"],
+    "Scala": [],
+    "SQL": [],
+    # 백엔드 프레임워크
+    "Spring": ["스프링", "spring framework"],
+    "Spring Boot": ["springboot", "스프링 부트", "스프링부트"],
+    "Spring Security": ["스프링 시큐리티"],
+    "Spring Cloud": [],
+    "Spring Batch": ["스프링 배치"],
+    "Spring WebFlux": ["webflux"],
+    "JPA": ["spring data jpa"],
+    "Hibernate": [],
+    "QueryDSL": [],
+    "MyBatis": ["마이바티스"],
+    "Node.js": ["nodejs", "node"],
+    "NestJS": ["nest.js"],
+    "Express": ["express.js"],
+    "Django": ["장고"],
+    "FastAPI": [],
+    "Flask": [],
+    "gRPC": [],
+    "GraphQL": [],
+    "REST API": ["REST", "restful", "restful api"],
+    # 프론트엔드
+    "React": ["react.js", "리액트"],
+    "Vue.js": ["vue"],
+    "Next.js": ["nextjs"],
+    "Angular": [],
+    # 데이터 저장소
+    "MySQL": [],
+    "PostgreSQL": ["postgres", "포스트그레스"],
+    "Oracle": ["오라클"],
+    "MongoDB": ["mongo", "몽고db"],
+    "Redis": ["레디스"],
+    "Elasticsearch": ["elastic search", "엘라스틱서치", "ES"],
+    "Cassandra": [],
+    "DynamoDB": [],
+    "RDBMS": ["rdb", "관계형 데이터베이스"],
+    "NoSQL": [],
+    # 메시징 / 스트리밍
+    "Kafka": ["apache kafka", "카프카"],
+    "RabbitMQ": ["rabbit mq"],
+    "Spark": ["apache spark", "스파크"],
+    "Airflow": [],
+    # 인프라 / 클라우드
+    "AWS": ["amazon web services", "아마존 웹 서비스"],
+    "GCP": ["google cloud"],
+    "Azure": [],
+    "Docker": ["도커"],
+    "Kubernetes": ["k8s", "쿠버네티스"],
+    "Terraform": [],
+    "Linux": ["리눅스"],
+    "Nginx": [],
+    "CI/CD": ["cicd", "CI", "CD"],
+    "Jenkins": ["젠킨스"],
+    "GitHub Actions": [],
+    "ArgoCD": ["argo cd"],
+    "Git": [],
+    # 관측성
+    "Prometheus": ["프로메테우스"],
+    "Grafana": ["그라파나"],
+    "ELK": [],
+    # 아키텍처 / 개념
+    "MSA": ["microservice", "microservices", "마이크로서비스", "마이크로 서비스"],
+    "DDD": ["domain driven design", "도메인 주도 설계"],
+    "TDD": ["test driven development", "테스트 주도 개발"],
+    "OOP": ["객체지향", "객체 지향"],
+    "Event-Driven Architecture": ["event driven", "이벤트 기반", "이벤트 드리븐"],
+    "CQRS": [],
+    "SAGA": ["saga 패턴"],
+    "분산 트랜잭션": ["distributed transaction"],
+    "트랜잭션": ["transaction"],
+    "캐시": ["cache", "caching", "캐싱"],
+    "동시성": ["concurrency", "동시성 제어"],
+    "멀티스레드": ["multithreading", "멀티 스레드", "멀티쓰레드"],
+    "대용량 트래픽": ["대규모 트래픽", "대용량 트래픽 처리", "high traffic"],
+    "성능 최적화": ["performance tuning", "성능 개선", "튜닝"],
+    "쿼리 튜닝": ["query tuning", "쿼리 최적화"],
+    "인덱스": ["index", "indexing", "인덱싱"],
+    "자료구조": ["data structure", "data structures"],
+    "알고리즘": ["algorithm", "algorithms"],
+    "운영체제": ["operating system", "OS"],
+    "네트워크": ["network", "networking", "tcp/ip", "http"],
+    "보안": ["security"],
+    "OAuth2": ["oauth", "oauth 2.0"],
+    "JWT": [],
+    "WebSocket": ["웹소켓"],
+    "테스트 코드": ["unit test", "단위 테스트", "테스트 코드 작성", "junit"],
+    "코드 리뷰": ["code review"],
+    "LLM": ["대규모 언어 모델"],
+    "RAG": [],
+}
+
+# 섹션 헤더 키워드 → 가중치 (해당 헤더 이후 줄에 적용)
+_SECTION_WEIGHTS = (
+    (re.compile(r"필수|자격\s*요건|자격요건|required|requirements|qualifications", re.I), 2.0),
+    (re.compile(r"우대|선호|preferred|nice\s*to\s*have|plus", re.I), 1.5),
+    (re.compile(r"주요\s*업무|담당\s*업무|업무\s*내용|responsibilities|what\s+you", re.I), 1.2),
+)
+# 짧은 영문 별칭과 대문자 약어는 일반 단어와 혼동되므로 원문 대소문자까지 일치해야 매칭
+_CASE_SENSITIVE_MAX_LEN = 2
+_FALLBACK_TOKEN = re.compile(r"\b[A-Z][A-Za-z0-9+#.]{2,}\b")
+_FALLBACK_STOPWORDS = {"The", "And", "For", "With", "You", "Our", "Who", "What", "We"}
+
+DEFAULT_LIMIT = 12
+
+
+def _is_word_char(ch: str) -> bool:
+    # 영문/숫자만 단어 경계로 본다. 한글 조사('Spring을')는 경계로 취급.
+    return ch.isascii() and (ch.isalnum() or ch == "_")
+
+
+def _is_hangul(ch: str) -> bool:
+    return "\uac00" <= ch <= "\ud7a3"
+
+
+class _AhoCorasick:
+    def __init__(self, patterns: dict[str, str]):
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[list[str]] = [[]]
+        for pattern in patterns:
+            self._add(pattern)
+        self._build()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            node = nxt
+        self.output[node].append(pattern)
+
+    def _build(self) -> None:
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+    def iter_matches(self, text: str):
+        """(시작 위치, 패턴)을 순서대로 생성한다."""
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            for pattern in self.output[node]:
+                yield i - len(pattern) + 1, pattern
+
+
+def _build_alias_table() -> dict[str, str]:
+    table: dict[str, str] = {}
+    for canonical, aliases in TECH_TERMS.items():
+        for alias in (canonical, *aliases):
+            table.setdefault(alias.lower(), canonical)
+    return table
+
+
+_ALIASES = _build_alias_table()
+_CASE_SENSITIVE = {
+    alias.lower(): alias
+    for canonical, aliases in TECH_TERMS.items()
+    for alias in (canonical, *aliases)
+    if alias.isascii() and (len(alias) <= _CASE_SENSITIVE_MAX_LEN or alias.isupper())
+}
+_AUTOMATON = _AhoCorasick(_ALIASES)
+_cache = LRUTTLCache(max_size=512, ttl=24 * 3600)
+
+
+def _line_weights(text: str) -> list[tuple[int, float]]:
+    """각 줄의 시작 오프셋과 섹션 가중치."""
+    weights = []
+    offset = 0
+    current = 1.0
+    for line in text.splitlines(keepends=True):
+        stripped = line.strip()
+        # 짧은 줄은 섹션 헤더로 간주하여 이후 줄의 가중치를 바꾼다
+        if stripped and len(stripped) <= 40:
+            for pattern, weight in _SECTION_WEIGHTS:
+                if pattern.search(stripped):
+                    current = weight
+                    break
+        weights.append((offset, current))
+        offset += len(line)
+    return weights
+
+
+def _rank(jd_text: str) -> list[str]:
+    lowered = jd_text.lower()
+    candidates = []
+    for start, alias in _AUTOMATON.iter_matches(lowered):
+        end = start + len(alias)
+        if start > 0 and _is_word_char(lowered[start - 1]) and _is_word_char(alias[0]):
+            continue
+        # 한글 용어는 앞 글자가 한글이면 다른 단어의 일부 (예: '리뷰' 안의 '뷰')
+        if start > 0 and _is_hangul(lowered[start - 1]) and _is_hangul(alias[0]):
+            continue
+        if end < len(lowered) and _is_word_char(lowered[end]) and _is_word_char(alias[-1]):
+            continue
+        original = _CASE_SENSITIVE.get(alias)
+        if original is not None and jd_text[start:end] != original:
+            continue
+        candidates.append((start, end, alias))
+
+    # 겹치는 매칭은 가장 긴 것만 채택 (예: 'Spring Boot' > 'Spring')
+    candidates.sort(key=lambda c: (c[0], -(c[1] - c[0])))
+    line_weights = _line_weights(jd_text)
+    scores: dict[str, float] = {}
+    first_seen: dict[str, int] = {}
+    counted: set[tuple[str, int]] = set()
+    covered_until = -1
+    line_idx = 0
+    for start, end, alias in candidates:
+        if start < covered_until:
+            continue
+        covered_until = end
+        while line_idx + 1 < len(line_weights) and line_weights[line_idx + 1][0] <= start:
+            line_idx += 1
+        canonical = _ALIASES[alias]
+        # 같은 줄의 반복 표기('Kubernetes(k8s)')는 한 번만 센다
+        if (canonical, line_idx) in counted:
+            continue
+        counted.add((canonical, line_idx))
+        weight = line_weights[line_idx][1] if line_weights else 1.0
+        scores[canonical] = scores.get(canonical, 0.0) + weight
+        first_seen.setdefault(canonical, start)
+
+    if not scores:
+        # 사전에 없는 JD: 대문자로 시작하는 영문 토큰 빈도로 대체
+        for match in _FALLBACK_TOKEN.finditer(jd_text):
+            token = match.group().rstrip(".")
+            if token in _FALLBACK_STOPWORDS:
+                continue
+            scores[token] = scores.get(token, 0.0) + 1.0
+            first_seen.setdefault(token, match.start())
+
+    return sorted(scores, key=lambda k: (-scores[k], first_seen[k]))
+
+
+def extract_keyword_list(jd_text: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+    """JD에서 기술 키워드를 중요도순으로 최대 limit개 추출 (JD 해시 단위로 캐시)."""
+    key = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()
+    ranked = _cache.get(key)
+    if ranked is None:
+        ranked = _rank(jd_text)
+        _cache.set(key, ranked)
+    return ranked[:limit]
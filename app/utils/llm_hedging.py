@@ -0,0 +1,257 @@
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+
+from crewai.llms.providers.openai.completion import OpenAICompletion
+from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+from app.config import settings
+from app.utils.cache import LRUTTLCache
+from app.utils.cancellation import current_cancel
+from app.utils.metrics import Counter, Histogram
+from app.utils.rate_limiter import mark_unreserved
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LLM 호출 deadline + hedging (면접 턴 꼬리 지연 완화)
+#   LLM_HEDGE_ROLES의 역할은 호출마다 deadline(역할 timeout과 요청 deadline 중 이른 쪽)을 두고,
+#   역할별 최근 지연의 백분위(예: p95)까지 응답이 없으면 같은 요청을 한 번 더 보내
+#   먼저 끝난 응답을 쓴다. 추가 요청은 세션당 LLM_HEDGE_SESSION_BUDGET회까지.
+#   먼저 끝난 쪽이 이기고 나머지 호출은 취소할 수 없어 백그라운드에서 끝까지 실행된다
+#   (토큰은 둘 다 한도에서 차감되지만 LLM 토큰 카운터와 호출/토큰 계측에는 이긴 호출만 반영한다).
+#   도구 실행(부작용)·스트리밍·에이전트 토큰 카운터(TokenCalcHandler) 외의 콜백이 있는
+#   호출은 hedging하지 않는다.
+#   효과는 interview_turn_seconds{hedging="on"|"off"}의 p99로 비교한다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+LLM_HEDGES = Counter(
+    "llm_hedges_total",
+    "LLM 호출 hedging 결과 (sent: 추가 요청 전송, hedge_won/primary_won: 먼저 끝난 쪽, budget_exhausted: 예산 소진으로 생략)",
+    labels=("role", "result"),
+)
+LLM_CALL_DEADLINE_EXCEEDED = Counter(
+    "llm_call_deadline_exceeded_total",
+    "호출 deadline 안에 응답이 없어 중단된 LLM 호출 수",
+    labels=("role",),
+)
+INTERVIEW_TURN_SECONDS = Histogram(
+    "interview_turn_seconds",
+    "면접 턴(답변 평가 + 다음 액션 결정) 처리 시간(초)",
+    labels=("hedging",),
+)
+
+# 현재 요청의 면접 세션 (hedge 예산 키, 빈 문자열이면 hedging하지 않음)
+hedge_session: contextvars.ContextVar[str] = contextvars.ContextVar("hedge_session", default="")
+
+
+class _Attempt:
+    """hedging 시도 하나: 버퍼링된 토큰 사용량과 결과를 버린 시도인지 여부."""
+
+    def __init__(self):
+        self.usage: list[dict] = []
+        self.lost = False
+
+
+# 현재 컨텍스트의 hedging 시도 (이긴 시도의 사용량만 LLM 토큰 카운터에 반영)
+_current_attempt: contextvars.ContextVar[_Attempt | None] = contextvars.ContextVar(
+    "hedge_attempt", default=None
+)
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.LLM_HEDGE_WORKERS, thread_name_prefix="llm-hedge"
+)
+_latencies: dict[str, deque[float]] = {}
+_latency_lock = threading.Lock()
+_budgets = LRUTTLCache(max_size=settings.SESSION_STORE_SIZE, ttl=settings.SESSION_TTL)
+_budget_lock = threading.Lock()
+
+
+def bind_hedge_session(session_id: str) -> None:
+    """요청 시작 시 호출: 이후 LLM 호출의 hedge 예산을 이 세션에서 차감한다."""
+    hedge_session.set(session_id or "")
+
+
+def hedge_delay(role: str) -> float:
+    """추가 요청을 보내기 전 대기 시간: 역할의 최근 지연 백분위 (표본이 적으면 기본값)."""
+    with _latency_lock:
+        samples = sorted(_latencies.get(role, ()))
+    if len(samples) < settings.LLM_HEDGE_MIN_SAMPLES:
+        return settings.LLM_HEDGE_DEFAULT_DELAY
+    percentile = settings.LLM_HEDGE_ROLES.get(role, 0.95)
+    index = min(len(samples) - 1, int(len(samples) * percentile))
+    return max(settings.LLM_HEDGE_MIN_DELAY, samples[index])
+
+
+def _record_latency(role: str, seconds: float) -> None:
+    with _latency_lock:
+        window = _latencies.get(role)
+        if window is None:
+            window = _latencies[role] = deque(maxlen=settings.LLM_HEDGE_WINDOW)
+        window.append(seconds)
+
+
+def _take_budget(session_id: str) -> bool:
+    if not session_id:
+        return False
+    with _budget_lock:
+        used = _budgets.get(session_id) or 0
+        if used >= settings.LLM_HEDGE_SESSION_BUDGET:
+            return False
+        _budgets.set(session_id, used + 1)
+        return True
+
+
+def _call_deadline(timeout: float | None) -> float | None:
+    """호출 deadline(monotonic): 역할 timeout과 요청 deadline 중 이른 쪽."""
+    deadlines = []
+    if timeout:
+        deadlines.append(time.monotonic() + timeout)
+    token = current_cancel.get()
+    if token is not None and token.deadline is not None:
+        deadlines.append(token.deadline)
+    return min(deadlines) if deadlines else None
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def is_losing_attempt() -> bool:
+    """현재 컨텍스트가 hedging에서 결과를 버린 시도인지 (계측 이벤트 핸들러가 중복 집계를 건너뛴다)."""
+    attempt = _current_attempt.get()
+    return attempt is not None and attempt.lost
+
+
+def _run_attempt(call, attempt: _Attempt):
+    _current_attempt.set(attempt)
+    return call()
+
+
+def _submit(call, attempts: dict[Future, _Attempt], hedge: bool = False) -> Future:
+    ctx = contextvars.copy_context()
+    if hedge:
+        # 이 호출의 예약분은 원래 요청이 이미 보정하므로 추가 요청은 실제 사용량 전체를 차감한다
+        ctx.run(mark_unreserved)
+    attempt = _Attempt()
+    future = _executor.submit(ctx.run, _run_attempt, call, attempt)
+    attempts[future] = attempt
+    return future
+
+
+def _mark_lost(attempts: dict[Future, _Attempt], keep: Future | None = None) -> None:
+    for future, attempt in attempts.items():
+        if future is not keep:
+            attempt.lost = True
+
+
+def hedged_call(role: str, call, timeout: float | None, track_usage=None):
+    """call()을 deadline 안에 실행하고, 응답이 늦으면 같은 호출을 한 번 더 보내 먼저 끝난 결과를 쓴다.
+
+    track_usage가 주어지면 이긴 시도의 토큰 사용량만 전달한다 (HedgedOpenAICompletion 참고).
+    deadline까지 어느 쪽도 성공하지 못하면 TimeoutError, 둘 다 실패하면 마지막 예외를 발생시킨다.
+    """
+    deadline = _call_deadline(timeout)
+    started_at = time.monotonic()
+    attempts: dict[Future, _Attempt] = {}
+    primary = _submit(call, attempts)
+    pending = {primary}
+    hedge: Future | None = None
+
+    delay = hedge_delay(role)
+    remaining = _remaining(deadline)
+    done, pending = wait(pending, timeout=delay if remaining is None else min(delay, remaining))
+    if not done and (remaining is None or remaining > delay):
+        if _take_budget(hedge_session.get()):
+            hedge = _submit(call, attempts, hedge=True)
+            pending.add(hedge)
+            LLM_HEDGES.inc(role=role, result="sent")
+        else:
+            LLM_HEDGES.inc(role=role, result="budget_exhausted")
+
+    error: BaseException | None = None
+    failed: Future | None = None
+    while True:
+        for future in done:
+            if future.exception() is None:
+                _mark_lost(attempts, keep=future)
+                _record_latency(role, time.monotonic() - started_at)
+                if track_usage is not None:
+                    for usage_data in attempts[future].usage:
+                        track_usage(usage_data)
+                if hedge is not None:
+                    LLM_HEDGES.inc(
+                        role=role, result="hedge_won" if future is hedge else "primary_won"
+                    )
+                return future.result()
+            error = future.exception()
+            failed = future
+        if not pending:
+            _mark_lost(attempts, keep=failed)
+            raise error
+        done, pending = wait(pending, timeout=_remaining(deadline), return_when=FIRST_COMPLETED)
+        if not done:
+            _mark_lost(attempts)
+            LLM_CALL_DEADLINE_EXCEEDED.inc(role=role)
+            raise TimeoutError(f"LLM 호출이 deadline 안에 끝나지 않았습니다 ({role})")
+
+
+def _has_custom_callbacks(callbacks) -> bool:
+    # 에이전트 실행기는 항상 TokenCalcHandler를 넘긴다 (네이티브 제공자는 사용하지 않음)
+    return any(not isinstance(callback, TokenCalcHandler) for callback in callbacks or ())
+
+
+class HedgedOpenAICompletion(OpenAICompletion):
+    """LLM_HEDGE_ROLES 역할용 OpenAI LLM. call()을 deadline + hedging으로 감싼다."""
+
+    hedge_role: str = ""
+
+    def _track_token_usage_internal(self, usage_data: dict) -> None:
+        attempt = _current_attempt.get()
+        if attempt is not None:
+            # hedging 시도 중: 어느 시도가 이길지 정해진 뒤 hedged_call이 반영한다
+            attempt.usage.append(usage_data)
+            return
+        super()._track_token_usage_internal(usage_data)
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None,
+    ):
+        call = partial(
+            super().call,
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+        # 도구 실행은 부작용이 있고 스트리밍/임의 콜백은 두 번 흘러나오므로 그대로 호출한다
+        if available_functions or self.stream or _has_custom_callbacks(callbacks):
+            return call()
+        return hedged_call(
+            self.hedge_role, call, self.timeout, track_usage=super()._track_token_usage_internal
+        )
+
+
+@contextmanager
+def timed_turn():
+    """면접 턴 처리 시간을 hedging 활성 여부별로 기록한다 (전후 p99 비교용)."""
+    started_at = time.monotonic()
+    try:
+        yield
+    finally:
+        INTERVIEW_TURN_SECONDS.observe(
+            time.monotonic() - started_at,
+            hedging="on" if settings.LLM_HEDGE_ENABLED and settings.LLM_HEDGE_ROLES else "off",
+        )
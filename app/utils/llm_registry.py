@@ -0,0 +1,98 @@
+import threading
+
+import httpx
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+from crewai.llms.providers.openai.completion import OpenAICompletion
+from openai import AsyncOpenAI, OpenAI
+
+from app.config import settings
+from app.utils.llm_hedging import HedgedOpenAICompletion
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 프로세스 공용 LLM 레지스트리
+#   에이전트 역할 → (model, temperature, timeout, max_tokens) 라우팅은 LLM_ROUTES에서 읽고,
+#   역할별 LLM 인스턴스를 한 번만 만들어 모든 요청이 공유한다.
+#   OpenAI 클라이언트는 keep-alive 연결 풀(httpx) 하나를 함께 써서
+#   요청마다 클라이언트 생성/TLS 연결 비용을 내지 않는다.
+#   CrewAI는 stop words를 호출 단위 컨텍스트로 적용하므로 인스턴스 공유가 안전하다.
+#   단 Crew(stream=True)는 에이전트 LLM의 stream 플래그를 켜므로 스트리밍용 인스턴스를 따로 둔다.
+#   LLM_HEDGE_ROLES 역할의 비스트리밍 인스턴스는 deadline + hedging 호출을 쓴다 (llm_hedging).
+#   (LLM 인스턴스의 토큰 카운터는 공유 누적값이므로 토큰 메트릭은 호출 이벤트 단위로 기록한다.)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_llms: dict[tuple[str, bool], BaseLLM] = {}
+_lock = threading.Lock()
+_http_client: httpx.Client | None = None
+_async_http_client: httpx.AsyncClient | None = None
+
+
+def llm_route(role: str) -> dict:
+    """역할의 LLM 설정. LLM_ROUTES에 없는 항목은 전역 기본값을 쓴다."""
+    return {
+        "model": settings.LLM_MODEL,
+        "temperature": settings.LLM_TEMPERATURE,
+        "timeout": settings.LLM_TIMEOUT,
+        "max_tokens": None,
+        **settings.LLM_ROUTES.get(role, {}),
+    }
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def _share_http_clients(llm: BaseLLM) -> None:
+    """OpenAI 제공자 LLM의 SDK 클라이언트가 공용 연결 풀을 쓰도록 교체한다."""
+    global _http_client, _async_http_client
+    if not isinstance(llm, OpenAICompletion):
+        return
+    if _http_client is None:
+        _http_client = httpx.Client(limits=_limits())
+        _async_http_client = httpx.AsyncClient(limits=_limits())
+    params = llm._get_client_params()
+    llm._client = OpenAI(**params, http_client=_http_client)
+    llm._async_client = AsyncOpenAI(**params, http_client=_async_http_client)
+
+
+def _build(role: str, stream: bool) -> BaseLLM:
+    route = llm_route(role)
+    kwargs = {
+        key: value
+        for key, value in route.items()
+        if key != "model" and value is not None
+    }
+    llm = LLM(
+        model=route["model"], max_retries=settings.LLM_MAX_RETRIES, stream=stream, **kwargs
+    )
+    if (
+        settings.LLM_HEDGE_ENABLED
+        and role in settings.LLM_HEDGE_ROLES
+        and not stream
+        and isinstance(llm, OpenAICompletion)
+    ):
+        llm = HedgedOpenAICompletion(
+            model=llm.model,
+            provider=llm.provider,
+            hedge_role=role,
+            max_retries=settings.LLM_MAX_RETRIES,
+            **kwargs,
+        )
+    _share_http_clients(llm)
+    return llm
+
+
+def get_llm(role: str, stream: bool = False) -> BaseLLM:
+    """역할별 공용 LLM 인스턴스 (처음 요청 시 생성). stream=True는 스트리밍 Crew 전용."""
+    key = (role, stream)
+    llm = _llms.get(key)
+    if llm is None:
+        with _lock:
+            llm = _llms.get(key)
+            if llm is None:
+                llm = _llms[key] = _build(role, stream)
+    return llm
@@ -0,0 +1,158 @@
+import bisect
+import threading
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 프로세스 내 메트릭 레지스트리 (Prometheus text exposition 호환)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def _key(self, label_values: dict) -> tuple:
+        return tuple(str(label_values.get(label, "")) for label in self.labels)
+
+    def _format_labels(self, key: tuple, extra: dict | None = None) -> str:
+        pairs = list(zip(self.labels, key))
+        if extra:
+            pairs.extend(extra.items())
+        if not pairs:
+            return ""
+        body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+        return "{" + body + "}"
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **label_values) -> None:
+        key = self._key(label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **label_values) -> float:
+        return self._values.get(self._key(label_values), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{self._format_labels(k)} {v}" for k, v in items]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: dict[tuple, float] = {}
+
+    def set(self, value: float, **label_values) -> None:
+        with self._lock:
+            self._values[self._key(label_values)] = value
+
+    def inc(self, amount: float = 1.0, **label_values) -> None:
+        key = self._key(label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **label_values) -> None:
+        self.inc(-amount, **label_values)
+
+    def value(self, **label_values) -> float:
+        return self._values.get(self._key(label_values), 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{self._format_labels(k)} {v}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [bucket counts..., sum, count]
+        self._values: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, **label_values) -> None:
+        key = self._key(label_values)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = row
+            if idx < len(self.buckets):
+                row[idx] += 1
+            row[-2] += value
+            row[-1] += 1
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        lines = []
+        for key, row in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, row):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(key, {'le': bound})} {cumulative}"
+                )
+            lines.append(f"{self.name}_bucket{self._format_labels(key, {'le': '+Inf'})} {row[-1]}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {row[-2]}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {row[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format(0.0.4)으로 직렬화."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
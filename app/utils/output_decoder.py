@@ -0,0 +1,164 @@
+import json
+import re
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.utils.metrics import Counter
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Crew/Task 출력 → Pydantic 스키마 디코더
+#   1) 네이티브 structured output(response_model/output_json)으로 채워진 pydantic/json_dict
+#   2) raw 전체가 JSON이면 그대로 파싱
+#   3) 산문/코드펜스에 감싸인 경우 가장 바깥 JSON 객체를 한 번의 스캔으로 찾고,
+#      응답이 잘린 경우(닫히지 않은 문자열/괄호, 끝의 쉼표·키)는 보정해서 파싱한다.
+#   어떤 경로로 디코딩됐는지 메트릭으로 남겨 프롬프트/모델 설정 개선에 활용한다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+OUTPUT_DECODE = Counter(
+    "crew_output_decode_total",
+    "Crew/Task 출력 디코딩 경로별 횟수",
+    labels=("schema", "path"),
+)
+
+# JSON 구조에 영향을 주는 문자만 건너뛰며 찾는다 (문자열 내용은 C 레벨 정규식이 건너뜀)
+_STRUCTURAL = re.compile(r'[{}\[\]"\\]')
+# 잘린 끝부분: 값 없이 끝난 키 ("key" 또는 "key":) 와 끝의 쉼표
+_DANGLING_KEY = re.compile(r'([{,])\s*"(?:[^"\\]|\\.)*"\s*:?\s*$')
+_TRAILING_COMMA = re.compile(r",\s*$")
+_CLOSERS = {"{": "}", "[": "]"}
+_MAX_CANDIDATES = 4
+
+
+class OutputDecodeError(ValueError):
+    pass
+
+
+class OutputValidationError(OutputDecodeError):
+    """JSON은 찾았지만 스키마 검증에 실패한 경우."""
+
+
+def structured_output(schema: type[BaseModel]) -> dict:
+    """Task(**structured_output(Schema))로 네이티브 JSON-schema 출력을 요청한다.
+
+    도구가 있는 Task는 CrewAI가 자동으로 일반 텍스트 출력으로 되돌리므로
+    그 경우에도 이 디코더의 스캔 경로로 처리된다.
+    """
+    if not settings.LLM_STRUCTURED_OUTPUT:
+        return {}
+    return {"response_model": schema}
+
+
+def _scan(text: str, start: int) -> tuple[int, list[str], bool]:
+    """text[start]의 '{'부터 균형 잡힌 JSON 끝을 찾는다.
+
+    반환: (끝 인덱스, 닫히지 않은 괄호 스택, 문자열 안에서 끝났는지)
+    """
+    stack: list[str] = []
+    in_string = False
+    escaped_at = -1
+    for match in _STRUCTURAL.finditer(text, start):
+        i = match.start()
+        if i == escaped_at:
+            continue
+        ch = text[i]
+        if in_string:
+            if ch == "\\":
+                escaped_at = i + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in _CLOSERS:
+            stack.append(ch)
+        elif ch in "}]" and stack:
+            stack.pop()
+            if not stack:
+                return i + 1, [], False
+    return len(text), stack, in_string
+
+
+def _repair(fragment: str, stack: list[str], in_string: bool) -> str:
+    """잘린 JSON 조각을 닫아 파싱 가능한 형태로 만든다."""
+    if in_string:
+        fragment += '"'
+    fragment = fragment.rstrip()
+    if stack[-1] == "{":
+        fragment = _DANGLING_KEY.sub(r"\1", fragment)
+    fragment = _TRAILING_COMMA.sub("", fragment)
+    if fragment.endswith(":"):
+        fragment += "null"
+    return fragment + "".join(_CLOSERS[c] for c in reversed(stack))
+
+
+def extract_json(text: str) -> tuple[dict | list, str]:
+    """text에서 가장 바깥 JSON 객체를 찾아 (데이터, 경로)를 반환한다.
+
+    경로: "direct"(전체가 JSON) / "scanned"(산문·펜스 안에서 추출) / "repaired"(잘린 응답 보정)
+    """
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        try:
+            return json.loads(stripped), "direct"
+        except json.JSONDecodeError:
+            pass
+
+    start = text.find("{")
+    for _ in range(_MAX_CANDIDATES):
+        if start < 0:
+            break
+        end, stack, in_string = _scan(text, start)
+        try:
+            if not stack:
+                return json.loads(text[start:end]), "scanned"
+            return json.loads(_repair(text[start:end], stack, in_string)), "repaired"
+        except json.JSONDecodeError:
+            # 앞쪽 산문의 '{'였을 수 있으므로 다음 후보부터 다시 찾는다
+            start = text.find("{", start + 1)
+    raise OutputDecodeError(f"JSON 객체를 찾을 수 없습니다: {text[:200]}")
+
+
+def _unwrap(data):
+    # "scenario" 래퍼 unwrap
+    if isinstance(data, dict) and isinstance(data.get("scenario"), dict):
+        return data["scenario"]
+    return data
+
+
+def decode_output(output, schema: type[BaseModel]):
+    """CrewOutput 또는 TaskOutput을 schema 인스턴스로 변환한다."""
+    name = schema.__name__
+    pydantic_output = getattr(output, "pydantic", None)
+    if pydantic_output is not None:
+        OUTPUT_DECODE.inc(schema=name, path="native")
+        if isinstance(pydantic_output, schema):
+            return pydantic_output
+        return _validate(schema, _unwrap(pydantic_output.model_dump()))
+
+    json_dict = getattr(output, "json_dict", None)
+    if json_dict:
+        OUTPUT_DECODE.inc(schema=name, path="json_dict")
+        return _validate(schema, _unwrap(json_dict))
+
+    raw = getattr(output, "raw", None)
+    if raw is None:
+        raw = str(output)
+    try:
+        data, path = extract_json(raw)
+    except OutputDecodeError:
+        OUTPUT_DECODE.inc(schema=name, path="failed")
+        raise
+    OUTPUT_DECODE.inc(schema=name, path=path)
+    return _validate(schema, _unwrap(data))
+
+
+def _validate(schema: type[BaseModel], data):
+    try:
+        return schema.model_validate(data)
+    except Exception as e:
+        OUTPUT_DECODE.inc(schema=schema.__name__, path="invalid")
+        raise OutputValidationError(
+            f"출력을 {schema.__name__}으로 검증할 수 없습니다.\n"
+            f"에러: {e}\n"
+            f"데이터: {json.dumps(data, ensure_ascii=False, default=str)[:300]}"
+        ) from e
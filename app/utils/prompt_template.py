@@ -0,0 +1,58 @@
+from app.utils.metrics import Counter
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Task 프롬프트 템플릿
+#   정적 지시문 + 출력 형식을 앞쪽 고정 블록에, 요청별 입력을 맨 뒤에 배치해
+#   요청 간 긴 공통 prefix를 만든다. (OpenAI 자동 prompt caching은
+#   1024토큰 이상 동일한 prefix에만 적용되므로 순서가 중요하다.)
+#   에이전트 role/goal/backstory는 system 메시지로 먼저 전달되므로 정적으로 유지한다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+PROMPT_TOKENS = Counter(
+    "llm_prompt_tokens_total",
+    "Crew 실행에서 사용한 프롬프트 토큰 수",
+    labels=("crew",),
+)
+CACHED_PROMPT_TOKENS = Counter(
+    "llm_cached_prompt_tokens_total",
+    "프롬프트 토큰 중 제공자 prompt cache에서 처리된 토큰 수",
+    labels=("crew",),
+)
+COMPLETION_TOKENS = Counter(
+    "llm_completion_tokens_total",
+    "Crew 실행에서 생성된 completion 토큰 수",
+    labels=("crew",),
+)
+
+# 모든 Task가 공유하는 expected_output (description 뒤에 붙으므로 짧고 고정된 문장만 둔다)
+EXPECTED_OUTPUT = "위 **출력 형식**을 정확히 따르는 JSON만 출력합니다."
+
+_INPUT_HEADER = "━━ 이번 요청 입력 ━━"
+
+
+class TaskTemplate:
+    """정적 지시문/출력 형식(앞) + 요청별 입력(뒤)으로 Task description을 만든다.
+
+    입력 값에는 kickoff(inputs=...)로 보간되는 '{placeholder}'를 넣어도 된다.
+    """
+
+    def __init__(self, instructions: str, output_format: str):
+        self.prefix = f"{instructions.rstrip()}\n\n**출력 형식:**\n{output_format.strip()}"
+
+    def render(self, inputs: dict[str, object] | None = None) -> dict:
+        """Task(**template.render({...}))로 사용할 description/expected_output."""
+        description = self.prefix
+        if inputs:
+            sections = "\n\n".join(f"**{label}:**\n{value}" for label, value in inputs.items())
+            description = f"{description}\n\n{_INPUT_HEADER}\n\n{sections}"
+        return {"description": description, "expected_output": EXPECTED_OUTPUT}
+
+
+def record_token_usage(crew_name: str, usage) -> None:
+    """LLM 호출 한 번의 UsageMetrics를 crew별 메트릭에 누적한다 (cached_prompt_tokens로 캐시 적중 확인).
+
+    LLM 인스턴스는 요청 간에 공유되어 CrewOutput.token_usage가 누적값이므로 호출 단위로 기록한다.
+    """
+    PROMPT_TOKENS.inc(usage.prompt_tokens or 0, crew=crew_name)
+    CACHED_PROMPT_TOKENS.inc(usage.cached_prompt_tokens or 0, crew=crew_name)
+    COMPLETION_TOKENS.inc(usage.completion_tokens or 0, crew=crew_name)
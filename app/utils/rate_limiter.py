@@ -0,0 +1,305 @@
+import bisect
+import contextvars
+import itertools
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from crewai.events.event_bus import crewai_event_bus
+from crewai.events.types.llm_events import LLMCallCompletedEvent
+from crewai.hooks import (
+    HookAborted,
+    LLMCallHookContext,
+    register_after_llm_call_hook,
+    register_before_llm_call_hook,
+)
+from crewai.types.usage_metrics import UsageMetrics
+from fastapi import HTTPException
+
+from app.config import settings
+from app.utils.cache import LRUTTLCache
+from app.utils.cancellation import RequestCancelledError, current_cancel
+from app.utils.crew_utils import estimate_tokens
+from app.utils.executor import current_endpoint
+from app.utils.metrics import Counter, Gauge, Histogram
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LLM / 임베딩 호출 토큰 한도 (OpenAI TPM 보호)
+#   전역 + 사용자별 토큰 버킷(분당 토큰)으로 모든 LLM 호출(CrewAI 전역 before_llm_call
+#   훅, crew 밖의 직접 호출은 reserve_llm_call)과 임베딩 API 호출을 제한한다. 토큰이 부족하면 우선순위 순서로 대기하며
+#   (면접 답변 평가 > 준비/리포트 > 퀴즈 > 백그라운드 요약), 사용자 한도 때문에
+#   기다리는 호출은 다른 사용자의 호출을 막지 않는다.
+#   요청 시작 시 예상 대기가 RATE_LIMIT_MAX_WAIT를 넘으면 느린 타임아웃 대신
+#   429 + Retry-After(예상 대기 초)로 바로 거절한다.
+#   버킷은 프로세스 단위이므로 process 모드에서는 워커마다 한도가 따로 적용된다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "rate_limit_wait_seconds",
+    "토큰 한도 때문에 호출이 대기한 시간(초)",
+    labels=("limiter", "priority"),
+)
+RATE_LIMIT_QUEUE_DEPTH = Gauge(
+    "rate_limit_queue_depth",
+    "토큰을 기다리는 호출 수",
+    labels=("limiter",),
+)
+RATE_LIMIT_REJECTED = Counter(
+    "rate_limit_rejected_total",
+    "예상 대기 초과로 429 거절된 요청 수",
+    labels=("endpoint",),
+)
+
+# 대기 중 재확인 주기 상한(초): 앞선 대기자가 끝나면 notify로 더 빨리 깨어난다
+_MAX_SLEEP = 1.0
+
+# 현재 요청의 사용자 (사용자별 버킷 키, 빈 문자열이면 전역 한도만 적용)
+current_user: contextvars.ContextVar[str] = contextvars.ContextVar("rate_limit_user", default="")
+# 이번 LLM 호출에 예약한 토큰 수 (완료 이벤트에서 실제 사용량으로 보정)
+_reserved: contextvars.ContextVar[int] = contextvars.ContextVar("rate_limit_reserved", default=0)
+# 훅을 거치지 않고 복제된 추가 호출(hedge)은 실제 사용량 전체를 차감한다
+_unreserved: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "rate_limit_unreserved", default=False
+)
+
+_register_lock = threading.Lock()
+_registered = False
+
+
+class TokenBucket:
+    """분당 토큰 한도를 초당 보충량으로 환산한 버킷. 잠금은 RateLimiter가 잡는다."""
+
+    def __init__(self, tpm: int):
+        self.capacity = float(tpm)
+        self.rate = tpm / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount 토큰이 모일 때까지 남은 시간(초)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+    def take(self, amount: float) -> None:
+        # 실제 사용량 보정으로 음수(다음 보충분에서 갚을 부채)가 될 수 있다
+        self.tokens -= amount
+
+
+class RateLimiter:
+    def __init__(self, name: str, tpm: int, user_tpm: int):
+        self.name = name
+        self.bucket = TokenBucket(tpm)
+        self.user_tpm = user_tpm
+        self._users = LRUTTLCache(max_size=settings.RATE_LIMIT_USER_BUCKETS, ttl=3600)
+        self._cond = threading.Condition()
+        self._waiters: list[tuple[int, int, str, int]] = []  # (우선순위, 순번, 사용자, 토큰) 정렬 유지
+        self._seq = itertools.count()
+
+    def _user_bucket(self, user: str) -> TokenBucket | None:
+        if not user or not self.user_tpm:
+            return None
+        bucket = self._users.get(user)
+        if bucket is None:
+            bucket = TokenBucket(self.user_tpm)
+            self._users.set(user, bucket)
+        return bucket
+
+    def _user_wait(self, user: str, tokens: int, now: float) -> float:
+        bucket = self._user_bucket(user)
+        if bucket is None:
+            return 0.0
+        return bucket.wait_time(min(tokens, bucket.capacity), now)
+
+    def _turn_wait(self, entry: tuple, now: float) -> float | None:
+        """entry가 토큰을 가져가기까지 남은 시간. 앞선 대기자 차례면 None."""
+        _, _, user, tokens = entry
+        for other in self._waiters:
+            if other is entry:
+                return max(
+                    self._user_wait(user, tokens, now),
+                    self.bucket.wait_time(min(tokens, self.bucket.capacity), now),
+                )
+            # 자기 사용자 한도를 기다리는 대기자는 건너뛴다
+            if self._user_wait(other[2], other[3], now) <= 0:
+                return None
+        return None
+
+    def acquire(self, tokens: int, user: str = "", priority: int = 0) -> float:
+        """우선순위 순서로 tokens를 확보할 때까지 기다리고 대기 시간(초)을 반환한다.
+
+        기다리는 중 요청이 취소되면 RequestCancelledError를 발생시킨다.
+        """
+        cancel = current_cancel.get()
+        entry = (priority, next(self._seq), user, tokens)
+        started_at = time.monotonic()
+        with self._cond:
+            bisect.insort(self._waiters, entry)
+            RATE_LIMIT_QUEUE_DEPTH.set(len(self._waiters), limiter=self.name)
+            try:
+                while True:
+                    if cancel is not None:
+                        cancel.raise_if_cancelled()
+                    wait = self._turn_wait(entry, time.monotonic())
+                    if wait is not None and wait <= 0:
+                        break
+                    self._cond.wait(_MAX_SLEEP if wait is None else min(wait, _MAX_SLEEP))
+                self.bucket.take(tokens)
+                user_bucket = self._user_bucket(user)
+                if user_bucket is not None:
+                    user_bucket.take(tokens)
+            finally:
+                self._waiters.remove(entry)
+                RATE_LIMIT_QUEUE_DEPTH.set(len(self._waiters), limiter=self.name)
+                self._cond.notify_all()
+        waited = time.monotonic() - started_at
+        RATE_LIMIT_WAIT_SECONDS.observe(waited, limiter=self.name, priority=str(priority))
+        return waited
+
+    def adjust(self, delta: int, user: str = "") -> None:
+        """예약량과 실제 사용량의 차이(delta = 실제 - 예약)를 버킷에 반영한다."""
+        with self._cond:
+            self.bucket.take(delta)
+            user_bucket = self._user_bucket(user)
+            if user_bucket is not None:
+                user_bucket.take(delta)
+            if delta < 0:
+                self._cond.notify_all()
+
+    def eta(self, tokens: int, user: str = "", priority: int = 0) -> float:
+        """지금 tokens를 요청하면 확보까지 걸릴 예상 시간(초). 같거나 높은 우선순위 대기분 포함."""
+        with self._cond:
+            now = time.monotonic()
+            ahead = sum(t for p, _, _, t in self._waiters if p <= priority)
+            wait = self.bucket.wait_time(ahead + tokens, now)
+            user_bucket = self._user_bucket(user)
+            if user_bucket is not None:
+                queued = sum(t for _, _, u, t in self._waiters if u == user)
+                wait = max(wait, user_bucket.wait_time(queued + tokens, now))
+            return wait
+
+
+llm_limiter = RateLimiter("llm", settings.RATE_LIMIT_LLM_TPM, settings.RATE_LIMIT_LLM_USER_TPM)
+embedding_limiter = RateLimiter(
+    "embedding", settings.RATE_LIMIT_EMBEDDING_TPM, settings.RATE_LIMIT_EMBEDDING_USER_TPM
+)
+
+
+def priority_for(endpoint: str) -> int:
+    """낮을수록 먼저. 엔드포인트 밖의 호출(대화 요약 등)은 기본 우선순위."""
+    return settings.RATE_LIMIT_PRIORITIES.get(endpoint, settings.RATE_LIMIT_DEFAULT_PRIORITY)
+
+
+def _message_text(content) -> str:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(
+            part.get("text", "") if isinstance(part, dict) else str(part) for part in content
+        )
+    return "" if content is None else str(content)
+
+
+# ── LLM 호출 훅 ──
+
+
+def _call_tokens(messages: list) -> int:
+    """LLM 호출 한 번의 예약 토큰: 입력 메시지 추정치 + 응답 예상치."""
+    return settings.RATE_LIMIT_COMPLETION_TOKENS + sum(
+        estimate_tokens(_message_text(m.get("content"))) for m in messages if isinstance(m, dict)
+    )
+
+
+def _before_llm_call(context: LLMCallHookContext) -> None:
+    tokens = _call_tokens(context.messages)
+    try:
+        llm_limiter.acquire(tokens, current_user.get(), priority_for(current_endpoint.get()))
+    except RequestCancelledError as e:
+        # 훅에서 HookAborted 외의 예외는 CrewAI가 무시하므로 변환해서 호출을 중단시킨다
+        raise HookAborted(str(e)) from e
+    _reserved.set(tokens)
+
+
+def _after_llm_call(context: LLMCallHookContext) -> None:
+    # 완료 이벤트 핸들러는 emit 시점의 컨텍스트 복사본을 보므로 여기서 지워도 보정에 영향 없음
+    _reserved.set(0)
+
+
+def _on_llm_completed(source, event: LLMCallCompletedEvent) -> None:
+    reserved = _reserved.get()
+    if not event.usage or not (reserved or _unreserved.get()):
+        return
+    usage = UsageMetrics.from_provider_dict(event.usage)
+    llm_limiter.adjust(usage.total_tokens - reserved, current_user.get())
+
+
+def mark_unreserved() -> None:
+    """현재 컨텍스트의 LLM 호출을 예약 없이 나간 호출로 표시한다 (완료 시 사용량 전체 차감)."""
+    _reserved.set(0)
+    _unreserved.set(True)
+
+
+def register_hooks() -> None:
+    """CrewAI 전역 LLM 훅과 완료 이벤트 핸들러를 한 번만 등록한다."""
+    global _registered
+    with _register_lock:
+        if _registered:
+            return
+        _registered = True
+    register_before_llm_call_hook(_before_llm_call)
+    register_after_llm_call_hook(_after_llm_call)
+    crewai_event_bus.on(LLMCallCompletedEvent)(_on_llm_completed)
+
+
+@contextmanager
+def reserve_llm_call(messages: list[dict], user_id: str = ""):
+    """CrewAI 훅을 거치지 않는 직접 LLM 호출(백그라운드 대화 요약 등)을 감싼다.
+
+    호출 전 기본(백그라운드) 우선순위로 토큰을 확보하고, 블록 안에서 끝난 호출의
+    완료 이벤트가 실제 사용량으로 전역/사용자 버킷을 보정한다.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        yield
+        return
+    register_hooks()
+    tokens = _call_tokens(messages)
+    llm_limiter.acquire(tokens, user_id, settings.RATE_LIMIT_DEFAULT_PRIORITY)
+    user_token = current_user.set(user_id)
+    reserved_token = _reserved.set(tokens)
+    try:
+        yield
+    finally:
+        _reserved.reset(reserved_token)
+        current_user.reset(user_token)
+
+
+def acquire_embedding(texts: list[str]) -> None:
+    """임베딩 API 호출 전에 입력 토큰만큼 임베딩 버킷에서 확보한다."""
+    if not settings.RATE_LIMIT_ENABLED or not texts:
+        return
+    tokens = sum(estimate_tokens(text) for text in texts)
+    embedding_limiter.acquire(tokens, current_user.get(), priority_for(current_endpoint.get()))
+
+
+def admit_request(endpoint: str, user_id: str = "") -> None:
+    """요청 시작 시 호출: 사용자 컨텍스트를 설정하고 예상 대기가 길면 429로 거절한다.
+
+    실행 풀로 넘어가기 전에 호출해야 워커 스레드에 사용자 컨텍스트가 전달된다.
+    """
+    current_user.set(user_id)
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    register_hooks()
+    tokens = settings.RATE_LIMIT_REQUEST_TOKENS.get(endpoint, 0)
+    if not tokens:
+        return
+    eta = llm_limiter.eta(tokens, user_id, priority_for(endpoint))
+    if eta > settings.RATE_LIMIT_MAX_WAIT:
+        RATE_LIMIT_REJECTED.inc(endpoint=endpoint)
+        retry_after = math.ceil(eta)
+        raise HTTPException(
+            status_code=429,
+            detail=f"요청 한도를 초과했습니다. 약 {retry_after}초 후 다시 시도해주세요.",
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,154 @@
+import json
+
+from app.config import settings
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 면접 리포트 사전 집계
+#   /evaluate가 진행될 때마다 턴 평가 결과를 세션 집계에 누적하고,
+#   /report는 전체 로그 대신 집계 digest(최소화 JSON)만 코치에게 전달한다.
+#   집계는 세션과 함께 JSON으로 저장되므로 dict/list만 사용한다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+MAIN_WEIGHT = 0.7
+FOLLOW_UP_WEIGHT = 0.3
+STRONG_SCORE = 7
+WEAK_SCORE = 5
+_DEFAULT_SKILL = "기타"
+
+
+def new_aggregate() -> dict:
+    return {
+        "turns": 0,
+        "main": [0, 0],        # [점수 합, 턴 수]
+        "follow_up": [0, 0],
+        "skills": {},          # skill → [점수 합, 턴 수, 최저, 최고]
+        "hits": {},            # skill → {포인트: 횟수} (점수 STRONG_SCORE 이상 턴)
+        "misses": {},          # skill → {포인트: 횟수} (점수 WEAK_SCORE 이하 턴)
+        "studied_but_missed": {},
+        "not_studied": {},
+    }
+
+
+def _tally(counter: dict, items) -> None:
+    for item in items or []:
+        if item:
+            counter[item] = counter.get(item, 0) + 1
+
+
+def _field(data: dict, snake: str, camel: str, default=None):
+    return data.get(snake, data.get(camel, default))
+
+
+def update_aggregate(aggregate: dict, turn: dict, evaluation: dict) -> None:
+    """턴 하나의 평가 결과(score, hits, misses, note_comparison)를 집계에 누적.
+
+    점수가 없거나 숫자로 바꿀 수 없는 턴(LLM이 "N/A" 등을 낸 경우)은 건너뛴다.
+    """
+    try:
+        score = int(evaluation.get("score"))
+    except (TypeError, ValueError):
+        return
+    skill = _field(turn, "skill_target", "skillTarget") or _DEFAULT_SKILL
+
+    aggregate["turns"] += 1
+    bucket = aggregate["follow_up" if turn.get("type") == "FOLLOW_UP" else "main"]
+    bucket[0] += score
+    bucket[1] += 1
+
+    stats = aggregate["skills"].get(skill)
+    if stats is None:
+        aggregate["skills"][skill] = [score, 1, score, score]
+    else:
+        stats[0] += score
+        stats[1] += 1
+        stats[2] = min(stats[2], score)
+        stats[3] = max(stats[3], score)
+
+    if score >= STRONG_SCORE:
+        _tally(aggregate["hits"].setdefault(skill, {}), evaluation.get("hits"))
+    if score <= WEAK_SCORE:
+        _tally(aggregate["misses"].setdefault(skill, {}), evaluation.get("misses"))
+
+    notes = _field(evaluation, "note_comparison", "noteComparison") or {}
+    _tally(aggregate["studied_but_missed"], _field(notes, "studied_but_missed", "studiedButMissed"))
+    _tally(aggregate["not_studied"], _field(notes, "not_studied", "notStudied"))
+
+
+def aggregate_turns(turns: list[dict]) -> dict:
+    """턴 기록 전체로 집계를 만든다 (세션 없이 전체 로그를 받은 /report용)."""
+    aggregate = new_aggregate()
+    for turn in turns:
+        update_aggregate(aggregate, turn, turn)
+    return aggregate
+
+
+def _top(counter: dict, limit: int) -> list[str]:
+    return sorted(counter, key=lambda k: -counter[k])[:limit]
+
+
+def _avg(total: float, count: int) -> float | None:
+    return round(total / count, 1) if count else None
+
+
+def build_digest(aggregate: dict) -> dict:
+    """코치 Task에 전달할 집계 digest."""
+    limit = settings.REPORT_DIGEST_TOP_ITEMS
+    main_avg = _avg(*aggregate["main"])
+    follow_up_avg = _avg(*aggregate["follow_up"])
+    if main_avg is not None and follow_up_avg is not None:
+        base = main_avg * MAIN_WEIGHT + follow_up_avg * FOLLOW_UP_WEIGHT
+    else:
+        base = main_avg if main_avg is not None else follow_up_avg
+
+    skills = [
+        {"skill": skill, "avg": _avg(total, count), "min": low, "max": high, "n": count}
+        for skill, (total, count, low, high) in aggregate["skills"].items()
+    ]
+    skills.sort(key=lambda s: -s["avg"])
+
+    not_studied = _top(aggregate["not_studied"], limit)
+    return {
+        "score": {
+            "turns": aggregate["turns"],
+            "main_avg": main_avg,
+            "follow_up_avg": follow_up_avg,
+            # 메인 70% + 꼬리질문 30% 가중 평균을 1-100 스케일로 변환한 기초 점수
+            "base_score": round(base * 10) if base is not None else None,
+        },
+        "skills": skills,
+        "strengths": [
+            {"skill": skill, "hits": _top(counter, limit)}
+            for skill, counter in aggregate["hits"].items() if counter
+        ],
+        "weaknesses": [
+            {"skill": skill, "misses": _top(counter, limit)}
+            for skill, counter in aggregate["misses"].items() if counter
+        ],
+        "coverage": {
+            "studied_and_strong": [
+                s["skill"] for s in skills
+                if s["avg"] >= STRONG_SCORE and s["skill"] not in not_studied
+            ],
+            "studied_but_weak": _top(aggregate["studied_but_missed"], limit),
+            "not_studied": not_studied,
+        },
+    }
+
+
+def compact_transcript(turns: list[dict]) -> str:
+    """커뮤니케이션 품질 분석용 transcript: 답변은 REPORT_ANSWER_MAX_CHARS로 자른다."""
+    max_chars = settings.REPORT_ANSWER_MAX_CHARS
+    lines = []
+    for i, turn in enumerate(turns, 1):
+        answer = turn.get("answer", "")
+        if len(answer) > max_chars:
+            answer = answer[:max_chars] + "…"
+        lines.append(
+            f"{i}[{turn.get('type', 'MAIN')}|{turn.get('score', 'N/A')}] "
+            f"Q: {turn.get('question', '')}\nA: {answer}"
+        )
+    return "\n".join(lines)
+
+
+def minify(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
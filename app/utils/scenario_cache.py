@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.tools.vector_store import notes_signature
+from app.utils.cache import LRUTTLCache, SQLiteCache
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# /prepare 시나리오 캐시 (content-addressed)
+#   키: sha256(LLM_MODEL, user_id, notes_signature, resume_text, jd_text, question_count, difficulty)
+#   같은 이력서/JD로 새로고침·재시도한 경우 준비 크루(5개 Task)를 다시 돌리지 않는다.
+#   notes_signature는 DB에 저장된 사용자 노트 청크의 (청크 수, 최대 id)라 재시작·다른 워커에서도
+#   유효하다 (SQLite 2차 저장소는 영속·공유되므로 프로세스 로컬 notes_version은 쓰지 않는다).
+#   노트가 추가·재임베딩·삭제되면 대개 서명이 바뀌어 키가 바뀌므로 별도 무효화가 필요 없다
+#   (청크 수와 최대 id가 그대로인 교체는 SCENARIO_CACHE_TTL까지 이전 시나리오가 쓰일 수 있다).
+#   서명을 조회하지 못하면 키를 만들지 않고 캐시를 건너뛴다.
+#   메모리(LRU+TTL)가 1차, SCENARIO_CACHE_PATH 설정 시 SQLite가 2차 저장소.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SCENARIO_CACHE_HITS = Counter(
+    "scenario_cache_hits_total",
+    "시나리오 캐시 적중 수",
+    labels=("tier",),
+)
+SCENARIO_CACHE_MISSES = Counter(
+    "scenario_cache_misses_total",
+    "시나리오 캐시 미스 수 (준비 크루 실행)",
+)
+
+
+def scenario_cache_key(
+    user_id: str, resume_text: str, jd_text: str, question_count: int, difficulty: str
+) -> str | None:
+    """시나리오 캐시 키. 노트 서명을 조회하지 못하면 None (캐시를 쓰지 않는다)."""
+    try:
+        signature = notes_signature(user_id)
+    except Exception as e:
+        logger.warning(f"노트 서명 조회 실패, 시나리오 캐시를 건너뜀: {e}")
+        return None
+    payload = json.dumps(
+        [
+            settings.LLM_MODEL,
+            user_id,
+            signature,
+            resume_text,
+            jd_text,
+            question_count,
+            difficulty,
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ScenarioCache:
+    """시나리오를 메모리 → 디스크(SQLite, 선택) 순으로 조회/저장한다."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        backend: SQLiteCache | None = None,
+    ):
+        self.memory = LRUTTLCache(max_size=max_size, ttl=ttl)
+        self.backend = backend
+
+    def get(self, key: str, schema: type[BaseModel]) -> BaseModel | None:
+        scenario = self.memory.get(key)
+        if scenario is not None:
+            SCENARIO_CACHE_HITS.inc(tier="memory")
+            return scenario
+        if self.backend is not None:
+            try:
+                blob = self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"시나리오 디스크 캐시 조회 실패: {e}")
+                blob = None
+            if blob is not None:
+                scenario = schema.model_validate_json(blob)
+                self.memory.set(key, scenario)
+                SCENARIO_CACHE_HITS.inc(tier="disk")
+                return scenario
+        SCENARIO_CACHE_MISSES.inc()
+        return None
+
+    def set(self, key: str, scenario: BaseModel) -> None:
+        self.memory.set(key, scenario)
+        if self.backend is not None:
+            try:
+                self.backend.set(key, scenario.model_dump_json(by_alias=True).encode("utf-8"))
+            except Exception as e:
+                logger.warning(f"시나리오 디스크 캐시 저장 실패: {e}")
+
+
+scenario_cache = ScenarioCache(
+    max_size=settings.SCENARIO_CACHE_SIZE,
+    ttl=settings.SCENARIO_CACHE_TTL,
+    backend=(
+        SQLiteCache(
+            settings.SCENARIO_CACHE_PATH,
+            table="interview_scenarios",
+            max_entries=settings.SCENARIO_CACHE_DISK_SIZE,
+            ttl=settings.SCENARIO_CACHE_TTL,
+        )
+        if settings.SCENARIO_CACHE_PATH
+        else None
+    ),
+)
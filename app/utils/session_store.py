@@ -0,0 +1,214 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+
+from app.config import settings
+from app.utils.cache import LRUTTLCache, SQLiteCache
+from app.utils.report_aggregator import new_aggregate, update_aggregate
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 면접 세션 저장소
+#   /prepare가 정규화된 시나리오(질문 id 인덱스)를 저장하고,
+#   /session/evaluate가 턴 기록을 append하며 현재 질문 상태를 갱신한다.
+#   메모리(LRU+TTL)가 1차 저장소이며, SESSION_STORE_PATH 설정 시 SQLite에 write-through.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# snake_case → camelCase (시나리오 질문 필드 정규화)
+_QUESTION_KEYS = {
+    "skill_target": "skillTarget",
+    "evaluation_criteria": "evaluationCriteria",
+    "follow_up_guide": "followUpGuide",
+}
+
+
+class SessionNotFoundError(KeyError):
+    pass
+
+
+class SessionConflictError(RuntimeError):
+    """평가 중에 같은 세션의 다른 답변이 먼저 기록된 경우."""
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+def normalize_question(question: dict, index: int) -> dict:
+    normalized = {_QUESTION_KEYS.get(k, k): v for k, v in question.items()}
+    normalized.setdefault("id", f"q{index}")
+    return normalized
+
+
+def normalize_scenario(scenario: dict) -> dict:
+    """시나리오 질문을 camelCase로 통일하고 id → 질문 인덱스를 만든다."""
+    questions = [
+        normalize_question(q, i) for i, q in enumerate(scenario.get("questions", []), 1)
+    ]
+    normalized = {k: v for k, v in scenario.items() if k != "questions"}
+    normalized["questions"] = {q["id"]: q for q in questions}
+    normalized["totalQuestions"] = scenario.get(
+        "totalQuestions", scenario.get("total_questions", len(questions))
+    )
+    return normalized
+
+
+@dataclass
+class InterviewSession:
+    session_id: str
+    user_id: str
+    scenario: dict
+    current_question_id: str | None = None
+    current_question: dict | None = None
+    follow_up_count: int = 0
+    finished: bool = False
+    turns: list[dict] = field(default_factory=list)
+    aggregate: dict = field(default_factory=new_aggregate)
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def question_ids(self) -> list[str]:
+        return list(self.scenario["questions"])
+
+    def scenario_for_prompt(self) -> dict:
+        """Task/규칙 엔진이 기대하는 형태(questions 리스트)의 시나리오."""
+        return {**self.scenario, "questions": list(self.scenario["questions"].values())}
+
+    def main_question(self, question_id: str) -> dict | None:
+        # 꼬리질문 ID('q1-f1')는 메인 질문('q1')의 평가 기준을 따른다
+        questions = self.scenario["questions"]
+        return questions.get(question_id) or questions.get(question_id.split("-f", 1)[0])
+
+    def remaining_main_questions(self) -> int:
+        """현재 메인 질문 이후 남은 메인 질문 수."""
+        if self.current_question_id is None:
+            return 0
+        ids = self.question_ids
+        main_id = self.current_question_id.split("-f", 1)[0]
+        if main_id not in ids:
+            return 0
+        return len(ids) - ids.index(main_id) - 1
+
+    def record_turn(self, answer: str, evaluation: dict, decision: dict) -> None:
+        """턴 기록을 추가하고 결정에 따라 현재 질문 상태를 전이한다."""
+        question = self.current_question or {}
+        self.turns.append({
+            "questionId": self.current_question_id,
+            "type": "FOLLOW_UP" if self.follow_up_count else "MAIN",
+            "question": question.get("text", ""),
+            "skillTarget": question.get("skillTarget", ""),
+            "answer": answer,
+            "score": evaluation.get("score"),
+            "feedback": evaluation.get("feedback", ""),
+        })
+        update_aggregate(self.aggregate, self.turns[-1], evaluation)
+
+        next_question = decision.get("nextQuestion")
+        if decision["decision"] == "END" or not next_question:
+            self.finished = True
+            self.current_question_id = None
+            self.current_question = None
+            return
+        self.follow_up_count = (
+            self.follow_up_count + 1 if decision["decision"] == "FOLLOW_UP" else 0
+        )
+        self.current_question_id = next_question.get("id")
+        self.current_question = normalize_question(next_question, len(self.turns) + 1)
+
+
+def _encode(session: InterviewSession) -> bytes:
+    return json.dumps(asdict(session), ensure_ascii=False).encode("utf-8")
+
+
+def _decode(blob: bytes) -> InterviewSession:
+    return InterviewSession(**json.loads(blob))
+
+
+class SessionStore:
+    def __init__(self, max_sessions: int, ttl: float, backend: SQLiteCache | None = None):
+        self.memory = LRUTTLCache(max_size=max_sessions, ttl=ttl)
+        self.backend = backend
+        self._lock = threading.Lock()
+
+    def create(self, user_id: str, scenario: dict) -> InterviewSession:
+        """새 세션을 만든다. 세션 ID는 항상 서버에서 생성한다 (기존 세션 덮어쓰기 방지)."""
+        normalized = normalize_scenario(scenario)
+        first_id = next(iter(normalized["questions"]), None)
+        session = InterviewSession(
+            session_id=new_session_id(),
+            user_id=user_id,
+            scenario=normalized,
+            current_question_id=first_id,
+            current_question=normalized["questions"].get(first_id),
+        )
+        self.save(session)
+        return session
+
+    def get(self, session_id: str, user_id: str | None = None) -> InterviewSession:
+        """세션을 조회한다. user_id가 주어지면 다른 사용자의 세션도 없는 것으로 취급한다."""
+        session = self.memory.get(session_id)
+        if session is None and self.backend is not None:
+            try:
+                blob = self.backend.get(session_id)
+            except Exception as e:
+                logger.warning(f"세션 디스크 저장소 조회 실패: {e}")
+                blob = None
+            if blob is not None:
+                session = _decode(blob)
+                self.memory.set(session_id, session)
+        if session is None or (user_id is not None and session.user_id != user_id):
+            raise SessionNotFoundError(session_id)
+        return session
+
+    def save(self, session: InterviewSession) -> None:
+        with self._lock:
+            self._persist(session)
+
+    def record_turn(
+        self,
+        session: InterviewSession,
+        turn_count: int,
+        answer: str,
+        evaluation: dict,
+        decision: dict,
+    ) -> None:
+        """평가 시작 시점의 턴 수(turn_count)가 그대로일 때만 턴을 기록하고 저장한다."""
+        with self._lock:
+            if len(session.turns) != turn_count:
+                raise SessionConflictError(session.session_id)
+            session.record_turn(answer, evaluation, decision)
+            self._persist(session)
+
+    def _persist(self, session: InterviewSession) -> None:
+        self.memory.set(session.session_id, session)
+        if self.backend is not None:
+            try:
+                self.backend.set(session.session_id, _encode(session))
+            except Exception as e:
+                logger.warning(f"세션 디스크 저장 실패: {e}")
+
+    def delete(self, session_id: str) -> None:
+        self.memory.pop(session_id)
+        if self.backend is not None:
+            self.backend.delete(session_id)
+
+
+session_store = SessionStore(
+    max_sessions=settings.SESSION_STORE_SIZE,
+    ttl=settings.SESSION_TTL,
+    backend=(
+        SQLiteCache(
+            settings.SESSION_STORE_PATH,
+            table="interview_sessions",
+            max_entries=settings.SESSION_STORE_DISK_SIZE,
+            ttl=settings.SESSION_TTL,
+        )
+        if settings.SESSION_STORE_PATH
+        else None
+    ),
+)
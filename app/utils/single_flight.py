@@ -0,0 +1,106 @@
+import asyncio
+import contextvars
+import hashlib
+import json
+from typing import Awaitable, Callable, TypeVar
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.utils.cancellation import CancelToken, cancelled_http_error, current_cancel
+from app.utils.metrics import Counter, Gauge
+
+T = TypeVar("T")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 중복 요청 single-flight
+#   같은 요청(본문 정규화 해시)이 처리 중이면 새 crew를 시작하지 않고
+#   진행 중인 작업의 결과를 함께 기다린다 (더블 클릭, 클라이언트 재시도).
+#   작업은 별도 asyncio Task로 실행하므로 처음 요청한 클라이언트가 끊겨도
+#   기다리는 다른 요청에는 영향이 없다.
+#   공유 작업은 요청별 취소 토큰 대신 자체 토큰으로 실행하고, 기다리는 요청이
+#   모두 떠났을 때(연결 끊김/deadline)만 취소한다.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SINGLE_FLIGHT_COALESCED = Counter(
+    "single_flight_coalesced_total",
+    "진행 중인 동일 요청에 합류한 요청 수",
+    labels=("endpoint",),
+)
+SINGLE_FLIGHT_IN_FLIGHT = Gauge(
+    "single_flight_in_flight",
+    "single-flight로 실행 중인 고유 요청 수",
+    labels=("endpoint",),
+)
+
+
+def request_key(*parts) -> str:
+    """요청 본문(pydantic 모델)과 추가 식별자로 정규화된 해시 키를 만든다."""
+    normalized = [
+        part.model_dump(mode="json") if isinstance(part, BaseModel) else part
+        for part in parts
+    ]
+    payload = json.dumps(
+        normalized, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task, cancel: CancelToken):
+        self.task = task
+        self.cancel = cancel
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._inflight: dict[tuple[str, str], _Flight] = {}
+
+    async def run(self, endpoint: str, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """같은 (endpoint, key) 작업이 진행 중이면 그 결과를, 아니면 fn()을 실행한 결과를 반환."""
+        slot = (endpoint, key)
+        mine = current_cancel.get()
+        flight = self._inflight.get(slot)
+        if flight is not None:
+            SINGLE_FLIGHT_COALESCED.inc(endpoint=endpoint)
+        else:
+            # 공유 작업의 deadline은 처음 요청한 클라이언트의 것을 따른다
+            shared = CancelToken()
+            shared.deadline = mine.deadline if mine is not None else None
+            context = contextvars.copy_context()
+            context.run(current_cancel.set, shared)
+            task = asyncio.get_running_loop().create_task(fn(), context=context)
+            flight = self._inflight[slot] = _Flight(task, shared)
+            SINGLE_FLIGHT_IN_FLIGHT.inc(endpoint=endpoint)
+            task.add_done_callback(lambda t: self._release(slot, t))
+
+        flight.waiters += 1
+        try:
+            if mine is None:
+                return await asyncio.shield(flight.task)
+            # 대기하던 요청이 떠나도 공유 작업은 다른 요청을 위해 계속 진행
+            while True:
+                done, _ = await asyncio.wait({flight.task}, timeout=settings.CANCEL_POLL_INTERVAL)
+                if done:
+                    return flight.task.result()
+                if mine.cancelled:
+                    raise cancelled_http_error(mine)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # 기다리는 요청이 모두 떠났으면 공유 작업도 다음 LLM 호출 전에 중단
+                flight.cancel.cancel(mine.reason if mine is not None and mine.reason else "disconnect")
+
+    def _release(self, slot: tuple[str, str], task: asyncio.Task) -> None:
+        flight = self._inflight.get(slot)
+        if flight is not None and flight.task is task:
+            del self._inflight[slot]
+        SINGLE_FLIGHT_IN_FLIGHT.dec(endpoint=slot[0])
+        if not task.cancelled():
+            # 기다리던 요청이 모두 끊긴 경우에도 "exception never retrieved" 경고를 막는다
+            task.exception()
+
+
+single_flight = SingleFlight()
@@ -0,0 +1,186 @@
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from app.config import settings
+from app.utils.cancellation import CancelToken, current_cancel
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 의존성 기반 Task 실행기 (DAG)
+#   선행 노드가 끝난 노드를 동시 실행 한도 안에서 바로 시작하고,
+#   노드별 deadline/재시도(지수 backoff)를 적용한다.
+#   critical=False 노드가 최종 실패하면 fallback 값으로 대체해 나머지를 계속 진행한다.
+#   deadline을 넘긴 시도는 결과를 버리고 재시도한다. 시도마다 하위 CancelToken을 두어
+#   버린 시도는 다음 LLM/도구 호출 전에 멈춘다 (진행 중인 호출은 끝까지 실행되므로
+#   실행 풀은 동시 실행 한도보다 넉넉하게 둔다).
+#   요청이 취소되면 새 노드를 시작하지 않고 RequestCancelledError로 끝낸다
+#   (실행 중인 노드는 다음 LLM 호출 전에 CrewAI 훅에서 멈춘다).
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+DAG_TASK_ATTEMPTS = Counter(
+    "dag_task_attempts_total",
+    "DAG 노드 실행 시도 수",
+    labels=("dag", "task", "result"),
+)
+DAG_TASK_FALLBACKS = Counter(
+    "dag_task_fallbacks_total",
+    "최종 실패해 fallback 값으로 대체된 비필수 노드 수",
+    labels=("dag", "task"),
+)
+
+_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+@dataclass
+class DagNode:
+    name: str
+    run: Callable[[dict[str, Any]], Any]  # 선행 노드 결과 {이름: 결과}를 받는다
+    deps: tuple[str, ...] = ()
+    timeout: float | None = None
+    retries: int = 0
+    critical: bool = True
+    fallback: Any = None
+
+
+@dataclass
+class DagResult:
+    results: dict[str, Any]
+    failures: dict[str, BaseException] = field(default_factory=dict)
+
+
+class DagTaskError(RuntimeError):
+    def __init__(self, task: str, cause: BaseException):
+        super().__init__(f"{task} 실패: {cause}")
+        self.task = task
+
+
+class DagTimeoutError(TimeoutError):
+    pass
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=settings.DAG_MAX_WORKERS, thread_name_prefix="dag")
+        return _pool
+
+
+def _backoff(attempt: int) -> float:
+    return settings.DAG_RETRY_BACKOFF * (2 ** (attempt - 1))
+
+
+def run_dag(dag: str, nodes: list[DagNode], max_concurrency: int) -> DagResult:
+    """nodes를 의존성 순서대로 실행하고 노드별 결과를 반환한다.
+
+    critical 노드가 재시도 후에도 실패하면 DagTaskError를 발생시킨다.
+    """
+    token = current_cancel.get()
+    by_name = {node.name: node for node in nodes}
+    for node in nodes:
+        unknown = [d for d in node.deps if d not in by_name]
+        if unknown:
+            raise ValueError(f"{node.name}: 알 수 없는 선행 노드 {unknown}")
+
+    result = DagResult(results={})
+    waiting = [node.name for node in nodes]    # 아직 시작하지 않은 노드 (선언 순서 유지)
+    attempts: dict[str, int] = {}
+    retry_at: dict[str, float] = {}
+    # future → (노드, deadline, 시도별 취소 토큰)
+    running: dict[Future, tuple[str, float | None, CancelToken]] = {}
+    pool = _get_pool()
+
+    def finish(name: str, error: BaseException | None, value: Any = None) -> None:
+        node = by_name[name]
+        if error is None:
+            result.results[name] = value
+            return
+        if attempts[name] <= node.retries:
+            retry_at[name] = time.monotonic() + _backoff(attempts[name])
+            waiting.append(name)
+            return
+        if node.critical:
+            raise DagTaskError(name, error) from error
+        logger.warning(f"[{dag}] 비필수 노드 {name} 실패, fallback 사용: {error}")
+        DAG_TASK_FALLBACKS.inc(dag=dag, task=name)
+        result.failures[name] = error
+        result.results[name] = node.fallback
+
+    try:
+        while waiting or running:
+            if token is not None:
+                token.raise_if_cancelled()
+            now = time.monotonic()
+
+            # 1) 선행 노드가 모두 끝났고 재시도 대기 중이 아닌 노드를 한도 안에서 시작
+            for name in list(waiting):
+                if len(running) >= max_concurrency:
+                    break
+                node = by_name[name]
+                if retry_at.get(name, 0) > now or any(d not in result.results for d in node.deps):
+                    continue
+                waiting.remove(name)
+                retry_at.pop(name, None)
+                attempts[name] = attempts.get(name, 0) + 1
+                deps = {d: result.results[d] for d in node.deps}
+                # 시도마다 하위 토큰을 두어 deadline을 넘긴 시도만 다음 LLM 호출 전에 멈춘다
+                attempt = token.child() if token is not None else CancelToken()
+                context = contextvars.copy_context()
+                context.run(current_cancel.set, attempt)
+                future = pool.submit(context.run, node.run, deps)
+                deadline = now + node.timeout if node.timeout else None
+                running[future] = (name, deadline, attempt)
+
+            if not running:
+                # 재시도 backoff만 남은 경우: 아직 오지 않은 재시도 시각 중 가장 이른 때까지 잔다
+                backoff = [retry_at[n] for n in waiting if retry_at.get(n, 0) > now]
+                if not backoff:
+                    raise ValueError(f"[{dag}] 순환 의존성으로 실행할 수 없는 노드: {waiting}")
+                delay = min(backoff) - now
+                if token is not None:
+                    delay = min(delay, settings.CANCEL_POLL_INTERVAL)
+                time.sleep(delay)
+                continue
+
+            # 2) 가장 빠른 완료 / deadline / 재시도 시각까지 대기
+            wake_at = [d for _, d, _ in running.values() if d is not None]
+            wake_at += [retry_at[n] for n in waiting if n in retry_at and retry_at[n] > now]
+            timeout = max(0.0, min(wake_at) - now) if wake_at else None
+            if token is not None:
+                poll = settings.CANCEL_POLL_INTERVAL
+                timeout = poll if timeout is None else min(timeout, poll)
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name, _, _ = running.pop(future)
+                error = future.exception()
+                DAG_TASK_ATTEMPTS.inc(
+                    dag=dag, task=name, result="ok" if error is None else "error"
+                )
+                finish(name, error, None if error is not None else future.result())
+
+            # 3) deadline을 넘긴 시도는 버린다 (실행 중인 LLM 호출이 끝나면 다음 호출 전에 멈춤)
+            now = time.monotonic()
+            for future, (name, deadline, attempt) in list(running.items()):
+                if deadline is not None and now >= deadline:
+                    running.pop(future)
+                    future.cancel()
+                    attempt.cancel("timeout")
+                    DAG_TASK_ATTEMPTS.inc(dag=dag, task=name, result="timeout")
+                    finish(name, DagTimeoutError(f"{by_name[name].timeout}초 초과"))
+    finally:
+        # 요청 취소 / critical 노드 실패로 끝나면 남은 시도도 다음 LLM 호출 전에 멈춘다
+        for future, (_, _, attempt) in running.items():
+            future.cancel()
+            attempt.cancel("aborted")
+
+    return result
@@ -0,0 +1,208 @@
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+from app.config import settings
+from app.utils.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 요청 단위 실행 트레이스 (Chrome trace-event JSON → Perfetto / chrome://tracing)
+#   request → crew → task → LLM 호출 / 도구 호출 span을 기록한다.
+#   Task마다 별도 트랙(tid)을 배정해 async_execution Task의 겹침이 보이도록 하고,
+#   LLM/도구 span은 소속 Task 트랙 안에 중첩된다.
+#   샘플링: TRACE_SAMPLE_RATE 확률 또는 요청 헤더(TRACE_HEADER: 1/0)로 강제.
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+TRACES_WRITTEN = Counter(
+    "traces_written_total",
+    "파일로 기록된 실행 트레이스 수",
+    labels=("result",),
+)
+
+_REQUEST_LANE = 0
+_PID = 1
+
+current_trace: contextvars.ContextVar["Trace | None"] = contextvars.ContextVar(
+    "current_trace", default=None
+)
+
+
+def _micros(moment: datetime | float) -> int:
+    timestamp = moment.timestamp() if isinstance(moment, datetime) else moment
+    return int(timestamp * 1_000_000)
+
+
+class Trace:
+    """요청 하나의 span 모음. 여러 스레드(crew 워커, 이벤트 핸들러)에서 동시에 기록된다."""
+
+    def __init__(self, name: str):
+        self.trace_id = uuid.uuid4().hex
+        self.name = name
+        self.started_at = time.time()
+        self._events: list[dict] = []
+        self._lanes: dict[str, int] = {"request": _REQUEST_LANE}
+        self._lock = threading.Lock()
+        self._lane_name(_REQUEST_LANE, "request")
+
+    def _lane_name(self, lane: int, label: str) -> None:
+        self._events.append({
+            "ph": "M", "name": "thread_name", "pid": _PID, "tid": lane,
+            "args": {"name": label},
+        })
+
+    def lane(self, key: str | None, label: str | None = None) -> int:
+        """key(Task id 등)별 트랙 번호. 처음 보는 key면 새 트랙을 만든다."""
+        if key is None:
+            return _REQUEST_LANE
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = len(self._lanes)
+                self._lanes[key] = lane
+                self._lane_name(lane, label or key)
+            return lane
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: datetime | float,
+        end: datetime | float,
+        lane: int = _REQUEST_LANE,
+        **args,
+    ) -> None:
+        begin = _micros(start)
+        event = {
+            "ph": "X", "name": name, "cat": category, "pid": _PID, "tid": lane,
+            "ts": begin, "dur": max(0, _micros(end) - begin),
+        }
+        if args:
+            event["args"] = {k: v for k, v in args.items() if v is not None}
+        with self._lock:
+            self._events.append(event)
+
+    def to_chrome(self) -> dict:
+        with self._lock:
+            events = list(self._events)
+        events.insert(0, {
+            "ph": "M", "name": "process_name", "pid": _PID,
+            "args": {"name": f"{self.name} ({self.trace_id})"},
+        })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, directory: str) -> str:
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        path = os.path.join(directory, f"{stamp}-{self.trace_id}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f, ensure_ascii=False)
+        return path
+
+
+def should_sample(header_value: str | None) -> bool:
+    if not settings.TRACE_DIR:
+        return False
+    if header_value is not None:
+        value = header_value.strip().lower()
+        if value in ("1", "true", "yes"):
+            return True
+        if value in ("0", "false", "no"):
+            return False
+    return random.random() < settings.TRACE_SAMPLE_RATE
+
+
+@contextmanager
+def span(name: str, category: str, lane_key: str | None = None, **args):
+    """현재 트레이스에 블록 실행 구간을 span으로 기록한다 (트레이스가 없으면 아무것도 안 함)."""
+    trace = current_trace.get()
+    if trace is None:
+        yield
+        return
+    lane = trace.lane(lane_key)
+    started_at = time.time()
+    try:
+        yield
+    finally:
+        trace.add_span(name, category, started_at, time.time(), lane=lane, **args)
+
+
+def record_span(
+    name: str,
+    category: str,
+    start: datetime,
+    end: datetime,
+    lane_key: str | None = None,
+    lane_label: str | None = None,
+    **args,
+) -> None:
+    """이벤트 timestamp로 계산된 구간을 현재 트레이스에 기록한다."""
+    trace = current_trace.get()
+    if trace is None:
+        return
+    trace.add_span(name, category, start, end, lane=trace.lane(lane_key, lane_label), **args)
+
+
+def _write_trace(trace: Trace) -> None:
+    try:
+        trace.write(settings.TRACE_DIR)
+        TRACES_WRITTEN.inc(result="ok")
+    except Exception as e:
+        TRACES_WRITTEN.inc(result="error")
+        logger.warning(f"트레이스 기록 실패 ({trace.trace_id}): {e}")
+
+
+class TraceMiddleware:
+    """샘플링된 요청에 Trace를 붙이고 응답 본문 전송이 끝나면 파일로 기록하는 ASGI 미들웨어.
+
+    SSE처럼 본문을 나눠 보내는 응답도 마지막 청크까지 request span에 포함된다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.header = settings.TRACE_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_value = next(
+            (v.decode("latin-1") for k, v in scope.get("headers", []) if k == self.header),
+            None,
+        )
+        if not should_sample(header_value):
+            await self.app(scope, receive, send)
+            return
+
+        trace = Trace(f"{scope['method']} {scope['path']}")
+        token = current_trace.set(trace)
+        started_at = time.time()
+        status = {"code": None}
+
+        async def send_with_trace(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-trace-id", trace.trace_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_trace)
+        finally:
+            current_trace.reset(token)
+            trace.add_span(
+                trace.name, "request", started_at, time.time(), status=status["code"]
+            )
+            await asyncio.to_thread(_write_trace, trace)
@@ -0,0 +1,111 @@
+"""템플릿 Crew 풀 마이크로벤치마크: 요청당 Crew 구성 시간과 메모리 할당 (풀 도입 전/후).
+
+    uv run python -m benchmarks.crew_construction [--iterations 200]
+
+before: 요청마다 Agent/도구/Task를 새로 만든다 (기존 create_*_crew와 같은 구성 비용).
+after:  풀에서 템플릿 Crew를 빌려 kickoff inputs를 보간한다 (kickoff가 요청마다 추가로 하는 작업 포함).
+LLM/DB는 호출하지 않지만 설정 로드를 위해 .env(OPENAI_API_KEY 등)가 필요하다.
+"""
+
+import argparse
+import json
+import statistics
+import time
+import tracemalloc
+
+from app.crews.interview_turn_crew import (
+    DECISION_CREWS,
+    EVALUATION_CREWS,
+    TURN_CREWS,
+    decision_inputs,
+    evaluation_inputs,
+)
+from app.crews.quiz_crew import (
+    EVALUATE_CREWS,
+    GENERATE_CREWS,
+    quiz_evaluate_inputs,
+    quiz_generate_inputs,
+)
+from app.crews.report_crew import REPORT_CREWS
+from app.utils.crew_pool import CrewPool
+
+_QUESTION = {
+    "id": "q2",
+    "text": "Redis를 캐시로 사용할 때 캐시 무효화는 어떻게 처리하셨나요?",
+    "skillTarget": "Redis",
+    "difficulty": "MEDIUM",
+    "evaluationCriteria": ["TTL 설정 기준을 설명하는가", "write-through / write-back 차이를 아는가"],
+}
+_SCENARIO = {
+    "totalQuestions": 5,
+    "questions": [
+        {**_QUESTION, "id": f"q{i}", "followUpGuide": {"probe_direction": "캐시 일관성", "purpose": "깊이 확인"}}
+        for i in range(1, 6)
+    ],
+}
+_ANSWER = "TTL을 10분으로 두고, 데이터 변경 시 해당 키를 삭제하는 cache-aside 패턴을 사용했습니다. " * 4
+_LOG = "\n".join(f"[Q{i}] 질문 {i}\n[A{i}] {_ANSWER}" for i in range(1, 4))
+
+
+def _cases() -> list[tuple[str, CrewPool, dict]]:
+    evaluation = evaluation_inputs(_QUESTION, _ANSWER, _LOG, _QUESTION["evaluationCriteria"])
+    decision = decision_inputs(_QUESTION, 0, 3, _SCENARIO)
+    return [
+        ("interview.turn", TURN_CREWS[False], {**evaluation, **decision}),
+        ("interview.evaluate", EVALUATION_CREWS[False], evaluation),
+        (
+            "interview.decision",
+            DECISION_CREWS[False],
+            decision_inputs(_QUESTION, 0, 3, _SCENARIO, evaluation_result='{"score": 7}'),
+        ),
+        ("quiz.generate", GENERATE_CREWS, quiz_generate_inputs("user-1", ["Redis", "JPA"], "EASY", 5)),
+        ("quiz.evaluate", EVALUATE_CREWS, quiz_evaluate_inputs("문제", "답변", "attempt-1", "note-1")),
+        (
+            "interview.report",
+            REPORT_CREWS,
+            {"transcript": _LOG, "digest": json.dumps(_SCENARIO), "jd_text": json.dumps(_SCENARIO)},
+        ),
+    ]
+
+
+def _before(pool: CrewPool, inputs: dict) -> None:
+    pool.build()
+
+
+def _after(pool: CrewPool, inputs: dict) -> None:
+    with pool.checkout() as crew:
+        crew._interpolate_inputs(inputs)
+
+
+def _measure(fn, pool: CrewPool, inputs: dict, iterations: int) -> tuple[float, float]:
+    """(요청당 중앙값 ms, 요청 하나의 최대 할당 KiB)"""
+    fn(pool, inputs)  # 워밍업: LLM 레지스트리 / 풀 초기화
+    timings = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        fn(pool, inputs)
+        timings.append(time.perf_counter() - started_at)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    fn(pool, inputs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings) * 1000, (peak - base) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'template':<22}{'before ms':>11}{'after ms':>10}{'before KiB':>12}{'after KiB':>11}")
+    for name, pool, inputs in _cases():
+        before_ms, before_kib = _measure(_before, pool, inputs, args.iterations)
+        after_ms, after_kib = _measure(_after, pool, inputs, args.iterations)
+        print(f"{name:<22}{before_ms:>11.2f}{after_ms:>10.3f}{before_kib:>12.1f}{after_kib:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import os
+
+# app.config.Settings의 필수 값 (테스트는 외부 API/DB를 호출하지 않는다)
+for _key in ("OPENAI_API_KEY", "FIRECRAWL_API_KEY", "DATABASE_URL", "PGVECTOR_CONNECTION_URL"):
+    os.environ.setdefault(_key, "test")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
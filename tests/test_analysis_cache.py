@@ -0,0 +1,20 @@
+from app.config import settings
+from app.utils.analysis_cache import AnalysisCache, analysis_cache_key
+
+
+def test_only_decodable_untruncated_output_is_cached():
+    cache = AnalysisCache(max_size=10, ttl=60)
+
+    cache.set("resume:ok", '```json\n{"skills": ["Redis"]}\n```')
+    cache.set("resume:prose", "이력서를 분석한 결과 Redis 경험이 있습니다.")
+    cache.set("resume:truncated", '{"skills": ["Redis", "JP')
+
+    assert cache.get("resume:ok") is not None
+    assert cache.get("resume:prose") is None
+    assert cache.get("resume:truncated") is None
+
+
+def test_key_changes_with_analyst_model(monkeypatch):
+    before = analysis_cache_key("jd", "지시문", "JD 원문")
+    monkeypatch.setattr(settings, "LLM_ROUTES", {"analyst": {"model": "other-model"}})
+    assert analysis_cache_key("jd", "지시문", "JD 원문") != before
@@ -0,0 +1,78 @@
+import asyncio
+
+from crewai.types.streaming import StreamChunk, StreamChunkType, ToolCallChunk
+
+from app.utils.answer_stream import FinalAnswerFilter, stream_answer_tokens
+from app.utils.executor import CrewExecutor
+
+
+class _FakeStreaming:
+    def __init__(self, chunks, result):
+        self._chunks = chunks
+        self.result = result
+
+    def __iter__(self):
+        return iter(self._chunks)
+
+
+def _streaming() -> _FakeStreaming:
+    return _FakeStreaming(
+        [
+            StreamChunk(content="Thought: 다음 질문으로 "),
+            StreamChunk(
+                content="",
+                chunk_type=StreamChunkType.TOOL_CALL,
+                tool_call=ToolCallChunk(tool_name="rag_search"),
+            ),
+            StreamChunk(content='Final Answer: {"decision"'),
+            StreamChunk(content=': "END"}'),
+        ],
+        result="RESULT",
+    )
+
+
+def test_filter_passes_only_text_after_final_answer():
+    answer_filter = FinalAnswerFilter()
+    assert answer_filter.feed("Thought: 생각 중") == ""
+    assert answer_filter.feed(" Final Answer: {") == "{"
+    assert answer_filter.feed('"a": 1}') == '"a": 1}'
+
+
+def test_filter_passes_json_without_marker():
+    assert FinalAnswerFilter().feed('  {"decision"') == '  {"decision"'
+
+
+def test_stream_answer_tokens_skips_tool_chunks_and_returns_result():
+    events = []
+    result = stream_answer_tokens(lambda event, data: events.append((event, data)), _streaming())
+
+    assert result == "RESULT"
+    assert events == [
+        ("token", {"text": '{"decision"'}),
+        ("token", {"text": ': "END"}'}),
+    ]
+
+
+def test_executor_stream_keeps_turn_event_order():
+    executor = CrewExecutor(
+        mode="thread", max_workers=2, limits={}, default_limit=1, queue_size=1, retry_after=1
+    )
+
+    def turn(emit):
+        emit("evaluation", {"score": 5, "feedback": "피드백"})
+        emit("decision", {"decision": stream_answer_tokens(emit, _streaming())})
+
+    async def collect():
+        return [item async for item in executor.stream("test.stream", turn)]
+
+    try:
+        events = asyncio.run(collect())
+    finally:
+        executor.shutdown()
+
+    assert events == [
+        ("evaluation", {"score": 5, "feedback": "피드백"}),
+        ("token", {"text": '{"decision"'}),
+        ("token", {"text": ': "END"}'}),
+        ("decision", {"decision": "RESULT"}),
+    ]
@@ -0,0 +1,63 @@
+from app.config import settings
+from app.utils import conversation_memory, rate_limiter
+from app.utils.conversation_memory import build_conversation_log
+
+
+def _turns(prefix: str, count: int) -> list[dict]:
+    return [
+        {"question": f"{prefix} 질문 {i}", "answer": "답변", "score": 6, "feedback": "보통."}
+        for i in range(count)
+    ]
+
+
+def _store_summary(session_id: str, turns: list[dict], summary: str) -> None:
+    older = turns[: len(turns) - settings.CONVERSATION_RECENT_TURNS]
+    conversation_memory._summaries.set(session_id, {
+        "summary": summary,
+        "count": len(older),
+        "digest": conversation_memory._turns_digest(older),
+    })
+
+
+def test_summary_is_used_for_the_same_turns():
+    turns = _turns("A", 6)
+    _store_summary("session-same", turns, "- 요약된 A 면접")
+
+    assert "- 요약된 A 면접" in build_conversation_log("session-same", turns + _turns("A+", 1))
+
+
+def test_summary_of_different_turns_is_discarded():
+    _store_summary("session-other", _turns("A", 6), "- 요약된 A 면접")
+
+    log = build_conversation_log("session-other", _turns("B", 7))
+    assert "요약된 A 면접" not in log
+    assert "B 질문 0" in log
+
+
+def test_client_turn_history_never_uses_stored_summary():
+    turns = _turns("A", 6)
+    _store_summary("session-legacy", turns, "- 요약된 A 면접")
+
+    assert "요약된 A 면접" not in build_conversation_log(None, turns)
+
+
+def test_background_summary_reserves_llm_tokens_for_the_user(monkeypatch):
+    acquired = []
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(
+        rate_limiter.llm_limiter,
+        "acquire",
+        lambda tokens, user="", priority=0: acquired.append((user, priority)) or 0.0,
+    )
+
+    class _FakeLLM:
+        def call(self, messages):
+            assert rate_limiter.current_user.get() == "user-1"
+            return "- 요약"
+
+    monkeypatch.setattr(conversation_memory, "get_llm", lambda role: _FakeLLM())
+
+    conversation_memory._update_summary("session-summary", "user-1", _turns("A", 8))
+
+    assert acquired == [("user-1", settings.RATE_LIMIT_DEFAULT_PRIORITY)]
+    assert conversation_memory._summaries.get("session-summary")["summary"] == "- 요약"
@@ -0,0 +1,36 @@
+import asyncio
+import threading
+
+from app.utils.executor import CrewExecutor
+
+
+def test_executor_stream_holds_slot_until_worker_finishes_after_disconnect():
+    executor = CrewExecutor(
+        mode="thread", max_workers=2, limits={}, default_limit=1, queue_size=1, retry_after=1
+    )
+    finish = threading.Event()
+
+    def turn(emit):
+        emit("evaluation", {"score": 5})
+        finish.wait(2.0)
+
+    async def disconnect_early():
+        events = executor.stream("test.disconnect", turn)
+        assert await anext(events) == ("evaluation", {"score": 5})
+        await events.aclose()  # 클라이언트 연결 끊김: yield에서 제너레이터가 닫힌다
+        gate = executor._gate("test.disconnect")
+        held = gate.semaphore.locked()
+        finish.set()
+        for _ in range(100):
+            if not gate.semaphore.locked():
+                break
+            await asyncio.sleep(0.01)
+        return held, gate.semaphore.locked()
+
+    try:
+        held, still_held = asyncio.run(disconnect_early())
+    finally:
+        executor.shutdown()
+
+    assert held
+    assert not still_held
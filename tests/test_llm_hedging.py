@@ -0,0 +1,105 @@
+import contextvars
+import itertools
+import threading
+import time
+from types import SimpleNamespace
+
+from crewai import Agent, Crew, Process, Task
+from crewai.llms.providers.openai.completion import OpenAICompletion
+
+from app.config import settings
+from app.utils import crew_instrumentation, llm_hedging
+from app.utils.llm_hedging import (
+    LLM_HEDGES,
+    HedgedOpenAICompletion,
+    bind_hedge_session,
+    hedged_call,
+    is_losing_attempt,
+)
+
+
+def _hedge_count(result: str) -> float:
+    return LLM_HEDGES._values.get(("interviewer", result), 0.0)
+
+
+def test_crew_kickoff_hedges_slow_primary_and_counts_only_winner_tokens(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_HEDGE_DEFAULT_DELAY", 0.05)
+    monkeypatch.setattr(settings, "LLM_HEDGE_SESSION_BUDGET", 5)
+    monkeypatch.setattr(llm_hedging, "_latencies", {})
+
+    attempts = itertools.count()
+    release_primary = threading.Event()
+
+    def fake_call(self, messages, tools=None, callbacks=None, available_functions=None,
+                  from_task=None, from_agent=None, response_model=None):
+        attempt = next(attempts)
+        if attempt == 0:
+            # 느린 primary: hedge가 이긴 뒤에야 끝난다
+            release_primary.wait(5)
+            self._track_token_usage_internal(
+                {"prompt_tokens": 1000, "completion_tokens": 1000, "total_tokens": 2000}
+            )
+            return "Final Answer: 느린 응답"
+        self._track_token_usage_internal(
+            {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        )
+        return "Final Answer: 빠른 응답"
+
+    monkeypatch.setattr(OpenAICompletion, "call", fake_call)
+    llm = HedgedOpenAICompletion(model="gpt-4o", api_key="test", hedge_role="interviewer", timeout=5.0)
+    agent = Agent(role="면접관", goal="다음 질문 결정", backstory="테스트", llm=llm, verbose=False)
+    task = Task(description="다음 질문을 정한다", expected_output="문장", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], process=Process.sequential, verbose=False)
+
+    sent, won = _hedge_count("sent"), _hedge_count("hedge_won")
+    bind_hedge_session("session-1")
+    started_at = time.monotonic()
+    try:
+        result = crew.kickoff()
+    finally:
+        release_primary.set()
+
+    assert time.monotonic() - started_at < 2
+    assert "빠른 응답" in result.raw
+    assert _hedge_count("sent") == sent + 1
+    assert _hedge_count("hedge_won") == won + 1
+    time.sleep(0.1)  # 진 primary가 끝난 뒤에도 카운터에 반영되지 않아야 한다
+    assert llm.get_token_usage_summary().total_tokens == 15
+
+
+def test_losing_attempt_is_skipped_by_llm_instrumentation(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_HEDGE_DEFAULT_DELAY", 0.05)
+    monkeypatch.setattr(settings, "LLM_HEDGE_SESSION_BUDGET", 5)
+    monkeypatch.setattr(llm_hedging, "_latencies", {})
+    monkeypatch.setattr(
+        crew_instrumentation,
+        "record_token_usage",
+        lambda *args: (_ for _ in ()).throw(AssertionError("진 시도의 토큰이 집계됨")),
+    )
+
+    attempts = itertools.count()
+    release_primary = threading.Event()
+    primary_done = threading.Event()
+    seen: dict[str, bool] = {}
+
+    def call():
+        if next(attempts) == 0:
+            release_primary.wait(5)
+            seen["primary"] = is_losing_attempt()
+            # 진 시도의 완료 이벤트 핸들러는 emit 시점 컨텍스트에서 실행된다
+            event = SimpleNamespace(call_id="primary-call", usage={"total_tokens": 2000})
+            contextvars.copy_context().run(crew_instrumentation._on_llm_completed, None, event)
+            primary_done.set()
+            return "느린 응답"
+        seen["hedge"] = is_losing_attempt()
+        return "빠른 응답"
+
+    bind_hedge_session("session-2")
+    try:
+        result = hedged_call("interviewer", call, timeout=5.0)
+    finally:
+        release_primary.set()
+
+    assert result == "빠른 응답"
+    assert primary_done.wait(2)
+    assert seen == {"hedge": False, "primary": True}
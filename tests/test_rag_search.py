@@ -0,0 +1,29 @@
+import pytest
+
+from app.tools import rag_search
+from app.tools.rag_search import (
+    NO_RESULT_MESSAGE,
+    MultiRAGSearchTool,
+    RAGSearchTool,
+    current_search_user,
+)
+
+
+@pytest.fixture
+def no_store(monkeypatch):
+    def fail():
+        raise AssertionError("사용자 없이 벡터 스토어에 접근함")
+
+    monkeypatch.setattr(rag_search, "get_vector_store", fail)
+    monkeypatch.setattr(rag_search, "get_embeddings", fail)
+    token = current_search_user.set("")
+    yield
+    current_search_user.reset(token)
+
+
+def test_search_without_user_returns_no_result(no_store):
+    assert RAGSearchTool()._run("Redis") == NO_RESULT_MESSAGE
+
+
+def test_multi_search_without_user_returns_no_result(no_store):
+    assert MultiRAGSearchTool()._run(["Redis", "JPA"]) == NO_RESULT_MESSAGE
@@ -0,0 +1,44 @@
+import pytest
+
+from app.utils.session_store import (
+    SessionConflictError,
+    SessionNotFoundError,
+    SessionStore,
+)
+
+_SCENARIO = {"questions": [{"id": "q1", "text": "질문"}, {"id": "q2", "text": "다음 질문"}]}
+_EVALUATION = {"score": 7, "feedback": "좋습니다."}
+_DECISION = {"decision": "NEXT_QUESTION", "nextQuestion": {"id": "q2", "text": "다음 질문"}}
+
+
+@pytest.fixture
+def store() -> SessionStore:
+    return SessionStore(max_sessions=10, ttl=60)
+
+
+def test_sessions_get_server_generated_ids(store):
+    first = store.create(user_id="user-1", scenario=_SCENARIO)
+    second = store.create(user_id="user-1", scenario=_SCENARIO)
+    assert first.session_id != second.session_id
+
+
+def test_session_lookup_rejects_other_users(store):
+    session = store.create(user_id="user-1", scenario=_SCENARIO)
+
+    assert store.get(session.session_id, user_id="user-1") is session
+    with pytest.raises(SessionNotFoundError):
+        store.get(session.session_id, user_id="user-2")
+    with pytest.raises(SessionNotFoundError):
+        store.get("unknown", user_id="user-1")
+
+
+def test_record_turn_rejects_answer_recorded_during_evaluation(store):
+    session = store.create(user_id="user-1", scenario=_SCENARIO)
+    turn_count = len(session.turns)
+
+    store.record_turn(session, turn_count, "먼저 온 답변", _EVALUATION, _DECISION)
+    with pytest.raises(SessionConflictError):
+        store.record_turn(session, turn_count, "늦게 온 답변", _EVALUATION, _DECISION)
+
+    assert [turn["answer"] for turn in session.turns] == ["먼저 온 답변"]
+    assert session.current_question_id == "q2"
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from app.config import settings
+from app.utils import task_dag
+from app.utils.cancellation import CancelToken, RequestCancelledError, current_cancel
+from app.utils.task_dag import DagNode, DagTaskError, run_dag
+
+
+def test_backoff_sleeps_until_retry_instead_of_spinning(monkeypatch):
+    monkeypatch.setattr(settings, "DAG_RETRY_BACKOFF", 0.2)
+    sleeps: list[float] = []
+    real_sleep = task_dag.time.sleep
+
+    def counting_sleep(seconds):
+        sleeps.append(seconds)
+        real_sleep(seconds)
+
+    monkeypatch.setattr(task_dag.time, "sleep", counting_sleep)
+    calls = {"flaky": 0}
+
+    def flaky(_deps):
+        calls["flaky"] += 1
+        if calls["flaky"] == 1:
+            raise RuntimeError("일시 오류")
+        return "ok"
+
+    nodes = [
+        DagNode("flaky", flaky, retries=1),
+        # 재시도 대기 중인 노드에 의존해 retry_at이 없는 대기 노드
+        DagNode("after", lambda deps: deps["flaky"] + "!", deps=("flaky",)),
+    ]
+    result = run_dag("test", nodes, max_concurrency=2)
+
+    assert result.results == {"flaky": "ok", "after": "ok!"}
+    assert calls["flaky"] == 2
+    assert len(sleeps) <= 2
+    assert all(seconds > 0 for seconds in sleeps)
+
+
+def _wait_for_cancel(seen: dict, key: str, timeout: float = 2.0) -> None:
+    """LLM 호출 전 훅처럼 현재 시도의 취소 토큰을 확인하며 기다린다."""
+    attempt = current_cancel.get()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if attempt.cancelled:
+            seen[key] = attempt.reason
+            return
+        time.sleep(0.01)
+
+
+def test_timed_out_attempt_is_cancelled_before_retry():
+    seen: dict[str, str] = {}
+    calls = {"slow": 0}
+
+    def slow(_deps):
+        calls["slow"] += 1
+        if calls["slow"] == 1:
+            _wait_for_cancel(seen, "first")
+            return "late"
+        return "ok"
+
+    result = run_dag("test", [DagNode("slow", slow, timeout=0.1, retries=1)], max_concurrency=1)
+
+    assert result.results == {"slow": "ok"}
+    assert seen == {"first": "timeout"}
+
+
+def test_critical_failure_cancels_running_siblings():
+    seen: dict[str, str] = {}
+    done = threading.Event()
+
+    def sibling(_deps):
+        _wait_for_cancel(seen, "sibling")
+        done.set()
+
+    def failing(_deps):
+        time.sleep(0.05)
+        raise RuntimeError("실패")
+
+    nodes = [DagNode("sibling", sibling), DagNode("failing", failing)]
+    with pytest.raises(DagTaskError):
+        run_dag("test", nodes, max_concurrency=2)
+
+    assert done.wait(2.0)
+    assert seen == {"sibling": "aborted"}
+
+
+def test_request_cancel_reaches_running_attempts():
+    seen: dict[str, str] = {}
+    request = CancelToken()
+
+    def node(_deps):
+        request.cancel("disconnect")
+        _wait_for_cancel(seen, "node")
+        time.sleep(settings.CANCEL_POLL_INTERVAL * 2)  # 중단 전에 run_dag가 취소를 확인하도록
+
+    reset = current_cancel.set(request)
+    try:
+        with pytest.raises(RequestCancelledError):
+            run_dag("test", [DagNode("node", node)], max_concurrency=1)
+    finally:
+        current_cancel.reset(reset)
+
+    assert seen == {"node": "disconnect"}